@@ -0,0 +1,688 @@
+#!/usr/bin/env python3
+"""
+Vectorized Batch Scoring for Batter-vs-Pitcher Exploit Scores
+Two-stage pipeline for analyze_enhanced_batter_exploit_potential's exploit score:
+stage one (the scalar analysis) records a feature row for every candidate matchup
+and persists the slate's feature matrix; stage two scores that matrix with a
+weight/threshold model (DEFAULT_MODEL, optionally overridden by a JSON config) and
+applies the selection threshold cascade. Each if/elif tier cascade of the scalar
+path is a model rule cascade evaluated with np.select, so changing weights
+re-scores a cached matrix without re-running extraction or any I/O.
+
+Usage:
+    python3 batch_scoring.py weakspot_feature_matrix_2025-07-15.json --model my_model.json
+    python3 batch_scoring.py --write-model my_model.json   # start from the defaults
+    python3 batch_scoring.py weakspot_feature_matrix_2025-07-*.json \
+        --base-thresholds 0:3:0.5 --min-confidences 0.05,0.08,0.1 --min-combined 0.1,10,20
+"""
+import copy
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np  # Required for batch scoring (the scalar path works without it)
+except ImportError:
+    np = None
+
+# Matchup feature columns and their values when a data source is missing
+FEATURE_DEFAULTS = {
+    # Batter quality (custom batter CSV)
+    'has_custom': 0.0,
+    'barrel_percent': 0.0,
+    'bb_percent': 0.0,
+    'k_percent': 0.0,
+    'sprint_speed': 0.0,
+    'xba_diff': 0.0,
+    'xslg_diff': 0.0,
+    'sweet_spot_percent': 0.0,
+    'whiff_percent': 0.0,
+    'z_swing_percent': 0.0,
+    'oz_swing_percent': 0.0,
+    # Pitcher vulnerability
+    'has_pitcher_data': 0.0,
+    'pitcher_era': 4.50,
+    'pitcher_whip': 1.30,
+    'pitcher_hr_rate': 1.0,
+    'barrel_vulnerability': 0.0,     # 2 = extreme, 1 = high, 0 = other
+    'pitcher_deteriorating': 0.0,
+    'first_pitch_window': 0.0,
+    'pitcher_tbd': 0.0,
+    # Phase 1 matchup analyses
+    'handedness_score': 0.0,
+    'swing_score': 0.0,
+    'pitcher_regression_score': 0.0,
+    'arsenal_score': 0.0,
+    'platoon_advantage': 0.0,
+    # Contact quality (hitter exit velocity CSV)
+    'has_ev': 0.0,
+    'ev_barrel_rate': 0.0,
+    'ev_max_velo': 0.0,
+    # Trends and recent form
+    'trend': 0.0,                    # 1 = hot, -1 = cold
+    'has_form': 0.0,
+    'form_hot_streak': 0.0,
+    'form_last_7_avg': 0.0,
+    'form_last_7_hr': 0.0,
+    'form_trend': 0.0,               # 1 = improving, -1 = declining
+    'form_cold_streak': 0.0,
+    # Lineup slot
+    'has_lineup': 0.0,
+    'rbi_factor': 1.0,
+    'run_factor': 1.0,
+    'protection': 0.5,
+    'heart_of_order': 0.0,
+    # Venue and conditions
+    'park_hr_factor': 1.0,
+    'weather_factor': 1.0,
+    'home_field_adjustment': 0.0,    # -away penalty / +away bonus (percentage points)
+}
+
+FEATURES = list(FEATURE_DEFAULTS)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURES)}
+
+# Inputs of the selection threshold cascade (everything except the score itself)
+SELECTION_DEFAULTS = {
+    'confidence': 0.0,
+    'has_exploit_factors': 0.0,
+    'has_situational_advantages': 0.0,
+    'has_regression_opportunity': 0.0,
+    'has_contact_quality_edge': 0.0,
+    'pitcher_vulnerability_score': 50.0,
+    'has_data_quality': 0.0,
+    'classified': 0.0,
+}
+
+SELECTION_FEATURES = list(SELECTION_DEFAULTS)
+SELECTION_INDEX = {name: i for i, name in enumerate(SELECTION_FEATURES)}
+
+MATRIX_VERSION = 1
+
+
+def _rule(value, then=None, any_of=None, **when):
+    """Model rule: `value` (plus the `then` cascade) where every `when` and any `any_of` condition holds"""
+    rule = {'value': value, 'when': when}
+    if any_of:
+        rule['any'] = any_of
+    if then:
+        rule['then'] = then
+    return rule
+
+
+def _cascade(*rules, default=0.0):
+    """First matching rule wins (the scalar path's if/elif chain), else `default`"""
+    return {'rules': list(rules), 'default': default}
+
+
+# Weight/threshold model. The defaults are the scalar path's constants, so scoring a
+# slate with DEFAULT_MODEL reproduces analyze_enhanced_batter_exploit_potential.
+# Conditions are {feature column: [operator, threshold]}.
+DEFAULT_MODEL = {
+    'baseline_score': 65.0,
+    'batter_quality': {
+        'barrel': _cascade(_rule(1.25, barrel_percent=('>=', 15)), _rule(1.15, barrel_percent=('>=', 12)),
+                           _rule(1.05, barrel_percent=('>=', 9)), _rule(1.0, barrel_percent=('>=', 6)),
+                           _rule(0.95, barrel_percent=('>=', 3)), default=0.85),
+        'discipline': _cascade(_rule(1.15, bb_percent=('>', 12), k_percent=('<', 18)),
+                               _rule(1.08, bb_percent=('>', 9), k_percent=('<', 22)),
+                               _rule(1.0, bb_percent=('>', 6), k_percent=('<', 25)),
+                               _rule(0.90, k_percent=('>', 30)), default=0.95),
+        'speed': _cascade(_rule(1.1, sprint_speed=('>', 29)), _rule(1.05, sprint_speed=('>', 27)),
+                          _rule(1.0, sprint_speed=('>', 25)), _rule(0.97, sprint_speed=('>', 23)), default=0.93),
+        'regression': _cascade(_rule(1.20, any_of={'xba_diff': ('<', -0.040), 'xslg_diff': ('<', -0.060)}),
+                               _rule(1.10, any_of={'xba_diff': ('<', -0.025), 'xslg_diff': ('<', -0.035)}),
+                               _rule(1.05, any_of={'xba_diff': ('<', -0.015), 'xslg_diff': ('<', -0.020)}),
+                               _rule(0.90, any_of={'xba_diff': ('>', 0.025), 'xslg_diff': ('>', 0.040)}),
+                               default=1.0),
+        'weights': {'barrel': 0.35, 'discipline': 0.25, 'speed': 0.20, 'regression': 0.20},
+    },
+    'pitcher_vulnerability': {
+        'era': _cascade(_rule(1.15, pitcher_era=('>', 5.5)), _rule(1.08, pitcher_era=('>', 4.8)),
+                        _rule(1.03, pitcher_era=('>', 4.2)), _rule(0.85, pitcher_era=('<', 3.0)),
+                        _rule(0.92, pitcher_era=('<', 3.5)), default=1.0),
+        'hr_rate': _cascade(_rule(1.12, pitcher_hr_rate=('>', 1.5)), _rule(1.06, pitcher_hr_rate=('>', 1.2)),
+                            _rule(0.88, pitcher_hr_rate=('<', 0.8)), _rule(0.94, pitcher_hr_rate=('<', 1.0)),
+                            default=1.0),
+        'whip': _cascade(_rule(1.08, pitcher_whip=('>', 1.45)), _rule(1.04, pitcher_whip=('>', 1.35)),
+                         _rule(0.92, pitcher_whip=('<', 1.15)), _rule(0.96, pitcher_whip=('<', 1.25)),
+                         default=1.0),
+        'weights': {'era': 0.40, 'hr_rate': 0.35, 'whip': 0.25},
+        'regression_divisor': 150,
+    },
+    'situational': {
+        'handedness_divisor': 100,
+        'swing_divisor': 200,
+        'platoon_multiplier': 1.08,
+        'hot_streak_multiplier': 1.06,
+    },
+    # Additive bonuses, applied in the scalar path's order
+    'bonuses': {
+        'barrel_rate': _cascade(
+            _rule(30, ev_barrel_rate=('>=', 12),
+                  then=_cascade(_rule(20, barrel_vulnerability=('>=', 2)), _rule(18, barrel_vulnerability=('>=', 1)))),
+            _rule(20, ev_barrel_rate=('>=', 9), then=_cascade(_rule(12, barrel_vulnerability=('>=', 1)))),
+            _rule(10, ev_barrel_rate=('>=', 7)),
+            _rule(-3, ev_barrel_rate=('<', 4))),
+        'max_exit_velocity': _cascade(_rule(8, ev_max_velo=('>=', 116)), _rule(5, ev_max_velo=('>=', 113)),
+                                      _rule(3, ev_max_velo=('>=', 110)), _rule(-2, ev_max_velo=('<', 105))),
+        'contact': _cascade(
+            _rule(20, sweet_spot_percent=('>', 38), then=_cascade(
+                _rule(10, whiff_percent=('<', 18), then=_cascade(_rule(8, k_percent=('<', 16)))),
+                _rule(6, whiff_percent=('<', 22)))),
+            _rule(15, sweet_spot_percent=('>', 35), then=_cascade(
+                _rule(8, whiff_percent=('<', 20), then=_cascade(_rule(5, k_percent=('<', 18)))),
+                _rule(4, whiff_percent=('<', 24)))),
+            _rule(12, sweet_spot_percent=('>', 32), then=_cascade(
+                _rule(6, whiff_percent=('<', 22), k_percent=('<', 20)),
+                _rule(3, whiff_percent=('<', 25)))),
+            _rule(8, sweet_spot_percent=('>', 29), then=_cascade(_rule(3, whiff_percent=('<', 24)))),
+            _rule(-5, sweet_spot_percent=('<', 26), then=_cascade(_rule(-4, whiff_percent=('>', 30))))),
+        'walk': _cascade(
+            _rule(40, bb_percent=('>', 16), then=_cascade(
+                _rule(25, oz_swing_percent=('<', 20), then=_cascade(_rule(20, z_swing_percent=('>', 75)))))),
+            _rule(30, bb_percent=('>', 14), then=_cascade(
+                _rule(20, oz_swing_percent=('<', 22), then=_cascade(_rule(15, z_swing_percent=('>', 72)))))),
+            _rule(22, bb_percent=('>', 12), then=_cascade(
+                _rule(15, oz_swing_percent=('<', 25), then=_cascade(_rule(10, z_swing_percent=('>', 70)))))),
+            _rule(15, bb_percent=('>', 10), then=_cascade(_rule(8, oz_swing_percent=('<', 28)))),
+            _rule(8, bb_percent=('>', 8), then=_cascade(_rule(5, oz_swing_percent=('<', 30))))),
+        'speed': _cascade(_rule(35, sprint_speed=('>', 30)), _rule(28, sprint_speed=('>', 29)),
+                          _rule(20, sprint_speed=('>', 27)), _rule(12, sprint_speed=('>', 25)),
+                          _rule(8, sprint_speed=('>', 23))),
+        'xba_regression': _cascade(_rule(38, xba_diff=('<', -0.05)), _rule(30, xba_diff=('<', -0.04)),
+                                   _rule(23, xba_diff=('<', -0.025)), _rule(15, xba_diff=('<', -0.015))),
+        'xslg_regression': _cascade(_rule(45, xslg_diff=('<', -0.08)), _rule(38, xslg_diff=('<', -0.06)),
+                                    _rule(27, xslg_diff=('<', -0.04)), _rule(18, xslg_diff=('<', -0.025))),
+        'trend': _cascade(_rule(25, trend=('>', 0), then=_cascade(_rule(15, pitcher_deteriorating=('>', 0)))),
+                          _rule(-12, trend=('<', 0))),
+        'platoon': 12,
+        'park': _cascade(_rule(15, park_hr_factor=('>', 1.15)), _rule(8, park_hr_factor=('>', 1.05)),
+                         _rule(-8, park_hr_factor=('<', 0.85)), _rule(-3, park_hr_factor=('<', 0.95))),
+        'weather': _cascade(_rule(10, weather_factor=('>', 1.10)), _rule(5, weather_factor=('>', 1.05)),
+                            _rule(-8, weather_factor=('<', 0.90)), _rule(-3, weather_factor=('<', 0.95))),
+        'recent_form': {
+            'hot_avg_above': 0.320, 'hot_baseline_avg': 0.250, 'hot_points_per_avg': 60, 'hot_cap': 15,
+            'power_surge_min_hr': 3, 'power_surge_points_per_hr': 3,
+            'improving': 8, 'declining': -5, 'cold_streak': -10,
+        },
+        'lineup': {
+            'rbi_above': 1.1, 'rbi_points': 25, 'run_above': 1.1, 'run_points': 20,
+            'protection_above': 0.7, 'protection_points': 8, 'protection_below': 0.3, 'poor_protection': -3,
+            'heart_of_order': 5,
+        },
+        'first_pitch': {'z_swing_above': 35, 'points': 12},
+        'arsenal': _cascade(_rule(8, arsenal_score=('>', 20)), _rule(5, arsenal_score=('>', 10))),
+    },
+    'tbd_pitcher': {'factor': 0.6, 'floor': 30},
+    # generate_enhanced_weakspot_exploiters threshold cascade: a matchup is kept when
+    # score * confidence >= the reduced threshold and confidence >= min_confidence
+    'selection': {
+        'base_threshold': 1.0,
+        'min_threshold': 0.1,
+        'min_confidence': 0.08,
+        'pitcher_vulnerable_at': 45,
+        'reductions': {
+            'has_exploit_factors': 0.5,
+            'has_situational_advantages': 0.5,
+            'has_regression_opportunity': 1.0,
+            'has_contact_quality_edge': 0.5,
+            'pitcher_vulnerable': 0.5,
+            'has_data_quality': 0.5,
+            'classified': 0.5,
+        },
+    },
+}
+
+
+def _merge(base: Dict, overrides: Dict) -> Dict:
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict) and 'rules' not in value:
+            _merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def load_scoring_model(path=None) -> Dict:
+    """DEFAULT_MODEL with a JSON config's values merged over it (cascades are replaced whole)"""
+    model = copy.deepcopy(DEFAULT_MODEL)
+    if path:
+        with open(path, 'r') as f:
+            _merge(model, json.load(f))
+    return model
+
+
+def new_feature_row() -> Dict[str, float]:
+    """Feature dict for one matchup, pre-filled with the missing-data defaults"""
+    return dict(FEATURE_DEFAULTS)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for batch scoring")
+
+
+def feature_matrix(rows: Iterable[Dict[str, float]], defaults: Dict[str, float] = FEATURE_DEFAULTS):
+    """Stack feature dicts into an (n_matchups, n_features) float64 matrix"""
+    _require_numpy()
+    rows = list(rows)
+    matrix = np.empty((len(rows), len(defaults)), dtype=np.float64)
+    for i, row in enumerate(rows):
+        matrix[i] = [float(row.get(name, default)) for name, default in defaults.items()]
+    return matrix
+
+
+class FeatureColumns:
+    """Named column access into a feature matrix"""
+
+    def __init__(self, matrix, index: Dict[str, int] = FEATURE_INDEX):
+        self.matrix = matrix
+        self.index = index
+
+    def __getattr__(self, name):
+        try:
+            return self.matrix[:, self.index[name]]
+        except KeyError:
+            raise AttributeError(name)
+
+
+_OPERATORS = {
+    '>': lambda a, b: np.greater(a, b),
+    '>=': lambda a, b: np.greater_equal(a, b),
+    '<': lambda a, b: np.less(a, b),
+    '<=': lambda a, b: np.less_equal(a, b),
+    '==': lambda a, b: np.equal(a, b),
+}
+
+
+def _rule_mask(f: FeatureColumns, rule: Dict):
+    mask = np.ones(len(f.matrix), dtype=bool)
+    for column, (op, threshold) in rule.get('when', {}).items():
+        mask &= _OPERATORS[op](getattr(f, column), threshold)
+    if rule.get('any'):
+        any_mask = np.zeros(len(f.matrix), dtype=bool)
+        for column, (op, threshold) in rule['any'].items():
+            any_mask |= _OPERATORS[op](getattr(f, column), threshold)
+        mask &= any_mask
+    return mask
+
+
+def evaluate_cascade(f: FeatureColumns, cascade: Dict):
+    """Vectorized if/elif chain: per row, the first matching rule's value (plus its `then` cascade)"""
+    conditions, outcomes = [], []
+    for rule in cascade['rules']:
+        conditions.append(_rule_mask(f, rule))
+        outcome = rule['value']
+        if rule.get('then'):
+            outcome = outcome + evaluate_cascade(f, rule['then'])
+        outcomes.append(np.broadcast_to(np.asarray(outcome, dtype=np.float64), (len(f.matrix),)))
+    if not conditions:
+        return np.full(len(f.matrix), float(cascade.get('default', 0.0)))
+    return np.select(conditions, outcomes, cascade.get('default', 0.0))
+
+
+def batter_quality_multipliers(f: FeatureColumns, model: Dict = DEFAULT_MODEL):
+    """Barrel / discipline / speed / regression factors (0.7 - 1.3 range)"""
+    quality = model['batter_quality']
+    weights = quality['weights']
+    combined = (evaluate_cascade(f, quality['barrel']) * weights['barrel'] +
+                evaluate_cascade(f, quality['discipline']) * weights['discipline'] +
+                evaluate_cascade(f, quality['speed']) * weights['speed'] +
+                evaluate_cascade(f, quality['regression']) * weights['regression'])
+    return np.where(f.has_custom > 0, combined, 1.0)
+
+
+def pitcher_vulnerability_multipliers(f: FeatureColumns, model: Dict = DEFAULT_MODEL):
+    """ERA / HR rate / WHIP factors (0.8 - 1.2 range), times the multi-year regression bonus"""
+    vulnerability = model['pitcher_vulnerability']
+    weights = vulnerability['weights']
+    multiplier = np.where(f.has_pitcher_data > 0,
+                          evaluate_cascade(f, vulnerability['era']) * weights['era'] +
+                          evaluate_cascade(f, vulnerability['hr_rate']) * weights['hr_rate'] +
+                          evaluate_cascade(f, vulnerability['whip']) * weights['whip'], 1.0)
+    regression = f.pitcher_regression_score
+    return multiplier * np.where(regression > 0, 1.0 + regression / vulnerability['regression_divisor'], 1.0)
+
+
+def situational_multipliers(f: FeatureColumns, model: Dict = DEFAULT_MODEL):
+    """Handedness, swing path, platoon and hot streak multipliers"""
+    situational = model['situational']
+    multiplier = np.ones(len(f.matrix))
+    multiplier = multiplier * np.where(f.handedness_score > 0,
+                                       1.0 + f.handedness_score / situational['handedness_divisor'], 1.0)
+    multiplier = multiplier * np.where(f.swing_score > 0, 1.0 + f.swing_score / situational['swing_divisor'], 1.0)
+    multiplier = multiplier * np.where(f.platoon_advantage > 0, situational['platoon_multiplier'], 1.0)
+    return multiplier * np.where(f.trend > 0, situational['hot_streak_multiplier'], 1.0)
+
+
+def _form_bonus(f: FeatureColumns, form: Dict):
+    last_7_avg, last_7_hr = f.form_last_7_avg, f.form_last_7_hr
+    bonus = np.where((f.form_hot_streak > 0) | (last_7_avg > form['hot_avg_above']),
+                     np.minimum(form['hot_cap'], (last_7_avg - form['hot_baseline_avg']) * form['hot_points_per_avg']), 0)
+    bonus = bonus + np.where(last_7_hr >= form['power_surge_min_hr'], last_7_hr * form['power_surge_points_per_hr'], 0)
+    bonus = bonus + np.select([f.form_trend > 0, f.form_trend < 0], [form['improving'], form['declining']], 0)
+    return bonus + np.where(f.form_cold_streak > 0, form['cold_streak'], 0)
+
+
+def _lineup_bonus(f: FeatureColumns, lineup: Dict):
+    rbi, run, protection = f.rbi_factor, f.run_factor, f.protection
+    bonus = (np.where(rbi > lineup['rbi_above'], (rbi - 1.0) * lineup['rbi_points'], 0) +
+             np.where(run > lineup['run_above'], (run - 1.0) * lineup['run_points'], 0))
+    bonus = bonus + np.select([protection > lineup['protection_above'], protection < lineup['protection_below']],
+                              [protection * lineup['protection_points'], lineup['poor_protection']], 0)
+    return bonus + np.where(f.heart_of_order > 0, lineup['heart_of_order'], 0)
+
+
+def score_exploit_batch(matrix, model: Dict = DEFAULT_MODEL):
+    """
+    Exploit scores for every matchup row under a weight/threshold model
+    With DEFAULT_MODEL this matches the scalar path (up to float rounding): the
+    multiplicative core first (rounded to 0.1 like the scalar path), then the additive
+    bonuses in the order the scalar path applies them, then the TBD pitcher penalty.
+    """
+    _require_numpy()
+    f = FeatureColumns(matrix)
+    bonuses = model['bonuses']
+    has_custom = f.has_custom > 0
+
+    score = np.round(model['baseline_score'] * batter_quality_multipliers(f, model)
+                     * pitcher_vulnerability_multipliers(f, model) * situational_multipliers(f, model), 1)
+
+    # Contact quality (exit velocity)
+    has_ev = f.has_ev > 0
+    score = score + np.where(has_ev, evaluate_cascade(f, bonuses['barrel_rate']), 0)
+    score = score + np.where(has_ev, evaluate_cascade(f, bonuses['max_exit_velocity']), 0)
+
+    # Contact / walk / speed / expected-stats bonuses
+    category_bonus = (evaluate_cascade(f, bonuses['contact']) + evaluate_cascade(f, bonuses['walk']) +
+                      evaluate_cascade(f, bonuses['speed']))
+    regression_bonus = evaluate_cascade(f, bonuses['xba_regression']) + evaluate_cascade(f, bonuses['xslg_regression'])
+    score = score + np.where(has_custom, category_bonus + regression_bonus, 0)
+
+    # Hot/cold streaks
+    score = score + evaluate_cascade(f, bonuses['trend'])
+
+    # Platoon advantage (additive bonus needs batter data)
+    score = score + np.where(has_custom & (f.platoon_advantage > 0), bonuses['platoon'], 0)
+
+    # Park and weather
+    score = score + evaluate_cascade(f, bonuses['park'])
+    score = score + evaluate_cascade(f, bonuses['weather'])
+
+    # Recent form and momentum, lineup slot and protection
+    score = score + np.where(f.has_form > 0, _form_bonus(f, bonuses['recent_form']), 0)
+    score = score + np.where(f.has_lineup > 0, _lineup_bonus(f, bonuses['lineup']), 0)
+
+    # Home field, first-pitch window, arsenal matchup
+    first_pitch = bonuses['first_pitch']
+    score = score + f.home_field_adjustment
+    score = score + np.where(has_custom & (f.first_pitch_window > 0) & (f.z_swing_percent > first_pitch['z_swing_above']),
+                             first_pitch['points'], 0)
+    score = score + evaluate_cascade(f, bonuses['arsenal'])
+
+    # Unknown pitcher penalty
+    tbd = model['tbd_pitcher']
+    return np.where(f.pitcher_tbd > 0, np.maximum(tbd['floor'], score * tbd['factor']), score)
+
+
+def selection_threshold(row: Dict[str, float], model: Dict = DEFAULT_MODEL) -> float:
+    """Combined-score threshold for one matchup's selection row (the scalar cascade)"""
+    selection = model['selection']
+    flags = dict(row, pitcher_vulnerable=row.get('pitcher_vulnerability_score', 50) >= selection['pitcher_vulnerable_at'])
+    threshold = selection['base_threshold']
+    for name, amount in selection['reductions'].items():
+        if flags.get(name):
+            threshold -= amount
+    return max(selection['min_threshold'], threshold)
+
+
+def _selection_flags(s: FeatureColumns, selection: Dict) -> Dict[str, Any]:
+    flags = {name: getattr(s, name) > 0 for name in SELECTION_FEATURES}
+    flags['pitcher_vulnerable'] = s.pitcher_vulnerability_score >= selection['pitcher_vulnerable_at']
+    return flags
+
+
+def _reduced_thresholds(flags: Dict[str, Any], selection: Dict, base_threshold: float):
+    """Per-row threshold before the floor (same subtraction order as the scalar cascade)"""
+    threshold = np.full(len(flags['confidence']), float(base_threshold))
+    for name, amount in selection['reductions'].items():
+        threshold = np.where(flags[name], threshold - amount, threshold)
+    return threshold
+
+
+def select_batch(scores, selection_matrix, model: Dict = DEFAULT_MODEL) -> Dict[str, Any]:
+    """Combined scores, thresholds and the kept-matchup mask for every row"""
+    _require_numpy()
+    selection = model['selection']
+    s = FeatureColumns(selection_matrix, SELECTION_INDEX)
+    flags = _selection_flags(s, selection)
+
+    threshold = np.maximum(selection['min_threshold'],
+                           _reduced_thresholds(flags, selection, selection['base_threshold']))
+    combined = scores * s.confidence
+    return {
+        'combined': combined,
+        'threshold': threshold,
+        'selected': (combined >= threshold) & (s.confidence >= selection['min_confidence']),
+    }
+
+
+def save_feature_matrix(path, matchups: List[Dict[str, Any]], date: Optional[str] = None) -> int:
+    """
+    Persist stage one: every candidate matchup's feature and selection rows
+    Each matchup is {'player', 'team', 'pitcher', 'score', 'features', 'selection'};
+    written to a temp file, then swapped in. Returns the number of rows written.
+    """
+    rows = [m for m in matchups if m.get('selection') is not None]
+    payload = {
+        'version': MATRIX_VERSION,
+        'date': date,
+        'features': FEATURES,
+        'selection_features': SELECTION_FEATURES,
+        'matchups': [{
+            'player': m['player'],
+            'team': m['team'],
+            'pitcher': m['pitcher'],
+            'score': m['score'],
+            'features': [m['features'].get(name, default) for name, default in FEATURE_DEFAULTS.items()],
+            'selection': [m['selection'].get(name, default) for name, default in SELECTION_DEFAULTS.items()],
+        } for m in rows]
+    }
+    temp_file = Path(f"{path}.tmp")
+    with open(temp_file, 'w') as f:
+        json.dump(payload, f)
+    os.replace(temp_file, path)
+    return len(rows)
+
+
+def load_feature_matrix(path) -> Dict[str, Any]:
+    """Load a persisted feature matrix (columns matched by name, so older files still load)"""
+    _require_numpy()
+    with open(path, 'r') as f:
+        payload = json.load(f)
+
+    feature_names = payload['features']
+    selection_names = payload['selection_features']
+    matchups = payload['matchups']
+    return {
+        'date': payload.get('date'),
+        'matchups': [{key: m[key] for key in ('player', 'team', 'pitcher', 'score')} for m in matchups],
+        'features': feature_matrix(dict(zip(feature_names, m['features'])) for m in matchups),
+        'selection': feature_matrix((dict(zip(selection_names, m['selection'])) for m in matchups),
+                                    SELECTION_DEFAULTS),
+    }
+
+
+def combine_feature_matrices(datasets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Stack loaded feature matrices (e.g. several dates) into one, keeping each row's date"""
+    _require_numpy()
+    return {
+        'date': ', '.join(str(data.get('date')) for data in datasets),
+        'dates': [data.get('date') for data in datasets for _ in data['matchups']],
+        'matchups': [matchup for data in datasets for matchup in data['matchups']],
+        'features': np.vstack([data['features'] for data in datasets]),
+        'selection': np.vstack([data['selection'] for data in datasets]),
+    }
+
+
+def parse_grid(spec: str) -> List[float]:
+    """Sweep values from '0.5,1,2' or an inclusive 'start:stop:step' range"""
+    if ':' in spec:
+        start, stop, step = (float(part) for part in spec.split(':'))
+        count = int(round((stop - start) / step)) + 1
+        return [round(start + i * step, 10) for i in range(max(count, 0))]
+    return [float(part) for part in spec.split(',') if part.strip()]
+
+
+def sweep_thresholds(matrix_data: Dict[str, Any], base_thresholds: Sequence[float],
+                     min_confidences: Sequence[float], min_combined: Sequence[float],
+                     model: Dict = DEFAULT_MODEL) -> List[Dict[str, Any]]:
+    """
+    Exploiter counts and combined-score distributions for every threshold setting
+    Scores are computed once under `model`; the whole base threshold x min confidence
+    x combined-score floor grid is then evaluated as one broadcast comparison.
+    """
+    _require_numpy()
+    selection = model['selection']
+    scores = score_exploit_batch(matrix_data['features'], model)
+    s = FeatureColumns(matrix_data['selection'], SELECTION_INDEX)
+    flags = _selection_flags(s, selection)
+    combined = scores * s.confidence
+
+    reduced = np.stack([_reduced_thresholds(flags, selection, base) for base in base_thresholds])  # (base, row)
+    floors = np.asarray(min_combined, dtype=np.float64)
+    thresholds = np.maximum(floors[None, :, None], reduced[:, None, :])                             # (base, floor, row)
+    passes_score = combined[None, None, :] >= thresholds
+    passes_confidence = s.confidence[None, :] >= np.asarray(min_confidences, dtype=np.float64)[:, None]  # (conf, row)
+    selected = passes_score[:, None, :, :] & passes_confidence[None, :, None, :]                      # (base, conf, floor, row)
+
+    dates = matrix_data.get('dates') or [matrix_data.get('date')] * len(combined)
+    date_count = max(len(set(dates)), 1)
+    results = []
+    for i, j, k in np.ndindex(selected.shape[:3]):
+        mask = selected[i, j, k]
+        kept = combined[mask]
+        results.append({
+            'base_threshold': base_thresholds[i],
+            'min_confidence': min_confidences[j],
+            'min_combined': min_combined[k],
+            'exploiters': int(mask.sum()),
+            'per_date': mask.sum() / date_count,
+            'combined_mean': float(kept.mean()) if len(kept) else 0.0,
+            'combined_p10': float(np.percentile(kept, 10)) if len(kept) else 0.0,
+            'combined_median': float(np.median(kept)) if len(kept) else 0.0,
+            'combined_p90': float(np.percentile(kept, 90)) if len(kept) else 0.0,
+            'score_mean': float(scores[mask].mean()) if len(kept) else 0.0,
+        })
+    return results
+
+
+def rescore(matrix_data: Dict[str, Any], model: Dict = DEFAULT_MODEL) -> Dict[str, Any]:
+    """Stage two: score and select a loaded feature matrix under `model`"""
+    scores = score_exploit_batch(matrix_data['features'], model)
+    result = select_batch(scores, matrix_data['selection'], model)
+    result['scores'] = scores
+    return result
+
+
+def verify_batch_scores(rows: List[Dict[str, float]], scalar_scores: Sequence[float],
+                        tolerance: float = 0.101) -> Optional[Dict[str, float]]:
+    """
+    Batch-score recorded matchups and compare with the scalar path (None without numpy)
+    The default tolerance allows one 0.1 step where np.round and round() disagree on a tie.
+    """
+    if np is None or not rows:
+        return None
+
+    started = time.perf_counter()
+    matrix = feature_matrix(rows)
+    built = time.perf_counter()
+    scores = score_exploit_batch(matrix)
+    scored = time.perf_counter()
+
+    deltas = np.abs(scores - np.asarray(scalar_scores, dtype=np.float64))
+    return {
+        'matchups': len(rows),
+        'build_ms': (built - started) * 1000,
+        'score_ms': (scored - built) * 1000,
+        'max_delta': float(deltas.max()),
+        'mismatches': int((deltas > tolerance).sum()),
+    }
+
+
+def main():
+    """Re-score a persisted feature matrix under a weight/threshold model"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Re-score a weakspot feature matrix with a scoring model')
+    parser.add_argument('matrix', nargs='*', help='weakspot_feature_matrix_<date>.json file(s) written by full runs')
+    parser.add_argument('--model', type=str, help='JSON scoring model (merged over the defaults)')
+    parser.add_argument('--top', type=int, default=10, help='Number of top matchups to list')
+    parser.add_argument('--write-model', type=str, help='Write the (merged) model as JSON and exit')
+    parser.add_argument('--base-thresholds', type=str,
+                        help="Sweep base_threshold values ('0.5,1,2' or 'start:stop:step')")
+    parser.add_argument('--min-confidences', type=str, help='Sweep confidence_threshold values')
+    parser.add_argument('--min-combined', type=str, help='Sweep combined-score floor (min_threshold) values')
+    args = parser.parse_args()
+
+    try:
+        model = load_scoring_model(args.model)
+    except Exception as e:
+        print(f"❌ Error loading scoring model {args.model}: {e}")
+        sys.exit(1)
+
+    if args.write_model:
+        with open(args.write_model, 'w') as f:
+            json.dump(model, f, indent=2)
+        print(f"💾 Scoring model written to {args.write_model}")
+        return
+
+    if not args.matrix:
+        parser.error('a feature matrix file is required')
+
+    started = time.perf_counter()
+    datasets = [load_feature_matrix(path) for path in args.matrix]
+    matrix_data = combine_feature_matrices(datasets) if len(datasets) > 1 else datasets[0]
+    loaded_ms = (time.perf_counter() - started) * 1000
+
+    if args.base_thresholds or args.min_confidences or args.min_combined:
+        selection = model['selection']
+        grid = (parse_grid(args.base_thresholds) if args.base_thresholds else [selection['base_threshold']],
+                parse_grid(args.min_confidences) if args.min_confidences else [selection['min_confidence']],
+                parse_grid(args.min_combined) if args.min_combined else [selection['min_threshold']])
+        started = time.perf_counter()
+        results = sweep_thresholds(matrix_data, *grid, model=model)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        print(f"🔬 Threshold sweep: {len(results)} settings x {len(matrix_data['matchups'])} matchups "
+              f"({len(datasets)} date(s), loaded in {loaded_ms:.0f} ms, swept in {elapsed_ms:.1f} ms)")
+        print(f"   {'base':>6} {'conf':>6} {'floor':>6} {'count':>6} {'/date':>7} "
+              f"{'mean':>7} {'p10':>7} {'median':>7} {'p90':>7}")
+        for r in results:
+            print(f"   {r['base_threshold']:6.2f} {r['min_confidence']:6.3f} {r['min_combined']:6.2f} "
+                  f"{r['exploiters']:6d} {r['per_date']:7.1f} {r['combined_mean']:7.1f} {r['combined_p10']:7.1f} "
+                  f"{r['combined_median']:7.1f} {r['combined_p90']:7.1f}")
+        return
+
+    started = time.perf_counter()
+    result = rescore(matrix_data, model)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    matchups = matrix_data['matchups']
+    recorded = select_batch(np.asarray([m['score'] for m in matchups], dtype=np.float64),
+                            matrix_data['selection'], model)
+    print(f"⚡ Re-scored {len(matchups)} matchups for {matrix_data.get('date') or args.matrix} in {elapsed_ms:.2f} ms")
+    print(f"   ✅ Selected: {int(result['selected'].sum())} (with recorded scores: {int(recorded['selected'].sum())})")
+
+    order = np.argsort(-result['combined'], kind='stable')[:args.top]
+    for rank, i in enumerate(order, 1):
+        m = matchups[i]
+        print(f"   {rank:2d}. {m['player']} ({m['team']}) vs {m['pitcher']}: score {result['scores'][i]:.1f} "
+              f"(was {m['score']:.1f}), combined {result['combined'][i]:.1f}")
+
+
+if __name__ == "__main__":
+    main()
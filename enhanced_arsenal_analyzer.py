@@ -3,7 +3,6 @@
 Enhanced Arsenal Analysis for Weakspot Exploiters
 Provides detailed pitch-by-pitch breakdowns with statistical evidence
 """
-import csv
 import json
 import sys
 from pathlib import Path
@@ -13,11 +12,43 @@ from typing import Dict, List, Tuple, Optional
 sys.path.append(str(Path(__file__).parent.parent / 'BaseballScraper'))
 from config import PATHS, DATA_PATH
 
+from player_registry import PlayerRegistry, parse_player_id
+from stats_ingest import CsvSchema, FLOAT, STATS_CATALOG, TEXT, load_columnar, open_stats_csv, stats_snapshot_dir
+
+# Statcast CSV layouts: (record key, CSV column, type[, default])
+ARSENAL_PITCH_SCHEMA = CsvSchema('arsenal pitch', [
+    ('name', 'last_name, first_name', TEXT),
+    ('player_id', 'player_id', TEXT),
+    ('team', 'team_name_alt', TEXT),
+    ('pitch_type', 'pitch_type', TEXT),
+    ('pitch_name', 'pitch_name', TEXT),
+    ('usage', 'pitch_usage', FLOAT),
+    ('ba_against', 'ba', FLOAT),
+    ('slg_against', 'slg', FLOAT),
+    ('woba_against', 'woba', FLOAT),
+    ('whiff_percent', 'whiff_percent', FLOAT),
+    ('hard_hit_percent', 'hard_hit_percent', FLOAT),
+], required=['last_name, first_name', 'pitch_type', 'pitch_name'])
+
+BATTER_PROFILE_SCHEMA = CsvSchema('batter profile', [
+    ('name', 'last_name, first_name', TEXT),
+    ('player_id', 'player_id', TEXT),
+    ('z_swing_percent', 'z_swing_percent', FLOAT),
+    ('oz_swing_percent', 'oz_swing_percent', FLOAT),
+    ('bb_percent', 'bb_percent', FLOAT),
+    ('barrel_percent', 'barrel_percent', FLOAT),
+    ('hard_hit_percent', 'hard_hit_percent', FLOAT),
+    ('whiff_percent', 'whiff_percent', FLOAT),
+], required=['last_name, first_name'])
+
 class EnhancedArsenalAnalyzer:
     """Provides detailed arsenal analysis with specific statistical evidence"""
     
-    def __init__(self, stats_path: str):
+    def __init__(self, stats_path: str, use_snapshot: bool = False):
         self.stats_path = Path(stats_path)
+        if use_snapshot:
+            # Read-only attach to the host's published stats tables (stale files reload from CSV)
+            STATS_CATALOG.attach_snapshot(stats_snapshot_dir(self.stats_path))
         self.league_averages = self._calculate_league_averages()
         
     def _calculate_league_averages(self) -> Dict[str, Dict[str, float]]:
@@ -30,27 +61,24 @@ class EnhancedArsenalAnalyzer:
             return {}
             
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
+            for pitch in ARSENAL_PITCH_SCHEMA.rows(load_columnar(file_path)):
+                pitch_type = pitch['pitch_type']
+                if pitch_type not in pitch_stats:
+                    pitch_stats[pitch_type] = {
+                        'ba_total': 0, 'slg_total': 0, 'woba_total': 0,
+                        'whiff_total': 0, 'hard_hit_total': 0, 'usage_total': 0
+                    }
+                    total_counts[pitch_type] = 0
+                
+                # Accumulate stats
+                pitch_stats[pitch_type]['ba_total'] += pitch['ba_against']
+                pitch_stats[pitch_type]['slg_total'] += pitch['slg_against']
+                pitch_stats[pitch_type]['woba_total'] += pitch['woba_against']
+                pitch_stats[pitch_type]['whiff_total'] += pitch['whiff_percent']
+                pitch_stats[pitch_type]['hard_hit_total'] += pitch['hard_hit_percent']
+                pitch_stats[pitch_type]['usage_total'] += pitch['usage']
+                total_counts[pitch_type] += 1
                 
-                for row in reader:
-                    pitch_type = row['pitch_type']
-                    if pitch_type not in pitch_stats:
-                        pitch_stats[pitch_type] = {
-                            'ba_total': 0, 'slg_total': 0, 'woba_total': 0,
-                            'whiff_total': 0, 'hard_hit_total': 0, 'usage_total': 0
-                        }
-                        total_counts[pitch_type] = 0
-                    
-                    # Accumulate stats
-                    pitch_stats[pitch_type]['ba_total'] += float(row.get('ba', 0))
-                    pitch_stats[pitch_type]['slg_total'] += float(row.get('slg', 0))
-                    pitch_stats[pitch_type]['woba_total'] += float(row.get('woba', 0))
-                    pitch_stats[pitch_type]['whiff_total'] += float(row.get('whiff_percent', 0))
-                    pitch_stats[pitch_type]['hard_hit_total'] += float(row.get('hard_hit_percent', 0))
-                    pitch_stats[pitch_type]['usage_total'] += float(row.get('pitch_usage', 0))
-                    total_counts[pitch_type] += 1
-                    
         except Exception as e:
             print(f"Error calculating league averages: {e}")
             return {}
@@ -316,10 +344,18 @@ class EnhancedArsenalAnalyzer:
             # Fallback generic justification
             return f"Batter profile vs {pitch_name} vulnerability ({vulnerability_score}/100 exploit potential)"
 
-def enhance_weakspot_justifications(stats_path: str, exploiters_data: List[Dict]) -> List[Dict]:
+def enhance_weakspot_justifications(stats_path: str, exploiters_data: List[Dict],
+                                    use_snapshot: bool = False) -> List[Dict]:
     """Enhance existing exploiters with detailed arsenal justifications"""
     
-    analyzer = EnhancedArsenalAnalyzer(stats_path)
+    analyzer = EnhancedArsenalAnalyzer(stats_path, use_snapshot=use_snapshot)
+    registry = PlayerRegistry.load(DATA_PATH, stats_path)
+    
+    def player_key(record):
+        """Key rows by canonical player ID, falling back to the lowercased CSV name"""
+        player_id = parse_player_id(record.pop('player_id'))
+        name = record.pop('name')
+        return player_id if player_id is not None else name.lower()
     
     # Load pitcher arsenal data
     pitcher_arsenal = {}
@@ -327,31 +363,19 @@ def enhance_weakspot_justifications(stats_path: str, exploiters_data: List[Dict]
     
     if file_path.exists():
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
+            for pitch_data in ARSENAL_PITCH_SCHEMA.rows(load_columnar(file_path)):
+                pitcher_name = player_key(pitch_data)
+                team = pitch_data.pop('team')
+                pitch_type = pitch_data.pop('pitch_type')
                 
-                for row in reader:
-                    pitcher_name = row['last_name, first_name'].lower()
-                    
-                    if pitcher_name not in pitcher_arsenal:
-                        pitcher_arsenal[pitcher_name] = {
-                            'team': row.get('team_name_alt', ''),
-                            'pitch_types': {}
-                        }
-                    
-                    pitch_type = row['pitch_type']
-                    pitch_data = {
-                        'pitch_name': row['pitch_name'],
-                        'usage': float(row.get('pitch_usage', 0)),
-                        'ba_against': float(row.get('ba', 0)),
-                        'slg_against': float(row.get('slg', 0)),
-                        'woba_against': float(row.get('woba', 0)),
-                        'whiff_percent': float(row.get('whiff_percent', 0)),
-                        'hard_hit_percent': float(row.get('hard_hit_percent', 0)),
+                if pitcher_name not in pitcher_arsenal:
+                    pitcher_arsenal[pitcher_name] = {
+                        'team': team,
+                        'pitch_types': {}
                     }
-                    
-                    pitcher_arsenal[pitcher_name]['pitch_types'][pitch_type] = pitch_data
-                    
+                
+                pitcher_arsenal[pitcher_name]['pitch_types'][pitch_type] = pitch_data
+                
         except Exception as e:
             print(f"Error loading pitcher arsenal: {e}")
     
@@ -361,20 +385,9 @@ def enhance_weakspot_justifications(stats_path: str, exploiters_data: List[Dict]
     
     if batter_file.exists():
         try:
-            with open(batter_file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
+            for profile in BATTER_PROFILE_SCHEMA.rows(load_columnar(batter_file)):
+                batter_data[player_key(profile)] = profile
                 
-                for row in reader:
-                    batter_name = row['last_name, first_name'].lower()
-                    batter_data[batter_name] = {
-                        'z_swing_percent': float(row.get('z_swing_percent', 0)),
-                        'oz_swing_percent': float(row.get('oz_swing_percent', 0)),
-                        'bb_percent': float(row.get('bb_percent', 0)),
-                        'barrel_percent': float(row.get('barrel_percent', 0)),
-                        'hard_hit_percent': float(row.get('hard_hit_percent', 0)),
-                        'whiff_percent': float(row.get('whiff_percent', 0))
-                    }
-                    
         except Exception as e:
             print(f"Error loading batter data: {e}")
     
@@ -387,6 +400,14 @@ def enhance_weakspot_justifications(stats_path: str, exploiters_data: List[Dict]
         pitcher_name = exploiter.get('pitcher', '').lower()
         batter_name = exploiter.get('batter', '').lower()
         
+        # Join on player ID when the registry knows the name variant
+        pitcher_id = registry.resolve(pitcher_name, exploiter.get('opposingTeam', ''))
+        batter_id = registry.resolve(batter_name, exploiter.get('team', ''))
+        if pitcher_id in pitcher_arsenal:
+            pitcher_name = pitcher_id
+        if batter_id in batter_data:
+            batter_name = batter_id
+        
         # Get detailed arsenal analysis
         arsenal_analysis = analyzer.analyze_pitcher_arsenal_detailed(pitcher_name, pitcher_arsenal)
         
@@ -420,16 +441,14 @@ if __name__ == "__main__":
     if arsenal_file.exists():
         print(f"Arsenal file path: {arsenal_file}")
         # Test with actual names from the file
-        with open(arsenal_file, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
+        with open_stats_csv(arsenal_file) as reader:
             sample_row = next(reader)
             print(f"Sample pitcher: {sample_row['last_name, first_name']}")
     
     if batter_file.exists():
         print(f"Batter file path: {batter_file}")
         # Test with actual names from the file  
-        with open(batter_file, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
+        with open_stats_csv(batter_file) as reader:
             sample_row = next(reader)
             print(f"Sample batter: {sample_row['last_name, first_name']}")
     
@@ -4,19 +4,28 @@ Enhanced Weakspot Exploiters Generator (Version 3.0)
 Adds sophisticated vulnerability patterns, situational analysis, and predictive modeling
 """
 
+import gzip
+import hashlib
 import json
 import os
 import sys
-import csv
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-import re
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 # Import centralized configuration
 sys.path.append(str(Path(__file__).parent.parent / 'BaseballScraper'))
 from config import PATHS, DATA_PATH
 
+from player_names import NameIndex, normalize_name, names_match
+from player_registry import ParticipantSet, PlayerRegistry, PlayerTable
+from batch_scoring import (DEFAULT_MODEL, SELECTION_DEFAULTS, feature_matrix, load_scoring_model, new_feature_row,
+                           rescore, save_feature_matrix, score_exploit_batch, selection_threshold, verify_batch_scores)
+from stats_ingest import (CsvSchema, INT, FLOAT, TEXT, STATS_CATALOG, as_dicts, deep_sizeof, holds_records, load_columnar,
+                          stats_snapshot_dir, table_records)
+
 # Team normalization utilities for CHW/CWS and other team abbreviation mismatches
 TEAM_MAPPINGS = {
     # Forward mappings (less common → standard)
@@ -58,86 +67,1201 @@ def teams_match(team1: str, team2: str) -> bool:
     return (TEAM_MAPPINGS.get(team1_upper) == team2_upper or 
             TEAM_MAPPINGS.get(team2_upper) == team1_upper)
 
+# Statcast CSV layouts: (record key, CSV column, type[, default])
+HITTER_EXIT_VELOCITY_SCHEMA = CsvSchema('hitter exit velocity', [
+    ('name', 'last_name, first_name', TEXT),
+    ('attempts', 'attempts', INT),
+    ('real_barrel_rate', 'brl_percent', FLOAT),
+    ('barrel_count', 'barrels', INT),
+    ('barrel_pa', 'brl_pa', FLOAT),
+    ('avg_hit_speed', 'avg_hit_speed', FLOAT),
+    ('max_hit_speed', 'max_hit_speed', FLOAT),
+    ('ev50', 'ev50', FLOAT),
+    ('ev95_plus', 'ev95plus', INT),
+    ('ev95_percent', 'ev95percent', FLOAT),
+    ('sweet_spot_percent', 'anglesweetspotpercent', FLOAT),
+    ('avg_hit_angle', 'avg_hit_angle', FLOAT),
+    ('max_distance', 'max_distance', INT),
+    ('avg_distance', 'avg_distance', INT),
+    ('avg_hr_distance', 'avg_hr_distance', INT),
+    ('flyball_linedrive_rate', 'fbld', FLOAT),
+    ('groundball_rate', 'gb', FLOAT),
+    ('player_id', 'player_id', TEXT),
+], required=['last_name, first_name'])
+
+PITCHER_EXIT_VELOCITY_SCHEMA = CsvSchema('pitcher exit velocity', [
+    ('name', 'last_name, first_name', TEXT),
+    ('attempts', 'attempts', INT),
+    ('real_barrel_rate_allowed', 'brl_percent', FLOAT),
+    ('barrels_allowed', 'barrels', INT),
+    ('barrel_pa_allowed', 'brl_pa', FLOAT),
+    ('avg_hit_speed_allowed', 'avg_hit_speed', FLOAT),
+    ('max_hit_speed_allowed', 'max_hit_speed', FLOAT),
+    ('hard_hit_percent_allowed', 'hard_hit_percent', FLOAT),
+    ('ev50_allowed', 'ev50', FLOAT),
+    ('ev95_plus_allowed', 'ev95plus', INT),
+    ('ev95_percent_allowed', 'ev95percent', FLOAT),
+    ('sweet_spot_percent_allowed', 'anglesweetspotpercent', FLOAT),
+    ('avg_hit_angle_allowed', 'avg_hit_angle', FLOAT),
+    ('max_distance_allowed', 'max_distance', INT),
+    ('avg_distance_allowed', 'avg_distance', INT),
+    ('avg_hr_distance_allowed', 'avg_hr_distance', INT),
+    ('flyball_linedrive_rate_allowed', 'fbld', FLOAT),
+    ('groundball_rate_allowed', 'gb', FLOAT),
+    ('player_id', 'player_id', TEXT),
+], required=['last_name, first_name'])
+
+CUSTOM_BATTER_SCHEMA = CsvSchema('custom batter', [
+    ('csv_name', 'last_name, first_name', TEXT),
+    # Traditional stats
+    ('ab', 'ab', INT),
+    ('pa', 'pa', INT),
+    ('hit', 'hit', INT),
+    ('home_run', 'home_run', INT),
+    ('strikeout', 'strikeout', INT),
+    ('walk', 'walk', INT),
+    # Rate stats
+    ('batting_avg', 'batting_avg', FLOAT),
+    ('on_base_percent', 'on_base_percent', FLOAT),
+    ('slugging_percent', 'slg_percent', FLOAT),
+    ('ops', 'on_base_plus_slg', FLOAT),
+    ('isolated_power', 'isolated_power', FLOAT),
+    ('babip', 'babip', FLOAT),
+    ('k_percent', 'k_percent', FLOAT),
+    ('bb_percent', 'bb_percent', FLOAT),
+    # Expected statistics
+    ('xba', 'xba', FLOAT),
+    ('xslg', 'xslg', FLOAT),
+    ('xwoba', 'xwoba', FLOAT),
+    ('woba', 'woba', FLOAT),
+    ('xobp', 'xobp', FLOAT),
+    ('xiso', 'xiso', FLOAT),
+    # Expected stats gaps
+    ('xba_diff', 'xbadiff', FLOAT),
+    ('xslg_diff', 'xslgdiff', FLOAT),
+    ('woba_diff', 'wobadiff', FLOAT),
+    # Contact quality
+    ('barrel', 'barrel', INT),
+    ('barrel_batted_rate', 'barrel_batted_rate', FLOAT),
+    ('hard_hit_percent', 'hard_hit_percent', FLOAT),
+    ('sweet_spot_percent', 'sweet_spot_percent', FLOAT),
+    ('exit_velocity_avg', 'exit_velocity_avg', FLOAT),
+    ('launch_angle_avg', 'launch_angle_avg', FLOAT),
+    # Plate discipline
+    ('z_swing_percent', 'z_swing_percent', FLOAT),
+    ('oz_swing_percent', 'oz_swing_percent', FLOAT),
+    ('whiff_percent', 'whiff_percent', FLOAT),
+    ('swing_percent', 'swing_percent', FLOAT),
+    # Metadata
+    ('player_id', 'player_id', TEXT),
+    ('player_age', 'player_age', INT),
+    ('sprint_speed', 'sprint_speed', FLOAT),
+], required=['last_name, first_name'])
+
+CUSTOM_PITCHER_SCHEMA = CsvSchema('custom pitcher', [
+    ('name', 'last_name, first_name', TEXT),
+    # Basic stats
+    ('games', 'p_game', INT),
+    ('innings_pitched', 'p_formatted_ip', FLOAT),
+    ('era', 'p_era', FLOAT),
+    # Batters faced stats
+    ('pa', 'pa', INT),
+    ('ab', 'ab', INT),
+    ('hits_allowed', 'hit', INT),
+    ('home_runs_allowed', 'home_run', INT),
+    ('strikeouts', 'strikeout', INT),
+    ('walks', 'walk', INT),
+    # Opponent rate stats
+    ('opp_batting_avg', 'batting_avg', FLOAT),
+    ('opp_on_base_percent', 'on_base_percent', FLOAT),
+    ('opp_slugging_percent', 'slg_percent', FLOAT),
+    ('opp_ops', 'on_base_plus_slg', FLOAT),
+    ('opp_isolated_power', 'isolated_power', FLOAT),
+    ('opp_babip', 'babip', FLOAT),
+    ('k_percent', 'k_percent', FLOAT),
+    ('bb_percent', 'bb_percent', FLOAT),
+    # Expected statistics allowed
+    ('xba_allowed', 'xba', FLOAT),
+    ('xslg_allowed', 'xslg', FLOAT),
+    ('xwoba_allowed', 'xwoba', FLOAT),
+    ('woba_allowed', 'woba', FLOAT),
+    # Expected stats gaps
+    ('xba_diff', 'xbadiff', FLOAT),
+    ('xslg_diff', 'xslgdiff', FLOAT),
+    ('woba_diff', 'wobadiff', FLOAT),
+    # Contact quality allowed
+    ('barrels_allowed', 'barrel', INT),
+    ('barrel_batted_rate_allowed', 'barrel_batted_rate', FLOAT),
+    ('hard_hit_percent_allowed', 'hard_hit_percent', FLOAT),
+    ('sweet_spot_percent_allowed', 'sweet_spot_percent', FLOAT),
+    ('exit_velocity_avg_allowed', 'exit_velocity_avg', FLOAT),
+    ('launch_angle_avg_allowed', 'launch_angle_avg', FLOAT),
+    # Arsenal data
+    ('pitch_hand', 'pitch_hand', TEXT, 'R'),
+    ('arm_angle', 'arm_angle', FLOAT),
+    # Metadata
+    ('player_id', 'player_id', TEXT),
+    ('player_age', 'player_age', INT),
+], required=['last_name, first_name'])
+
+PITCHER_ARSENAL_SCHEMA = CsvSchema('pitcher arsenal', [
+    ('name', 'last_name, first_name', TEXT),
+    ('team', 'team_name_alt', TEXT),
+    ('pitch_type', 'pitch_type', TEXT),
+    ('pitch_name', 'pitch_name', TEXT),
+    ('run_value_per_100', 'run_value_per_100', FLOAT),
+    ('usage', 'pitch_usage', FLOAT),
+    ('ba_against', 'ba', FLOAT),
+    ('slg_against', 'slg', FLOAT),
+    ('woba_against', 'woba', FLOAT),
+    ('whiff_percent', 'whiff_percent', FLOAT),
+    ('hard_hit_percent', 'hard_hit_percent', FLOAT),
+    ('k_percent', 'k_percent', FLOAT),
+    ('pitches', 'pitches', INT),
+], required=['last_name, first_name', 'pitch_type', 'pitch_name'])
+
+HANDEDNESS_SCHEMA = CsvSchema('batted ball handedness', [
+    ('name', 'name', TEXT),
+    ('bbe', 'bbe', INT),
+    ('gb_rate', 'gb_rate', FLOAT),
+    ('air_rate', 'air_rate', FLOAT),
+    ('fb_rate', 'fb_rate', FLOAT),
+    ('ld_rate', 'ld_rate', FLOAT),
+    ('pull_rate', 'pull_rate', FLOAT),
+    ('oppo_rate', 'oppo_rate', FLOAT),
+    ('pull_air_rate', 'pull_air_rate', FLOAT),
+], required=['name'])
+
+BATTED_BALL_HANDEDNESS_SCHEMA = CsvSchema('batted ball handedness (full)', [
+    ('name', 'name', TEXT),
+    ('bbe', 'bbe', INT),
+    ('gb_rate', 'gb_rate', FLOAT),
+    ('air_rate', 'air_rate', FLOAT),
+    ('fb_rate', 'fb_rate', FLOAT),
+    ('ld_rate', 'ld_rate', FLOAT),
+    ('pu_rate', 'pu_rate', FLOAT),
+    ('pull_rate', 'pull_rate', FLOAT),
+    ('straight_rate', 'straight_rate', FLOAT),
+    ('oppo_rate', 'oppo_rate', FLOAT),
+    ('pull_gb_rate', 'pull_gb_rate', FLOAT),
+    ('straight_gb_rate', 'straight_gb_rate', FLOAT),
+    ('oppo_gb_rate', 'oppo_gb_rate', FLOAT),
+    ('pull_air_rate', 'pull_air_rate', FLOAT),
+    ('straight_air_rate', 'straight_air_rate', FLOAT),
+    ('oppo_air_rate', 'oppo_air_rate', FLOAT),
+])
+
+SWING_PATH_SCHEMA = CsvSchema('swing path', [
+    ('name', 'name', TEXT),
+    ('side', 'side', TEXT),
+    ('avg_bat_speed', 'avg_bat_speed', FLOAT),
+    ('swing_tilt', 'swing_tilt', FLOAT),
+    ('attack_angle', 'attack_angle', FLOAT),
+    ('attack_direction', 'attack_direction', FLOAT),
+    ('ideal_attack_angle_rate', 'ideal_attack_angle_rate', FLOAT),
+    ('avg_intercept_y_vs_plate', 'avg_intercept_y_vs_plate', FLOAT),
+    ('avg_intercept_y_vs_batter', 'avg_intercept_y_vs_batter', FLOAT),
+    ('avg_batter_y_position', 'avg_batter_y_position', FLOAT),
+    ('avg_batter_x_position', 'avg_batter_x_position', FLOAT),
+    ('competitive_swings', 'competitive_swings', INT),
+])
+
+COMPREHENSIVE_BATTER_SCHEMA = CsvSchema('comprehensive batter', [
+    ('player_id', 'player_id', TEXT),
+    ('year', 'year', TEXT, '2025'),
+    ('player_age', 'player_age', INT),
+    ('ab', 'ab', INT),
+    ('pa', 'pa', INT),
+    ('hit', 'hit', INT),
+    ('home_run', 'home_run', INT),
+    ('strikeout', 'strikeout', INT),
+    ('walk', 'walk', INT),
+    ('k_percent', 'k_percent', FLOAT),
+    ('bb_percent', 'bb_percent', FLOAT),
+    ('batting_avg', 'batting_avg', FLOAT),
+    ('slg_percent', 'slg_percent', FLOAT),
+    ('on_base_percent', 'on_base_percent', FLOAT),
+    ('on_base_plus_slg', 'on_base_plus_slg', FLOAT),
+    ('isolated_power', 'isolated_power', FLOAT),
+    ('babip', 'babip', FLOAT),
+    # Expected stats
+    ('xba', 'xba', FLOAT),
+    ('xslg', 'xslg', FLOAT),
+    ('woba', 'woba', FLOAT),
+    ('xwoba', 'xwoba', FLOAT),
+    ('xobp', 'xobp', FLOAT),
+    ('xiso', 'xiso', FLOAT),
+    # Contact quality
+    ('exit_velocity_avg', 'exit_velocity_avg', FLOAT),
+    ('launch_angle_avg', 'launch_angle_avg', FLOAT),
+    ('barrel', 'barrel', INT),
+    ('barrel_batted_rate', 'barrel_batted_rate', FLOAT),
+    ('hard_hit_percent', 'hard_hit_percent', FLOAT),
+    # Swing mechanics
+    ('avg_swing_speed', 'avg_swing_speed', FLOAT),
+    ('attack_angle', 'attack_angle', FLOAT),
+    ('attack_direction', 'attack_direction', FLOAT),
+    ('ideal_angle_rate', 'ideal_angle_rate', FLOAT),
+    # Zone discipline
+    ('z_swing_percent', 'z_swing_percent', FLOAT),
+    ('oz_swing_percent', 'oz_swing_percent', FLOAT),
+    ('whiff_percent', 'whiff_percent', FLOAT),
+    ('swing_percent', 'swing_percent', FLOAT),
+    # Directional tendencies
+    ('pull_percent', 'pull_percent', FLOAT),
+    ('straightaway_percent', 'straightaway_percent', FLOAT),
+    ('opposite_percent', 'opposite_percent', FLOAT),
+    ('groundballs_percent', 'groundballs_percent', FLOAT),
+    ('flyballs_percent', 'flyballs_percent', FLOAT),
+    ('linedrives_percent', 'linedrives_percent', FLOAT),
+    ('popups_percent', 'popups_percent', FLOAT),
+    # Speed
+    ('sprint_speed', 'sprint_speed', FLOAT),
+])
+
+class DailyGameStore:
+    """
+    Memoized access to the daily game files ({year}/{month}/{month}_{day:02d}_{year}.json)
+    Each date is parsed at most once per run and every lookback is served from memory.
+    Returned game data is shared between callers and must be treated as read-only.
+    """
+    
+    def __init__(self, data_path, max_days=90):
+        self.data_path = Path(data_path)
+        self.max_days = max_days
+        self._cache = OrderedDict()  # date -> parsed game data (None if missing/unreadable)
+        self._lock = threading.Lock()  # Loaders may share the store from several threads
+        self.hits = 0
+        self.misses = 0
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']  # Locks don't pickle (warm-start snapshots)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def _as_date(self, check_date):
+        """Accept datetime/date objects or 'YYYY-MM-DD' strings"""
+        if isinstance(check_date, str):
+            return datetime.strptime(check_date, '%Y-%m-%d').date()
+        if isinstance(check_date, datetime):
+            return check_date.date()
+        return check_date
+    
+    def path_for(self, check_date):
+        """Resolve the daily game file path for a date"""
+        check_date = self._as_date(check_date)
+        year = check_date.year
+        month = check_date.strftime('%B').lower()
+        return self.data_path / f"{year}/{month}/{month}_{check_date.day:02d}_{year}.json"
+    
+    def get(self, check_date):
+        """Return parsed game data for a date, or None if no usable file exists"""
+        key = self._as_date(check_date)
+        
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self.misses += 1
+        
+        game_data = None
+        file_path = self.path_for(key)
+        if file_path.exists():
+            try:
+                with open(file_path, 'r') as f:
+                    game_data = json.load(f)
+            except Exception:
+                game_data = None
+        
+        with self._lock:
+            self._cache[key] = game_data
+            if len(self._cache) > self.max_days:
+                self._cache.popitem(last=False)  # Evict least recently used date
+        
+        return game_data
+    
+    def iter_days(self, end_date, days):
+        """Yield (date, 'YYYY-MM-DD', game_data) for each available day, newest first"""
+        end_date = self._as_date(end_date)
+        for days_back in range(days):
+            check_date = end_date - timedelta(days=days_back)
+            game_data = self.get(check_date)
+            if game_data is not None:
+                yield check_date, check_date.strftime('%Y-%m-%d'), game_data
+    
+    def stats(self):
+        """Cache statistics for the run report"""
+        loaded = sum(1 for data in self._cache.values() if data is not None)
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'cached_days': len(self._cache),
+            'loaded_files': loaded
+        }
+
+# Historical stats files for multi-year trends ({prefix}_{year}.csv -> historical_data[year][data type])
+HISTORICAL_YEARS = [2022, 2023, 2024, 2025]
+HISTORICAL_DATA_TYPES = [
+    ('hitter_exit_velocity', 'hitter_exit_velocity'),
+    ('pitcher_exit_velocity', 'pitcher_exit_velocity'),
+    ('hitterpitcharsenalstats', 'hitter_arsenal'),
+    ('pitcherpitcharsenalstats', 'pitcher_arsenal')
+]
+
+# Warm-start snapshot of the loaded analyzer state (bump when loaders change what they build)
+WARM_START_VERSION = 2
+
+# Per-game results cache for incremental re-runs (bump when scoring output changes shape)
+INCREMENTAL_VERSION = 2
+
+# JSON inputs read by the loaders ({date} = target date); missing files are fingerprinted too
+WARM_START_INPUTS = [
+    "rosters.json",
+    "starting_lineups.json",
+    "lineups/starting_lineups_{date}.json",
+    "lineups/starting_lineups_latest.json",
+    "{date}/starting_lineups.json",
+    "{date}/weather_data.json",
+    "weather/current_weather.json",
+    "weather/game_weather.json",
+    "stadium/stadium_hr_analysis.json",
+    "rolling_stats/rolling_stats_last_7_latest.json",
+    "rolling_stats/rolling_stats_current_latest.json",
+    "recent_performance/momentum_analysis.json",
+    "predictions/recent_form_latest.json",
+    "predictions/lineup_analysis_latest.json",
+]
+
+
+def write_output_file(path, data, aliases=(), copies=()):
+    """
+    Publish output bytes atomically (temp file + rename), plus a precompressed .gz sibling
+    `aliases` are hard links to the same file (a copy where links aren't supported);
+    `copies` get their own file for names other tools rewrite in place, which would
+    otherwise write through a link. A reader always sees a complete file.
+    """
+    def replace_with(target, write):
+        temp = Path(f"{target}.{os.getpid()}.tmp")
+        write(temp)
+        os.replace(temp, target)
+    
+    def write_bytes(payload):
+        def write(temp):
+            with open(temp, 'wb') as f:
+                f.write(payload)
+        return write
+    
+    def link_or_copy(source, payload):
+        def write(temp):
+            try:
+                os.link(source, temp)
+            except OSError:
+                write_bytes(payload)(temp)
+        return write
+    
+    compressed = gzip.compress(data, mtime=0)
+    path = Path(path)
+    gz_path = Path(f"{path}.gz")
+    replace_with(path, write_bytes(data))
+    replace_with(gz_path, write_bytes(compressed))
+    for alias in aliases:
+        replace_with(Path(alias), link_or_copy(path, data))
+        replace_with(Path(f"{alias}.gz"), link_or_copy(gz_path, compressed))
+    for copy_path in copies:
+        replace_with(Path(copy_path), write_bytes(data))
+        replace_with(Path(f"{copy_path}.gz"), write_bytes(compressed))
+
+
+# Start times are ordered in Eastern time, the zone MLB schedules are published in
+try:
+    from zoneinfo import ZoneInfo
+    SLATE_TIMEZONE = ZoneInfo('America/New_York')
+except Exception:  # No tz database (e.g. Windows without tzdata): fixed EDT offset
+    SLATE_TIMEZONE = timezone(timedelta(hours=-4))
+
+# Minutes to add to a clock time in a US zone to get Eastern time
+CLOCK_ZONE_OFFSETS = {'ET': 0, 'EDT': 0, 'EST': 0, 'CT': 60, 'CDT': 60, 'CST': 60,
+                      'MT': 120, 'MDT': 120, 'MST': 120, 'PT': 180, 'PDT': 180, 'PST': 180}
+
+# Lite layout: ranked summary columns in the index file (details live in the game shards)
+LITE_INDEX_FIELDS = ['player', 'team', 'pitcher', 'game', 'exploitIndex', 'confidence', 'combinedScore',
+                     'batterClassification', 'keyWeakness']
+# Per-row fields the lite shards drop: game-level values and the timestamp (stored once per file)
+LITE_GAME_FIELDS = ('gameId', 'venue', 'opposingTeam', 'analysisTimestamp')
+
+
+def game_summary(game):
+    """Identity, teams, starters and start time of a lineups-file game"""
+    home_team = game['teams']['home']['abbr']
+    away_team = game['teams']['away']['abbr']
+    return {
+        'gameId': str(game.get('gameId') or f"{away_team}@{home_team}"),
+        'away': away_team,
+        'home': home_team,
+        'venue': game['venue']['name'],
+        'pitchers': {'away': game['pitchers']['away']['name'], 'home': game['pitchers']['home']['name']},
+        'gameTime': game.get('gameTime') or game.get('dateTime') or game.get('time')
+    }
+
+
+def text_key(exploiter):
+    """Deferred text inputs key: one row per game, player and pitcher (doubleheaders stay apart)"""
+    return (exploiter['gameId'], exploiter['player'], exploiter['team'], exploiter['pitcher'])
+
+
+def first_pitch_key(game):
+    """
+    Sort key for first-pitch order: minutes after midnight Eastern
+    ISO date-times are converted to Eastern (naive ones are taken as Eastern already);
+    clock times may carry a US zone suffix ("1:10 PM ET", "7:05 PM PT"). Games without a
+    parseable start time go last.
+    """
+    start = str(game.get('gameTime') or game.get('dateTime') or game.get('time') or '').strip()
+    if ':' not in start:
+        return (1, 0)  # Missing, "TBD" or a bare date
+    
+    try:
+        start_time = datetime.fromisoformat(start.replace('Z', '+00:00'))  # ISO date-time
+        if start_time.tzinfo is not None:
+            start_time = start_time.astimezone(SLATE_TIMEZONE)
+        return (0, start_time.hour * 60 + start_time.minute)
+    except ValueError:
+        pass
+    
+    clock, _, zone = start.upper().rpartition(' ')
+    offset = CLOCK_ZONE_OFFSETS.get(zone)
+    if offset is None:
+        clock, offset = start.upper(), 0
+    for time_format in ('%H:%M', '%I:%M %p', '%I:%M%p'):  # "19:05" / "7:05 PM" / "7:05PM"
+        try:
+            parsed = datetime.strptime(clock, time_format)
+            return (0, parsed.hour * 60 + parsed.minute + offset)
+        except ValueError:
+            continue
+    return (1, 0)
+
+
+def game_fingerprint(game):
+    """Hash of a lineups-file game entry: starters, batting orders, venue and weather"""
+    return hashlib.sha1(json.dumps(game, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def exploiter_rank(exploiter):
+    """Multi-tier ranking key (sorted descending)"""
+    return (
+        exploiter['combinedScore'],
+        len(exploiter.get('situationalAdvantages', [])),
+        1 if exploiter.get('regressionOpportunity') else 0,
+        1 if exploiter.get('contactQualityEdge') else 0
+    )
+
+
+def lite_exploiter(exploiter):
+    """Compact shard row: game-level fields, empty values and the duplicated arsenal analysis dropped"""
+    row = {key: value for key, value in exploiter.items()
+           if key not in LITE_GAME_FIELDS and value is not None and value != {}}
+    modern = row.get('modernAnalytics')
+    if modern:
+        # modernAnalytics.arsenalExploitation repeats the top-level arsenalExploitation
+        row['modernAnalytics'] = {key: value for key, value in modern.items()
+                                  if key != 'arsenalExploitation' and value is not None}
+    return row
+
+
+def file_fingerprint(path):
+    """[size, mtime] of an input file (None if it doesn't exist)"""
+    try:
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime]
+    except OSError:
+        return None
+
+
+class LazySource:
+    """
+    Analyzer data container loaded on first access
+    The first read of the attribute runs its loader method. Containers that share a loader
+    (e.g. hit and HR rankings) are filled by a single loader call. This is a data
+    descriptor, so every read goes through __get__: a container is handed out only once
+    its loader has finished (the loader itself, holding its re-entrant lock, sees the
+    container it is filling), and a thread reading a source that another thread is still
+    loading waits for that load instead of seeing a partly filled container.
+    """
+    
+    def __init__(self, loader, factory=dict, source=None, index_ids=False):
+        self.loader = loader
+        self.factory = factory
+        self.source = source
+        self.index_ids = index_ids
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.source = self.source or name
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if self.name in instance.ready_sources:
+            return instance.__dict__[self.name]
+        
+        with instance.loader_lock(self.loader):
+            if self.name not in instance.__dict__:
+                # Empty container first, so the loader (and sibling containers) can fill it in place
+                instance.__dict__[self.name] = self.factory()
+            
+            if self.loader not in instance.loaded_sources:
+                started = time.time()
+                instance.loaded_sources[self.loader] = None
+                getattr(instance, self.loader)()
+                instance.loaded_sources[self.loader] = (self.source, time.time() - started)
+            
+            container = instance.__dict__[self.name]
+            if instance.loaded_sources[self.loader] is None:
+                return container  # Read by its own (still running) loader: not published yet
+            
+            if self.index_ids:
+                # Key the player table by canonical player ID as soon as it is loaded
+                container.index_ids(instance.player_registry)
+            instance.ready_sources.add(self.name)
+            return container
+    
+    def __set__(self, instance, value):
+        # Loaders may replace their container outright; readers still go through __get__
+        instance.__dict__[self.name] = value
+
+
+def pitch_category(pitch_name):
+    """Pitch family used by the arsenal matchup rules (None for anything unclassified)"""
+    pitch_name = pitch_name.lower()
+    if any(fb in pitch_name for fb in ['4-seam', 'fastball', 'sinker', '2-seam']):
+        return 'fastball'
+    if any(x in pitch_name for x in ['slider', 'cutter']):
+        return 'slider'
+    if 'curve' in pitch_name:
+        return 'curve'
+    if any(x in pitch_name for x in ['change', 'split', 'fork']):
+        return 'offspeed'
+    return None
+
+
+# Analyzer, games and date shared with forked game workers (set only while a pool runs)
+_FORK_STATE = None
+
+
+def fork_available():
+    """True where worker processes can inherit loaded data by fork (not Windows)"""
+    import multiprocessing
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _analyze_game_worker(game_index):
+    """Pool worker: analyze one game of the forked analyzer's slate, capturing its log output"""
+    import io
+    from contextlib import redirect_stdout
+    
+    analyzer, games, date = _FORK_STATE
+    first_matchup = len(analyzer.slate_matchups)
+    deferred_before = set(analyzer.deferred_text)
+    log = io.StringIO()
+    with redirect_stdout(log):
+        exploiters = analyzer.analyze_game(games[game_index], date)
+    deferred_text = {key: value for key, value in analyzer.deferred_text.items() if key not in deferred_before}
+    return exploiters, analyzer.slate_matchups[first_matchup:], deferred_text, log.getvalue()
+
+
+class PitcherContext:
+    """
+    Pitcher-only derived values for one starter, built once per run
+    Multi-year regression, arsenal summaries, exploitation windows, handedness, league
+    rankings and data availability don't depend on the hitter, so every opposing
+    hitter's analysis reads them from here instead of re-deriving them.
+    """
+
+    def __init__(self, analyzer, pitcher_name):
+        normalized_name = analyzer.normalize_name(pitcher_name)
+        self.name = pitcher_name
+        self.normalized_name = normalized_name
+        self.hand = analyzer.get_pitcher_handedness(pitcher_name)
+
+        # Multi-year regression (shared by every hitter; treat as read-only)
+        self.regression = analyzer.analyze_multi_year_pitcher_regression(pitcher_name)
+        self.historical_years = sum(
+            1 for year in [2025, 2024, 2023, 2022]
+            if year in analyzer.historical_data
+            and 'pitcher_exit_velocity' in analyzer.historical_data[year]
+            and normalized_name in analyzer.historical_data[year]['pitcher_exit_velocity']
+        )
+
+        # Arsenal: summaries plus the parsed pitch list the matchup rules iterate
+        self.has_arsenal = normalized_name in analyzer.pitcher_arsenal
+        self.arsenal_vulnerability = analyzer.calculate_arsenal_vulnerability(normalized_name)
+        self.exploitation_windows = analyzer.identify_exploitation_windows(normalized_name)
+        self.arsenal_pitches = []
+        if self.has_arsenal:
+            for pitch_data in analyzer.pitcher_arsenal[normalized_name]['pitch_types'].values():
+                usage_percent = float(pitch_data.get('usage_percent', 0))
+                if usage_percent < 8:  # Skip pitches with very low usage
+                    continue
+                self.arsenal_pitches.append({
+                    'pitch_name': pitch_data['pitch_name'],
+                    'category': pitch_category(pitch_data['pitch_name']),
+                    'ba_against': float(pitch_data.get('ba_against', 0)),
+                    'slg_against': float(pitch_data.get('slg_against', 0)),
+                    'usage_percent': usage_percent,
+                    'whiff_percent': float(pitch_data.get('whiff_percent', 0)),
+                    'zone_percent': float(pitch_data.get('zone_percent', 0))
+                })
+
+        # Data availability
+        self.in_custom_pitchers = normalized_name in analyzer.custom_pitchers
+        self.in_exit_velocity = normalized_name in analyzer.pitcher_exit_velocity
+        self.barrel_rate_allowed = 0
+        if self.in_exit_velocity:
+            self.barrel_rate_allowed = analyzer.pitcher_exit_velocity[normalized_name]['real_barrel_rate_allowed']
+
+        # League position (None when the pitcher isn't ranked)
+        self.hits_rank = None
+        self.hrs_rank = None
+        if normalized_name in analyzer.pitcher_hits_rankings:
+            self.hits_rank = analyzer.pitcher_hits_rankings[normalized_name].get('league_rank_hits', 999)
+        if normalized_name in analyzer.pitcher_hrs_rankings:
+            self.hrs_rank = analyzer.pitcher_hrs_rankings[normalized_name].get('league_rank_hrs', 999)
+
+
+class BatterContext:
+    """
+    Opponent-independent values for one hitter, built once per run
+    Quality metrics, contact/discipline profile, expected stats gap, trend, recent form
+    and lineup slot never depend on the pitcher, so every matchup the hitter appears in
+    (multi-pitcher slates, fallback runs, what-if reruns) reads them from here.
+    """
+
+    def __init__(self, analyzer, batter_name):
+        normalized_name = analyzer.normalize_name(batter_name)
+        self.name = batter_name
+        self.normalized_name = normalized_name
+        self.hand = analyzer.get_batter_handedness(batter_name)
+
+        # Raw records (None when the source has no entry for this hitter)
+        self.custom_data = analyzer.find_batter_data(batter_name)
+        self.exit_velocity = analyzer.hitter_exit_velocity.get(normalized_name)
+        self.trend = analyzer.batter_trends.get(normalized_name)
+        self.recent_form = analyzer.recent_form_data.get(normalized_name)
+        self.lineup = analyzer.lineup_data.get(normalized_name)
+
+        self.quality_multiplier = analyzer.calculate_batter_quality_multiplier(self.custom_data)
+        self.expected_stats_gap = analyzer.calculate_expected_stats_gap(normalized_name)
+        self.data_sources_count = sum(1 for record in (self.custom_data, self.exit_velocity, self.trend,
+                                                       self.recent_form, self.lineup) if record is not None)
+
+        # Swing path analysis per pitcher hand, filled on first use
+        self.swing_optimization = {}
+
+        # Batter-only columns of the batch scorer's feature row
+        self.features = {}
+        custom_data = self.custom_data
+        if custom_data:
+            self.features.update(
+                has_custom=1.0,
+                barrel_percent=float(custom_data.get('barrel_percent', 0)),
+                bb_percent=float(custom_data.get('bb_percent', 0)),
+                k_percent=float(custom_data.get('k_percent', 0)),
+                sprint_speed=float(custom_data.get('sprint_speed', 0)),
+                xba_diff=float(custom_data.get('xba_diff', 0)),
+                xslg_diff=float(custom_data.get('xslg_diff', 0)),
+                sweet_spot_percent=float(custom_data.get('sweet_spot_percent', 0)),
+                whiff_percent=float(custom_data.get('whiff_percent', 0)),
+                z_swing_percent=float(custom_data.get('z_swing_percent', 0)),
+                oz_swing_percent=float(custom_data.get('oz_swing_percent', 0))
+            )
+        if self.exit_velocity is not None:
+            self.features.update(has_ev=1.0, ev_barrel_rate=self.exit_velocity['real_barrel_rate'],
+                                 ev_max_velo=self.exit_velocity['max_hit_speed'])
+        if self.trend is not None:
+            self.features['trend'] = {'hot': 1.0, 'cold': -1.0}.get(self.trend['trend'], 0.0)
+        form_data = self.recent_form
+        if form_data is not None:
+            self.features.update(has_form=1.0, form_hot_streak=float(bool(form_data.get('hot_streak', False))),
+                                 form_last_7_avg=form_data.get('last_7_avg', 0),
+                                 form_last_7_hr=form_data.get('last_7_hr', 0),
+                                 form_trend={'improving': 1.0, 'declining': -1.0}.get(form_data.get('trend_direction'), 0.0),
+                                 form_cold_streak=float(bool(form_data.get('cold_streak', False))))
+        lineup_info = self.lineup
+        if lineup_info is not None:
+            self.features.update(has_lineup=1.0, rbi_factor=lineup_info.get('rbi_opportunities', 1.0),
+                                 run_factor=lineup_info.get('run_scoring_opportunities', 1.0),
+                                 protection=lineup_info.get('protection_quality', 0.5),
+                                 heart_of_order=float('heart_of_order' in lineup_info.get('lineup_context', [])))
+
+
 class EnhancedWeakspotAnalyzer:
-    def __init__(self, base_path=None, target_date=None):
+    # Data sources, loaded on first access (declared in full-load order)
+    starting_pitchers = LazySource('identify_starting_pitchers', list)
+    starter_name_index = LazySource('identify_starting_pitchers', NameIndex, source='starting_pitchers')
+    player_registry = LazySource('load_player_registry', PlayerRegistry)
+    participants = LazySource('identify_participants', lambda: None)  # None = no slate filter
+    hitter_exit_velocity = LazySource('load_hitter_exit_velocity_data', PlayerTable, index_ids=True)
+    pitcher_exit_velocity = LazySource('load_pitcher_exit_velocity_data', PlayerTable, index_ids=True)
+    custom_batters = LazySource('load_custom_batter_data', PlayerTable, index_ids=True)
+    batter_name_index = LazySource('build_batter_name_index', NameIndex)
+    custom_pitchers = LazySource('load_custom_pitcher_data', PlayerTable, index_ids=True)
+    pitcher_arsenal = LazySource('load_pitcher_arsenal_data', PlayerTable, index_ids=True)
+    handedness_data = LazySource('load_handedness_data', PlayerTable, index_ids=True)
+    rosters = LazySource('load_roster_data', PlayerTable, index_ids=True)
+    batted_ball_handedness = LazySource('load_batted_ball_handedness_data', PlayerTable, index_ids=True)  # L/L, L/R, R/L, R/R matchup data
+    swing_path_data = LazySource('load_swing_path_data', PlayerTable, index_ids=True)  # Swing mechanics by handedness (all/LHP/RHP)
+    historical_data = LazySource('load_historical_multi_year_data')  # Multi-year data (2022-2025)
+    comprehensive_batter_stats = LazySource('load_comprehensive_batter_stats', PlayerTable, index_ids=True)  # Enhanced batter metrics
+    recent_performance = LazySource('load_recent_performance_data')
+    park_factors = LazySource('load_park_factors')
+    stadium_hr_data = LazySource('load_stadium_hr_data')  # stadium HR baseline data
+    stadium_venue_matches = LazySource('load_stadium_hr_data', source='stadium_hr_data')  # normalized venue -> resolved stadium entry
+    venue_series_index = LazySource('load_venue_series_index')  # normalized venue -> recent Final games
+    weather_context = LazySource('load_weather_context')
+    recent_form_data = LazySource('load_recent_form_data')
+    lineup_data = LazySource('load_lineup_data')
+    batter_trends = LazySource('calculate_trends', source='trends')
+    pitcher_trends = LazySource('calculate_trends', source='trends')
+    pitcher_hits_rankings = LazySource('load_pitcher_ranking_data', source='pitcher_rankings')
+    pitcher_hrs_rankings = LazySource('load_pitcher_ranking_data', source='pitcher_rankings')
+    starter_allowed_totals = LazySource('load_pitcher_ranking_data', source='pitcher_rankings')  # 60-day hits/HRs per starter
+    
+    # Loaders that read other sources while loading (ID-indexed tables also need the registry).
+    # Only a scheduling hint for --load-threads: an undeclared read just waits for that loader
+    LOADER_DEPENDENCIES = {
+        'identify_participants': ['identify_starting_pitchers', 'load_player_registry', 'load_roster_data'],
+        'build_batter_name_index': ['load_custom_batter_data'],
+        'load_historical_multi_year_data': ['identify_participants'],
+        'load_lineup_data': ['load_roster_data'],
+        'calculate_trends': ['load_recent_performance_data'],
+        'load_pitcher_ranking_data': ['identify_starting_pitchers'],
+    }
+    
+    def __init__(self, base_path=None, target_date=None, eager_load=False, participants_only=True, scoring_model=None,
+                 text_top_n=None, text_scope='overall', workers=1, load_threads=1, stream=False,
+                 incremental=False):
         # Use centralized data configuration
         self.base_path = DATA_PATH.parent  # BaseballData
         self.stats_path = DATA_PATH / "stats"
         self.data_path = DATA_PATH
         self.target_date = target_date or datetime.now().strftime('%Y-%m-%d')
+        self.participants_only = participants_only  # Keep only today's players in bulk loads
         
-        # Professional data containers
-        self.hitter_exit_velocity = {}
-        self.pitcher_exit_velocity = {}
-        self.custom_batters = {}
-        self.custom_pitchers = {}
-        self.pitcher_arsenal = {}
-        self.handedness_data = {}
-        self.rosters = {}
+        # Data containers are LazySource attributes; this tracks which loaders ran
+        self.loaded_sources = {}  # loader -> (source, seconds)
+        self.loader_locks = {}    # loader -> lock held while it runs
+        self.ready_sources = set()  # containers whose loader finished (read without locking)
+        self.load_threads = load_threads  # Threads for the up-front load stage (1 = serial)
         
         # Enhanced analytics containers
-        self.recent_performance = {}
         self.platoon_splits = {}
         self.situational_stats = {}
-        self.pitcher_trends = {}
-        self.batter_trends = {}
-        self.park_factors = {}
-        self.weather_context = {}
-        self.recent_form_data = {}
-        self.lineup_data = {}
-        
-        # NEW: Pitcher ranking data containers
-        self.pitcher_hits_rankings = {}
-        self.pitcher_hrs_rankings = {}
-        self.starting_pitchers = []  # Will be populated from lineups
-        
-        # PHASE 1 ENHANCEMENT: New CSV data sources for comprehensive analysis
-        self.batted_ball_handedness = {}  # L/L, L/R, R/L, R/R matchup data
-        self.swing_path_data = {}         # Swing mechanics by handedness (all/LHP/RHP)
-        self.historical_data = {}         # Multi-year data (2022-2025)
-        self.comprehensive_batter_stats = {}  # Enhanced batter metrics
+        
+        # Shared daily game file cache (parsed once per run, reused by every lookback)
+        self.daily_games = DailyGameStore(self.data_path)
+        
+        # Feature/selection rows and scalar exploit score for every matchup scored this run
+        self.slate_matchups = []
+        
+        # Weight/threshold model (a custom one scores every lineup's feature rows as well as selecting)
+        self.scoring_model = scoring_model or DEFAULT_MODEL
+        
+        # Key weakness/justification text: None builds it for every exploiter, N only for the top N
+        # ranked overall or per game ('overall' / 'game'); the rest keep their analyses for on-demand text
+        self.text_top_n = text_top_n
+        self.text_scope = text_scope
+        self.deferred_text = {}  # text_key -> (pitcher_analysis, exploit_analysis, modern_analytics)
+        
+        # Lineups-file games of the slate (game_summary), for the per-game output layouts
+        self.slate_games = []
+        
+        # Incremental re-runs: rescore only games whose lineup fingerprint changed
+        self.incremental = incremental
+        
+        # Streaming mode: games in first-pitch order, each published as soon as it finishes
+        self.stream = stream
+        
+        # Games analyzed in parallel by forked worker processes (1 = serial)
+        self.workers = workers
+        
+        # Pitcher-only derived values, built once per starter (pitcher name -> PitcherContext)
+        self.pitcher_contexts = {}
+        # Opponent-independent hitter values, built once per batter (batter name -> BatterContext)
+        self.batter_contexts = {}
         
         print("🚀 Enhanced Weakspot Analyzer V3.0 initializing...")
-        self.load_all_data()
+        if eager_load:
+            self.load_all_data()
+    
+    def get_pitcher_context(self, pitcher_name):
+        """PitcherContext for a starter (built on first use, then shared by every opposing hitter)"""
+        context = self.pitcher_contexts.get(pitcher_name)
+        if context is None:
+            context = self.pitcher_contexts[pitcher_name] = PitcherContext(self, pitcher_name)
+        return context
+    
+    def get_batter_context(self, batter_name):
+        """BatterContext for a hitter (built on first use, then reused for every opposing pitcher)"""
+        context = self.batter_contexts.get(batter_name)
+        if context is None:
+            context = self.batter_contexts[batter_name] = BatterContext(self, batter_name)
+        return context
+    
+    def data_sources(self):
+        """Every lazily loaded data source, in full-load order"""
+        sources = []
+        for attribute in vars(type(self)).values():
+            if isinstance(attribute, LazySource) and attribute.source not in sources:
+                sources.append(attribute.source)
+        return sources
+    
+    def loader_lock(self, loader):
+        """Re-entrant lock for one loader (a loader may read its sibling containers)"""
+        return self.loader_locks.setdefault(loader, threading.RLock())
+    
+    def loader_dependencies(self):
+        """Loader -> loaders that must finish first (declared reads plus the player registry)"""
+        dependencies = {}
+        for attribute in vars(type(self)).values():
+            if isinstance(attribute, LazySource):
+                required = dependencies.setdefault(attribute.loader, set())
+                required.update(self.LOADER_DEPENDENCIES.get(attribute.loader, []))
+                if attribute.index_ids:
+                    required.add('load_player_registry')
+        return dependencies
+    
+    def load_sources_concurrently(self, threads):
+        """Run independent loaders on a thread pool, each as soon as its dependencies finish"""
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        
+        loaders = {}  # loader -> first attribute it fills
+        for name, attribute in vars(type(self)).items():
+            if isinstance(attribute, LazySource):
+                loaders.setdefault(attribute.loader, name)
+        dependencies = self.loader_dependencies()
+        
+        started = time.time()
+        pending, running, finished = dict(loaders), {}, set()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            while pending or running:
+                for loader in [l for l in pending if dependencies[l] & set(loaders) <= finished]:
+                    running[pool.submit(getattr, self, pending.pop(loader))] = loader
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()  # Surface loader errors as the serial path would
+                    finished.add(running.pop(future))
+        wall = time.time() - started
+        
+        timings = [entry for entry in self.loaded_sources.values() if entry]
+        slowest = max(timings, key=lambda entry: entry[1], default=('none', 0.0))
+        print(f"⏱️ Concurrent load: {len(loaders)} loaders on {threads} threads in {wall:.2f}s wall "
+              f"({sum(seconds for _, seconds in timings):.2f}s summed, slowest {slowest[0]} {slowest[1]:.2f}s)")
     
     def load_all_data(self):
-        """Load all data including enhanced analytics"""
+        """Load every data source up front (otherwise each loads on first access)"""
         print("📊 Loading enhanced baseball analytics data...")
         
-        # OPTIMIZATION: First identify today's starting pitchers
-        self.identify_starting_pitchers()
-        
-        # Load base data
-        self.load_hitter_exit_velocity_data()
-        self.load_pitcher_exit_velocity_data()
-        self.load_custom_batter_data()
-        self.load_custom_pitcher_data()
-        self.load_pitcher_arsenal_data()
-        self.load_handedness_data()
-        self.load_roster_data()
-        
-        # PHASE 1 ENHANCEMENT: Load new comprehensive data sources
-        self.load_batted_ball_handedness_data()
-        self.load_swing_path_data()
-        self.load_historical_multi_year_data()
-        self.load_comprehensive_batter_stats()
-        
-        # Load enhanced data
-        self.load_recent_performance_data()
-        self.load_park_factors()
-        self.load_weather_context()
-        self.load_recent_form_data()
-        self.load_lineup_data()
-        self.calculate_trends()
-        
-        # NEW: Load pitcher ranking data ONLY for today's starters
-        self.load_pitcher_ranking_data()
+        if self.load_threads > 1:
+            self.load_sources_concurrently(self.load_threads)
+        
+        for name, attribute in vars(type(self)).items():
+            if isinstance(attribute, LazySource):
+                getattr(self, name)
         
         total_data_points = (len(self.hitter_exit_velocity) + len(self.pitcher_exit_velocity) + 
                            len(self.custom_batters) + len(self.custom_pitchers))
-        
         print(f"✅ Enhanced data loading complete: {total_data_points} total data points")
     
+    def warm_start_file(self):
+        return self.data_path / ".warm_start" / f"weakspot_analyzer_{self.target_date}.pickle"
+    
+    def input_fingerprints(self, game_dates):
+        """Fingerprint every input the loaders read: stats CSVs, JSON inputs and the daily game files"""
+        paths = sorted(self.stats_path.glob("*.csv"))
+        paths += [self.data_path / name.format(date=self.target_date) for name in WARM_START_INPUTS]
+        paths += [self.daily_games.path_for(game_date) for game_date in game_dates]
+        return {str(path): file_fingerprint(path) for path in paths}
+    
+    def save_warm_start(self):
+        """Snapshot the fully loaded data sources (call after load_all_data)"""
+        import pickle
+        
+        sources = {name: self.__dict__[name] for name, attribute in vars(type(self)).items()
+                   if isinstance(attribute, LazySource) and name in self.__dict__}
+        game_dates = list(self.daily_games._cache)
+        snapshot = {
+            'version': WARM_START_VERSION,
+            'target_date': self.target_date,
+            'built_on': datetime.now().strftime('%Y-%m-%d'),  # Lookback windows count back from today
+            'participants_only': self.participants_only,
+            'fingerprints': self.input_fingerprints(game_dates),
+            'game_dates': game_dates,
+            'loaded_sources': self.loaded_sources,
+            'daily_games': self.daily_games,
+            'sources': sources
+        }
+        
+        snapshot_file = self.warm_start_file()
+        try:
+            snapshot_file.parent.mkdir(exist_ok=True)
+            temp_file = snapshot_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_file, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, snapshot_file)
+            print(f"♨️ Warm-start snapshot saved: {len(sources)} sources → {snapshot_file}")
+        except Exception as e:
+            print(f"   ⚠️ Could not save warm-start snapshot: {e}")
+    
+    def restore_warm_start(self):
+        """Restore the loaded data sources from a snapshot built today whose input fingerprints still match"""
+        import pickle
+        
+        snapshot_file = self.warm_start_file()
+        if not snapshot_file.exists():
+            return False
+        
+        started = time.time()
+        try:
+            with open(snapshot_file, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            print(f"   ⚠️ Unreadable warm-start snapshot, doing a full load: {e}")
+            return False
+        
+        if (snapshot.get('version') != WARM_START_VERSION or snapshot.get('target_date') != self.target_date
+                or snapshot.get('participants_only') != self.participants_only):
+            print("♨️ Warm-start snapshot is for another version/date, doing a full load")
+            return False
+        if snapshot.get('built_on') != datetime.now().strftime('%Y-%m-%d'):
+            # Recent performance, pitcher rankings and trends look back from the wall clock, so an
+            # older snapshot's windows miss daily files that have come into range since
+            print(f"♨️ Warm-start snapshot was built on {snapshot.get('built_on')}, doing a full load")
+            return False
+        if snapshot['fingerprints'] != self.input_fingerprints(snapshot['game_dates']):
+            print("♨️ Inputs changed since the warm-start snapshot, doing a full load")
+            return False
+        
+        self.__dict__.update(snapshot['sources'])
+        self.loaded_sources.update(snapshot['loaded_sources'])
+        self.daily_games = snapshot['daily_games']
+        print(f"♨️ Warm start: restored {len(snapshot['sources'])} sources in {time.time() - started:.2f}s")
+        return True
+    
+    def incremental_cache_file(self, date):
+        return self.data_path / ".incremental" / f"weakspot_games_{date}.pickle"
+    
+    def run_fingerprint(self, game_dates):
+        """
+        Everything besides a game's own lineups that its scores depend on: inputs, scoring
+        model, text mode and the slate-wide pitcher rankings (each starter's hits/HR rank is
+        relative to the day's other starters, so announcing a TBD starter can move them)
+        """
+        inputs = {path: fingerprint for path, fingerprint in self.input_fingerprints(game_dates).items()
+                  if 'starting_lineups' not in Path(path).name}
+        rankings = json.dumps([self.pitcher_hits_rankings, self.pitcher_hrs_rankings], sort_keys=True, default=str)
+        return {
+            'inputs': inputs,
+            'scoring_model': json.dumps(self.scoring_model, sort_keys=True, default=str),
+            'participants_only': self.participants_only,
+            'eager_text': self.text_top_n is None,
+            'slate_rankings': hashlib.sha1(rankings.encode('utf-8')).hexdigest()
+        }
+    
+    def load_incremental_cache(self, date):
+        """Previous run's per-game results (game fingerprint -> pickled payload) if still valid"""
+        import pickle
+        
+        cache_file = self.incremental_cache_file(date)
+        if not cache_file.exists():
+            print("♻️ No previous run for this date, scoring every game")
+            return {}
+        try:
+            with open(cache_file, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception as e:
+            print(f"   ⚠️ Unreadable incremental cache, scoring every game: {e}")
+            return {}
+        
+        if cache.get('version') != INCREMENTAL_VERSION or cache.get('run') != self.run_fingerprint(cache['game_dates']):
+            print("♻️ Stats inputs, settings or slate pitcher rankings changed since the previous run, scoring every game")
+            return {}
+        return cache['games']
+    
+    def cached_game(self, exploiters, matchups):
+        """Pickled payload of one game's results (exploiters, matchup records and deferred text inputs)"""
+        import pickle
+        
+        deferred = {key: self.deferred_text[key] for key in map(text_key, exploiters) if key in self.deferred_text}
+        return pickle.dumps((exploiters, matchups, deferred), protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def restore_cached_game(self, payload):
+        """Unpack a cached game back into this run (returns its exploiters and matchup records)"""
+        import pickle
+        
+        exploiters, matchups, deferred = pickle.loads(payload)
+        self.deferred_text.update(deferred)
+        return exploiters, matchups
+    
+    def save_incremental_cache(self, date, game_cache):
+        """Persist this run's per-game results keyed by game fingerprint"""
+        import pickle
+        
+        game_dates = list(self.daily_games._cache)
+        cache = {
+            'version': INCREMENTAL_VERSION,
+            'run': self.run_fingerprint(game_dates),
+            'game_dates': game_dates,
+            'games': game_cache
+        }
+        cache_file = self.incremental_cache_file(date)
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_file, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except Exception as e:
+            print(f"   ⚠️ Could not save incremental cache: {e}")
+    
+    def load_player_registry(self):
+        """Canonical player IDs (persisted, refreshed only when rosters/CSVs change)"""
+        self.player_registry = PlayerRegistry.load(self.data_path, self.stats_path)
+        print(f"   🆔 Player registry: {len(self.player_registry)} players")
+    
+    def identify_participants(self):
+        """Resolve today's starters and lineup-team hitters so bulk loaders can skip everyone else"""
+        if not self.participants_only:
+            return
+        
+        lineups_data = self.load_starting_lineups(self.target_date)
+        if not lineups_data or 'games' not in lineups_data or not self.rosters:
+            print("   ⚠️ No lineups/rosters for participant filter, loading all players")
+            return
+        
+        slate_teams = set()
+        for game in lineups_data['games']:
+            slate_teams.add(game['teams']['home']['abbr'])
+            slate_teams.add(game['teams']['away']['abbr'])
+        
+        participants = ParticipantSet(self.player_registry)
+        for starter in self.starting_pitchers:
+            participants.add(starter)
+        
+        for player_name, player_data in self.rosters.items():
+            team = player_data.get('team', '')
+            if any(teams_match(team, slate_team) for slate_team in slate_teams):
+                participants.add(player_name, player_data.get('playerId'), team)
+                participants.add(player_data.get('fullName', ''), player_data.get('playerId'), team)
+        
+        self.participants = participants
+        print(f"🎯 Slate participants: {len(participants)} players on {len(slate_teams)} teams")
+    
+    def print_memory_report(self):
+        """Resident size of each loaded player stat table vs the same data as dict-of-dicts"""
+        print("🧮 Memory report (slotted records vs equivalent dicts):")
+        total_records = total_dicts = 0
+        for name, attribute in vars(type(self)).items():
+            container = self.__dict__.get(name)
+            if not isinstance(attribute, LazySource) or not holds_records(container):
+                continue
+            
+            record_bytes = deep_sizeof(container)
+            dict_bytes = deep_sizeof(as_dicts(container))
+            total_records += record_bytes
+            total_dicts += dict_bytes
+            print(f"      • {name}: {dict_bytes / 1024:.0f} KB → {record_bytes / 1024:.0f} KB")
+        
+        if total_dicts:
+            print(f"   📉 Player tables: {total_dicts / 1024:.0f} KB → {total_records / 1024:.0f} KB "
+                  f"({100 * (1 - total_records / total_dicts):.0f}% smaller)")
+    
+    def print_batch_scoring_report(self):
+        """Re-score every matchup of the run in one vectorized pass and check it against the scalar path"""
+        candidates = [matchup for matchup in self.slate_matchups if matchup['selection'] is not None]
+        if self.scoring_model is not DEFAULT_MODEL:
+            # Scores were written from the model itself (apply_scoring_model), so there's no scalar score to check
+            if candidates:
+                matrix_data = {
+                    'features': feature_matrix(matchup['features'] for matchup in candidates),
+                    'selection': feature_matrix((matchup['selection'] for matchup in candidates), SELECTION_DEFAULTS)
+                }
+                result = rescore(matrix_data, self.scoring_model)
+                print(f"⚖️ Scoring model: {int(result['selected'].sum())}/{len(candidates)} matchups selected")
+            return
+        
+        rows = [matchup['features'] for matchup in self.slate_matchups]
+        check = verify_batch_scores(rows, [matchup['score'] for matchup in self.slate_matchups])
+        if check is None:
+            if rows:
+                print("   ⚠️ numpy not available, skipping batch scoring check")
+            return
+        
+        print(f"⚡ Batch scoring: {check['matchups']} matchups re-scored in {check['score_ms']:.2f} ms "
+              f"(matrix built in {check['build_ms']:.2f} ms), max deviation {check['max_delta']:.3f}")
+        if check['mismatches']:
+            print(f"   ⚠️ {check['mismatches']} matchups differ from the scalar score beyond tolerance")
+    
+    def save_feature_matrix(self, date):
+        """Persist the slate's feature matrix (stage one) for re-scoring with other models"""
+        output_dir = self.data_path / "weakspot_exploiters"
+        output_dir.mkdir(exist_ok=True)
+        matrix_file = output_dir / f"weakspot_feature_matrix_{date}.json"
+        try:
+            written = save_feature_matrix(matrix_file, self.slate_matchups, date)
+            print(f"💾 Feature matrix saved: {written} matchups → {matrix_file}")
+        except Exception as e:
+            print(f"   ⚠️ Could not save feature matrix: {e}")
+    
+    def attach_stats_snapshot(self):
+        """Map stats columns from the host's published snapshot instead of parsing the CSVs"""
+        snapshot = STATS_CATALOG.attach_snapshot(stats_snapshot_dir(self.stats_path))
+        if snapshot is None:
+            print("🧊 No stats snapshot published yet, loading tables privately")
+            return None
+        stale = snapshot.stale_sources()
+        print(f"🧊 Stats snapshot {snapshot.stamp} attached: {len(snapshot.table_meta) - len(stale)} tables shared"
+              + (f", {len(stale)} stale (reloaded from CSV)" if stale else ""))
+        return snapshot
+    
+    def publish_stats_snapshot(self, snapshot=None):
+        """Publish this run's stats tables when the attached snapshot is missing, stale or incomplete"""
+        loaded = set(STATS_CATALOG.report())
+        if snapshot is not None and not snapshot.is_stale() and \
+                loaded <= {Path(path).name for path in snapshot.table_meta}:
+            return
+        try:
+            manifest = STATS_CATALOG.publish_snapshot(stats_snapshot_dir(self.stats_path))
+            print(f"🧊 Stats snapshot {manifest['stamp']} published: {len(manifest['tables'])} tables")
+        except Exception as e:
+            print(f"   ⚠️ Could not publish stats snapshot: {e}")
+    
+    def print_data_source_report(self):
+        """Run report: which data sources were actually loaded, and the shared file caches"""
+        touched = [entry for entry in self.loaded_sources.values() if entry]
+        touched_names = {source for source, seconds in touched}
+        skipped = [source for source in self.data_sources() if source not in touched_names]
+        
+        print(f"📦 Data sources touched: {len(touched_names)}/{len(touched_names) + len(skipped)}")
+        for source, seconds in touched:
+            print(f"      • {source} ({seconds:.2f}s)")
+        if skipped:
+            print(f"   💤 Never loaded: {', '.join(skipped)}")
+        
+        shared_files = {name: consumers for name, consumers in STATS_CATALOG.report().items() if len(consumers) > 1}
+        print(f"   🗃️ Stats catalog: {len(STATS_CATALOG)} files parsed once, "
+              f"{len(shared_files)} shared by multiple loaders")
+        for file_name, consumers in shared_files.items():
+            print(f"      • {file_name}: {', '.join(consumers)}")
+        
+        store_stats = self.daily_games.stats()
+        print(f"   🗂️ Daily game store: {store_stats['loaded_files']} files parsed, "
+              f"{store_stats['hits']} cache hits, {store_stats['misses']} misses")
+    
     def identify_starting_pitchers(self):
         """Identify today's starting pitchers from lineups to optimize data loading"""
         print(f"🎯 Identifying starting pitchers for {self.target_date}...")
@@ -160,6 +1284,7 @@ class EnhancedWeakspotAnalyzer:
                 
                 # Remove duplicates
                 self.starting_pitchers = list(set(self.starting_pitchers))
+                self.starter_name_index = NameIndex(([starter], starter) for starter in self.starting_pitchers)
                 print(f"   ⚾ Found {len(self.starting_pitchers)} starting pitchers for today")
             else:
                 print("   ⚠️ No lineups data available, will load all pitcher data")
@@ -173,26 +1298,12 @@ class EnhancedWeakspotAnalyzer:
         
         # Load last 10 games of data
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=10)
         
         games_analyzed = 0
-        for i in range(10):
-            check_date = end_date - timedelta(days=i)
-            date_str = check_date.strftime('%Y-%m-%d')
-            
-            # Try to load game data
+        for check_date, date_str, game_data in self.daily_games.iter_days(end_date, 10):
             try:
-                year = check_date.year
-                month = check_date.strftime('%B').lower()
-                day = check_date.day
-                
-                file_path = self.data_path / f"{year}/{month}/{month}_{day:02d}_{year}.json"
-                
-                if file_path.exists():
-                    with open(file_path, 'r') as f:
-                        game_data = json.load(f)
-                        self.process_recent_game_data(game_data, date_str)
-                        games_analyzed += 1
+                self.process_recent_game_data(game_data, date_str)
+                games_analyzed += 1
             except Exception as e:
                 continue
         
@@ -637,151 +1748,13 @@ class EnhancedWeakspotAnalyzer:
         print(f"📊 Loading pitcher ranking data for {len(self.starting_pitchers)} starting pitchers...")
         
         try:
-            # Use similar logic to PitcherHitsAllowedCard and PitcherHRsAllowedCard
-            from datetime import datetime, timedelta
+            # OPTIMIZATION: Only process today's starting pitchers (with flexible matching)
+            pitcher_totals, dates_processed = self.pitcher_allowed_totals(
+                lambda normalized_pitcher_name: normalized_pitcher_name in self.starter_name_index)
+            self.starter_allowed_totals.update(pitcher_totals)  # Kept so a replacement starter can be ranked in
             
-            # Get current date and look back for analysis
-            current_date = datetime.now()
-            
-            # Load recent game data to build pitcher rankings (last 60 days)
-            pitcher_hits_analysis = {}
-            pitcher_hrs_analysis = {}
-            dates_processed = 0
-            
-            for days_back in range(60):
-                check_date = current_date - timedelta(days=days_back)
-                date_str = check_date.strftime('%Y-%m-%d')
-                
-                try:
-                    year = check_date.year
-                    month = check_date.strftime('%B').lower()
-                    day = check_date.day
-                    
-                    file_path = self.data_path / f"{year}/{month}/{month}_{day:02d}_{year}.json"
-                    
-                    if file_path.exists():
-                        with open(file_path, 'r') as f:
-                            game_data = json.load(f)
-                            
-                        if 'players' in game_data:
-                            # Process pitchers for ranking analysis
-                            pitchers = [p for p in game_data['players'] 
-                                      if p.get('playerType') == 'pitcher' 
-                                      and p.get('H', 'DNP') != 'DNP' 
-                                      and p.get('HR', 'DNP') != 'DNP']
-                            
-                            for pitcher in pitchers:
-                                # OPTIMIZATION: Only process today's starting pitchers
-                                normalized_pitcher_name = self.normalize_name(pitcher['name'])
-                                
-                                # Check if this pitcher is one of today's starters (with flexible matching)
-                                is_starting_pitcher = False
-                                for starter in self.starting_pitchers:
-                                    if (normalized_pitcher_name == starter or 
-                                        self.comprehensive_name_matching(normalized_pitcher_name, starter) or
-                                        self.comprehensive_name_matching(starter, normalized_pitcher_name)):
-                                        is_starting_pitcher = True
-                                        break
-                                
-                                if not is_starting_pitcher:
-                                    continue  # Skip non-starting pitchers
-                                    
-                                pitcher_key = f"{pitcher['name']}_{pitcher['team']}"
-                                
-                                # Hits allowed analysis
-                                hits_allowed = int(pitcher.get('H', 0)) if str(pitcher.get('H', 0)).isdigit() else 0
-                                
-                                if pitcher_key not in pitcher_hits_analysis:
-                                    pitcher_hits_analysis[pitcher_key] = {
-                                        'name': pitcher['name'],
-                                        'team': pitcher['team'],
-                                        'total_hits_allowed': 0,
-                                        'games_played': 0,
-                                        'total_innings': 0
-                                    }
-                                
-                                pitcher_hits_analysis[pitcher_key]['total_hits_allowed'] += hits_allowed
-                                pitcher_hits_analysis[pitcher_key]['games_played'] += 1
-                                
-                                innings = float(pitcher.get('IP', 0)) if str(pitcher.get('IP', 0)).replace('.', '').isdigit() else 0
-                                pitcher_hits_analysis[pitcher_key]['total_innings'] += innings
-                                
-                                # HRs allowed analysis
-                                hrs_allowed = int(pitcher.get('HR', 0)) if str(pitcher.get('HR', 0)).isdigit() else 0
-                                
-                                if pitcher_key not in pitcher_hrs_analysis:
-                                    pitcher_hrs_analysis[pitcher_key] = {
-                                        'name': pitcher['name'],
-                                        'team': pitcher['team'],
-                                        'total_hrs_allowed': 0,
-                                        'games_played': 0,
-                                        'total_innings': 0
-                                    }
-                                
-                                pitcher_hrs_analysis[pitcher_key]['total_hrs_allowed'] += hrs_allowed
-                                pitcher_hrs_analysis[pitcher_key]['games_played'] += 1
-                                pitcher_hrs_analysis[pitcher_key]['total_innings'] += innings
-                        
-                        dates_processed += 1
-                        
-                except Exception:
-                    continue
-            
-            # Calculate rankings and rates
-            hits_ranking_list = []
-            for pitcher_key, data in pitcher_hits_analysis.items():
-                if data['games_played'] > 0:
-                    hits_per_game = data['total_hits_allowed'] / data['games_played']
-                    hits_per_inning = data['total_hits_allowed'] / data['total_innings'] if data['total_innings'] > 0 else 0
-                    
-                    hits_ranking_list.append({
-                        'name': data['name'],
-                        'team': data['team'],
-                        'total_hits_allowed': data['total_hits_allowed'],
-                        'hits_per_game': hits_per_game,
-                        'hits_per_inning': hits_per_inning,
-                        'games_played': data['games_played']
-                    })
-            
-            # Sort by total hits allowed (descending) to get vulnerability ranking
-            hits_ranking_list.sort(key=lambda x: x['total_hits_allowed'], reverse=True)
-            
-            # Store rankings with league position
-            for rank, pitcher_data in enumerate(hits_ranking_list, 1):
-                pitcher_name = self.normalize_name(pitcher_data['name'])
-                self.pitcher_hits_rankings[pitcher_name] = {
-                    **pitcher_data,
-                    'league_rank_hits': rank,
-                    'percentile_hits': (len(hits_ranking_list) - rank) / len(hits_ranking_list) if len(hits_ranking_list) > 0 else 0.5
-                }
-            
-            # Same process for HRs
-            hrs_ranking_list = []
-            for pitcher_key, data in pitcher_hrs_analysis.items():
-                if data['games_played'] > 0:
-                    hrs_per_game = data['total_hrs_allowed'] / data['games_played']
-                    hrs_per_inning = data['total_hrs_allowed'] / data['total_innings'] if data['total_innings'] > 0 else 0
-                    
-                    hrs_ranking_list.append({
-                        'name': data['name'],
-                        'team': data['team'],
-                        'total_hrs_allowed': data['total_hrs_allowed'],
-                        'hrs_per_game': hrs_per_game,
-                        'hrs_per_inning': hrs_per_inning,
-                        'games_played': data['games_played']
-                    })
-            
-            # Sort by total HRs allowed (descending) to get vulnerability ranking
-            hrs_ranking_list.sort(key=lambda x: x['total_hrs_allowed'], reverse=True)
-            
-            # Store rankings with league position
-            for rank, pitcher_data in enumerate(hrs_ranking_list, 1):
-                pitcher_name = self.normalize_name(pitcher_data['name'])
-                self.pitcher_hrs_rankings[pitcher_name] = {
-                    **pitcher_data,
-                    'league_rank_hrs': rank,
-                    'percentile_hrs': (len(hrs_ranking_list) - rank) / len(hrs_ranking_list) if len(hrs_ranking_list) > 0 else 0.5
-                }
+            self.pitcher_hits_rankings.update(self.rank_pitcher_totals(pitcher_totals, 'hits'))
+            self.pitcher_hrs_rankings.update(self.rank_pitcher_totals(pitcher_totals, 'hrs'))
             
             print(f"   📈 Loaded hits rankings for {len(self.pitcher_hits_rankings)} starting pitchers (optimized from 628+ total)")
             print(f"   🔥 Loaded HR rankings for {len(self.pitcher_hrs_rankings)} starting pitchers (optimized from 628+ total)")
@@ -791,6 +1764,79 @@ class EnhancedWeakspotAnalyzer:
         except Exception as e:
             print(f"   ⚠️ Could not load pitcher ranking data: {e}")
     
+    def pitcher_allowed_totals(self, include):
+        """
+        Hits/HRs allowed over the last 60 days for pitchers whose normalized name passes `include`
+        Returns ({name_team: totals}, days processed); uses similar logic to
+        PitcherHitsAllowedCard and PitcherHRsAllowedCard.
+        """
+        pitcher_totals = {}
+        dates_processed = 0
+        
+        for check_date, date_str, game_data in self.daily_games.iter_days(datetime.now(), 60):
+            try:
+                if 'players' in game_data:
+                    # Process pitchers for ranking analysis
+                    pitchers = [p for p in game_data['players'] 
+                              if p.get('playerType') == 'pitcher' 
+                              and p.get('H', 'DNP') != 'DNP' 
+                              and p.get('HR', 'DNP') != 'DNP']
+                    
+                    for pitcher in pitchers:
+                        if not include(self.normalize_name(pitcher['name'])):
+                            continue
+                            
+                        pitcher_key = f"{pitcher['name']}_{pitcher['team']}"
+                        if pitcher_key not in pitcher_totals:
+                            pitcher_totals[pitcher_key] = {
+                                'name': pitcher['name'],
+                                'team': pitcher['team'],
+                                'hits': 0,
+                                'hrs': 0,
+                                'games_played': 0,
+                                'total_innings': 0
+                            }
+                        totals = pitcher_totals[pitcher_key]
+                        
+                        totals['hits'] += int(pitcher.get('H', 0)) if str(pitcher.get('H', 0)).isdigit() else 0
+                        totals['hrs'] += int(pitcher.get('HR', 0)) if str(pitcher.get('HR', 0)).isdigit() else 0
+                        totals['games_played'] += 1
+                        totals['total_innings'] += float(pitcher.get('IP', 0)) if str(pitcher.get('IP', 0)).replace('.', '').isdigit() else 0
+                
+                dates_processed += 1
+                    
+            except Exception:
+                continue
+        
+        return pitcher_totals, dates_processed
+    
+    def rank_pitcher_totals(self, pitcher_totals, stat):
+        """League position of each pitcher by total hits or HRs allowed ('hits' / 'hrs'), keyed by normalized name"""
+        ranking_list = []
+        for data in pitcher_totals.values():
+            if data['games_played'] > 0:
+                ranking_list.append({
+                    'name': data['name'],
+                    'team': data['team'],
+                    f'total_{stat}_allowed': data[stat],
+                    f'{stat}_per_game': data[stat] / data['games_played'],
+                    f'{stat}_per_inning': data[stat] / data['total_innings'] if data['total_innings'] > 0 else 0,
+                    'games_played': data['games_played']
+                })
+        
+        # Sort by total allowed (descending) to get vulnerability ranking
+        ranking_list.sort(key=lambda x: x[f'total_{stat}_allowed'], reverse=True)
+        
+        # Rankings with league position
+        rankings = {}
+        for rank, pitcher_data in enumerate(ranking_list, 1):
+            rankings[self.normalize_name(pitcher_data['name'])] = {
+                **pitcher_data,
+                f'league_rank_{stat}': rank,
+                f'percentile_{stat}': (len(ranking_list) - rank) / len(ranking_list)
+            }
+        return rankings
+    
     def analyze_enhanced_pitcher_vulnerabilities(self, pitcher_name):
         """Enhanced pitcher vulnerability analysis with situational factors"""
         
@@ -1004,7 +2050,7 @@ class EnhancedWeakspotAnalyzer:
                 'vulnerability_score': round(total_vulnerability_score, 1),
                 'factors': all_factors[:6],  # Top 6 factors
                 'confidence_level': 'high' if total_vulnerability_score >= 70 else 'moderate',
-                'exploitation_windows': self.identify_exploitation_windows(normalized_name)
+                'exploitation_windows': self.get_pitcher_context(pitcher_name).exploitation_windows
             }]
             
             # Boost confidence based on data completeness (Enhanced with ranking data)
@@ -1029,6 +2075,136 @@ class EnhancedWeakspotAnalyzer:
         
         return vulnerability_analysis
     
+    def build_exploiter(self, game_id, batter_name, team, pitcher_name, opposing_team, venue,
+                        pitcher_analysis, exploit_analysis, combined_score):
+        """Exploiter record for a selected matchup (text fields deferred when text_top_n is set)"""
+        # Build modernAnalytics structure first
+        modern_analytics = {
+            'expectedStatsGap': exploit_analysis.get('expected_stats_gap'),
+            'barrelMatchup': exploit_analysis.get('barrel_matchup'),
+            'arsenalVulnerability': exploit_analysis.get('arsenal_vulnerability'),
+            'arsenalExploitation': exploit_analysis.get('arsenal_exploitation')  # NEW: Enhanced analysis
+        }
+        
+        exploiter = {
+            'player': batter_name,
+            'team': team,
+            'pitcher': pitcher_name,
+            'opposingTeam': opposing_team,
+            'venue': venue,
+            'gameId': game_id,
+            'exploitIndex': round(exploit_analysis['exploit_score'], 1),
+            'confidence': round(exploit_analysis['confidence'], 3),
+            'combinedScore': round(combined_score, 1),
+            'batterClassification': exploit_analysis['batter_classification'],
+            'keyWeakness': None,
+            'comprehensiveJustification': None,  # NEW: Enhanced justification
+            'exploitFactors': None,  # NEW: Enhanced multi-factor analysis
+            'situationalAdvantages': exploit_analysis['situational_advantages'][:3],
+            'regressionOpportunity': exploit_analysis.get('regression_opportunity'),
+            'contactQualityEdge': exploit_analysis.get('contact_quality_edge'),
+            'arsenalExploitation': exploit_analysis.get('arsenal_exploitation', {}),  # NEW: Arsenal exploitation analysis
+            'handednessAnalysis': exploit_analysis.get('handedness_analysis'),
+            'parkAdjustment': exploit_analysis.get('park_adjustment', 1.0),
+            'weatherFactor': exploit_analysis.get('weather_factor', 1.0),
+            'recentFormContext': exploit_analysis.get('recent_form_context', {}),
+            'lineupContext': exploit_analysis.get('lineup_context', {}),
+            'modernAnalytics': modern_analytics,
+            'dataQuality': exploit_analysis.get('data_quality', 'good'),
+            'analysisTimestamp': datetime.now().isoformat()
+        }
+        
+        # Exploit factors are a short list the card's category filters match on, so every row gets them
+        exploiter['exploitFactors'] = self.generate_detailed_exploit_factors(
+            batter_name, pitcher_name, pitcher_analysis, modern_analytics)
+        
+        text_inputs = (pitcher_analysis, exploit_analysis, modern_analytics)
+        if self.text_top_n is None:
+            self.generate_exploiter_text(exploiter, text_inputs)
+        else:
+            self.deferred_text[text_key(exploiter)] = text_inputs
+        return exploiter
+    
+    def generate_exploiter_text(self, exploiter, text_inputs=None):
+        """Fill (and return) an exploiter's keyWeakness / justification text (and exploit factors if missing)"""
+        if text_inputs is None:
+            text_inputs = self.deferred_text[text_key(exploiter)]
+        pitcher_analysis, exploit_analysis, modern_analytics = text_inputs
+        text = {
+            'keyWeakness': self.extract_key_weakness(pitcher_analysis, exploit_analysis),
+            # Generate comprehensive justification combining all data sources
+            'comprehensiveJustification': self.generate_comprehensive_justification(
+                exploiter['player'], exploiter['pitcher'], pitcher_analysis, exploit_analysis)
+        }
+        if exploiter.get('exploitFactors') is None:
+            # Generate detailed exploit factors from all available data
+            text['exploitFactors'] = self.generate_detailed_exploit_factors(
+                exploiter['player'], exploiter['pitcher'], pitcher_analysis, modern_analytics)
+        exploiter.update(text)
+        return text
+    
+    def materialize_exploiter_text(self, exploiters):
+        """Generate text for the top N ranked exploiters (overall or per game); strip the prose from the rest"""
+        ranks = {}
+        generated = 0
+        for exploiter in exploiters:  # already ranked
+            game_key = exploiter['gameId'] if self.text_scope == 'game' else None
+            ranks[game_key] = ranks.get(game_key, 0) + 1
+            if ranks[game_key] <= self.text_top_n:
+                text_inputs = self.deferred_text.pop(text_key(exploiter))
+                self.generate_exploiter_text(exploiter, text_inputs)
+                generated += 1
+            else:
+                for field in ('keyWeakness', 'comprehensiveJustification'):
+                    exploiter.pop(field, None)
+        
+        scope = 'per game' if self.text_scope == 'game' else 'overall'
+        print(f"📝 Text fields generated for {generated}/{len(exploiters)} exploiters (top {self.text_top_n} {scope})")
+    
+    def deferred_text_file(self, date):
+        return self.data_path / ".deferred_text" / f"weakspot_text_inputs_{date}.pickle"
+    
+    def save_deferred_text(self, date):
+        """Persist the text inputs of exploiters below the --text-top-n cutoff (for --explain)"""
+        import pickle
+        
+        text_file = self.deferred_text_file(date)
+        try:
+            text_file.parent.mkdir(exist_ok=True)
+            temp_file = text_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_file, 'wb') as f:
+                pickle.dump(self.deferred_text, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, text_file)
+            print(f"📝 Deferred text inputs saved for {len(self.deferred_text)} exploiters → {text_file}")
+        except Exception as e:
+            print(f"   ⚠️ Could not save deferred text inputs: {e}")
+    
+    def explain_exploiter(self, player, pitcher, date=None):
+        """Text fields for an exploiter whose text was deferred in a previous --text-top-n run"""
+        import pickle
+        
+        date = date or self.target_date
+        text_file = self.deferred_text_file(date)
+        if not text_file.exists():
+            raise FileNotFoundError(f"No deferred text inputs for {date} (run with --text-top-n first)")
+        with open(text_file, 'rb') as f:
+            deferred_text = pickle.load(f)
+        
+        for (game_id, batter_name, team, pitcher_name), text_inputs in deferred_text.items():
+            if batter_name == player and pitcher_name == pitcher:
+                exploiter = {'player': batter_name, 'team': team, 'pitcher': pitcher_name, 'gameId': game_id}
+                self.generate_exploiter_text(exploiter, text_inputs)
+                return exploiter
+        raise ValueError(f"{player} vs {pitcher} has no deferred text for {date} (top-N rows already carry it)")
+    
+    def print_explanation(self, exploiter):
+        """Console view of explain_exploiter() text"""
+        print(f"📝 {exploiter['player']} ({exploiter['team']}) vs {exploiter['pitcher']}")
+        print(f"   🎯 Key weakness: {exploiter['keyWeakness']}")
+        print(f"   🔬 Justification: {exploiter['comprehensiveJustification']}")
+        for factor in exploiter['exploitFactors'] or []:
+            print(f"   • {factor}")
+    
     def extract_key_weakness(self, pitcher_analysis, exploit_analysis):
         """Extract the most relevant weakness for display"""
         if exploit_analysis.get('regression_opportunity'):
@@ -1343,10 +2519,9 @@ class EnhancedWeakspotAnalyzer:
         
         return exploit_factors[:10]  # Expanded to top 10 factors for comprehensive analysis
     
-    def analyze_arsenal_exploitation_matchup(self, batter_name, pitcher_name):
+    def analyze_arsenal_exploitation_matchup(self, batter_name, pitcher_context):
         """Analyze specific pitch-type vulnerabilities vs batter strengths with comprehensive breakdown"""
         normalized_batter = self.normalize_name(batter_name)
-        normalized_pitcher = self.normalize_name(pitcher_name)
         
         arsenal_matchup = {
             'vulnerable_pitches': [],
@@ -1368,30 +2543,25 @@ class EnhancedWeakspotAnalyzer:
         batter_max_ev = float(exit_velo_data.get('max_exit_velocity', 0))
         
         # Get pitcher arsenal data
-        if normalized_pitcher not in self.pitcher_arsenal:
+        if not pitcher_context.has_arsenal:
             # Return with fallback data if no arsenal available
             return arsenal_matchup
-            
-        arsenal = self.pitcher_arsenal[normalized_pitcher]['pitch_types']
-        total_usage = sum(float(p.get('usage_percent', 0)) for p in arsenal.values())
         
-        for pitch_type, pitch_data in arsenal.items():
-            pitch_name = pitch_data['pitch_name']
-            ba_against = float(pitch_data.get('ba_against', 0))
-            slg_against = float(pitch_data.get('slg_against', 0))
-            usage_percent = float(pitch_data.get('usage_percent', 0))
-            whiff_percent = float(pitch_data.get('whiff_percent', 0))
-            zone_percent = float(pitch_data.get('zone_percent', 0))
-            
-            # Skip pitches with very low usage
-            if usage_percent < 8:
-                continue
+        # Pitches were parsed (and low-usage ones dropped) once when the pitcher context was built
+        for pitch in pitcher_context.arsenal_pitches:
+            pitch_name = pitch['pitch_name']
+            category = pitch['category']
+            ba_against = pitch['ba_against']
+            slg_against = pitch['slg_against']
+            usage_percent = pitch['usage_percent']
+            whiff_percent = pitch['whiff_percent']
+            zone_percent = pitch['zone_percent']
                 
             pitch_vulnerability_score = 0
             exploitation_factors = []
             
             # 1. FASTBALL EXPLOITATION (Enhanced)
-            if any(fb in pitch_name.lower() for fb in ['4-seam', 'fastball', 'sinker', '2-seam']):
+            if category == 'fastball':
                 # High contact quality batters vs vulnerable fastballs
                 if ba_against > 0.290 and batter_barrel_rate > 10:
                     pitch_vulnerability_score += 18
@@ -1417,7 +2587,7 @@ class EnhancedWeakspotAnalyzer:
                     exploitation_factors.append(f"Hard contact specialist vs hittable FB ({batter_avg_ev:.1f} mph avg EV)")
                     
             # 2. SLIDER/CUTTER EXPLOITATION (Enhanced)  
-            elif any(x in pitch_name.lower() for x in ['slider', 'cutter']):
+            elif category == 'slider':
                 # Patient hitters vs ineffective sliders
                 if whiff_percent < 30 and batter_bb_rate > 12:
                     pitch_vulnerability_score += 14
@@ -1438,7 +2608,7 @@ class EnhancedWeakspotAnalyzer:
                     exploitation_factors.append(f"Contact quality vs vulnerable {pitch_name}")
                     
             # 3. CURVEBALL EXPLOITATION (Enhanced)
-            elif 'curve' in pitch_name.lower():
+            elif category == 'curve':
                 # Low strikeout hitters vs ineffective curves
                 if whiff_percent < 35 and batter_k_rate < 20:
                     pitch_vulnerability_score += 12
@@ -1453,7 +2623,7 @@ class EnhancedWeakspotAnalyzer:
                     exploitation_factors.append(f"Hittable {pitch_name} allows {ba_against:.3f} BA")
                     
             # 4. CHANGEUP/OFFSPEED EXPLOITATION (Enhanced)
-            elif any(x in pitch_name.lower() for x in ['change', 'split', 'fork']):
+            elif category == 'offspeed':
                 # Aggressive hitters vs ineffective changeups
                 if ba_against > 0.260 and whiff_percent < 40:
                     pitch_vulnerability_score += 12
@@ -1549,7 +2719,8 @@ class EnhancedWeakspotAnalyzer:
     def analyze_enhanced_batter_exploit_potential(self, batter_name, pitcher_name, pitcher_vulnerabilities, venue='', batter_team='', venue_home_team=''):
         """Enhanced batter exploit analysis with situational advantages"""
         normalized_batter = self.normalize_name(batter_name)
-        normalized_pitcher = self.normalize_name(pitcher_name)
+        pitcher_context = self.get_pitcher_context(pitcher_name)  # Pitcher-only values, shared by every hitter
+        batter_context = self.get_batter_context(batter_name)  # Batter-only values, shared by every opponent
         
         # ENHANCED MULTIPLICATIVE SCORING: Increased baseline per baseball-stats-expert recommendations
         # Start with enhanced neutral matchup baseline for comprehensive data
@@ -1559,77 +2730,17 @@ class EnhancedWeakspotAnalyzer:
         batter_quality_multiplier = 1.0
         pitcher_vulnerability_multiplier = 1.0
         situational_multiplier = 1.0
+        features = new_feature_row()  # Inputs for the vectorized batch scorer
         
         # 1. BATTER QUALITY ASSESSMENT (0.7 - 1.3 multiplier range)
-        custom_data = self.find_batter_data(batter_name)
+        custom_data = batter_context.custom_data
+        batter_quality_multiplier = batter_context.quality_multiplier
+        features.update(batter_context.features)
         if custom_data:
-            # Real performance metrics - create meaningful differentiation
-            barrel_percent = float(custom_data.get('barrel_percent', 0))
-            bb_percent = float(custom_data.get('bb_percent', 0))
-            k_percent = float(custom_data.get('k_percent', 0))
-            sprint_speed = float(custom_data.get('sprint_speed', 0))
-            
-            # Expected stats vs actual (regression potential)
-            xba_diff = float(custom_data.get('xba_diff', 0))  # BA - xBA (negative = underperforming)
-            xslg_diff = float(custom_data.get('xslg_diff', 0))  # SLG - xSLG (negative = underperforming)
-            
-            # BARREL RATE FACTOR (20% weight) - most predictive of power success
-            if barrel_percent >= 15:      # Elite (top 2%)
-                barrel_factor = 1.25
-            elif barrel_percent >= 12:    # Excellent (top 5%)
-                barrel_factor = 1.15
-            elif barrel_percent >= 9:     # Good (top 15%)
-                barrel_factor = 1.05
-            elif barrel_percent >= 6:     # Average (top 50%)
-                barrel_factor = 1.0
-            elif barrel_percent >= 3:     # Below average
-                barrel_factor = 0.95
-            else:                         # Poor
-                barrel_factor = 0.85
-                
-            # PLATE DISCIPLINE FACTOR (15% weight)
-            if bb_percent > 12 and k_percent < 18:    # Elite patience
-                discipline_factor = 1.15
-            elif bb_percent > 9 and k_percent < 22:   # Good patience  
-                discipline_factor = 1.08
-            elif bb_percent > 6 and k_percent < 25:   # Average
-                discipline_factor = 1.0
-            elif k_percent > 30:                      # Swing-happy
-                discipline_factor = 0.90
-            else:
-                discipline_factor = 0.95
-                
-            # SPEED FACTOR (10% weight) - affects BABIP and extra bases
-            if sprint_speed > 29:        # Elite speed
-                speed_factor = 1.1
-            elif sprint_speed > 27:      # Fast
-                speed_factor = 1.05
-            elif sprint_speed > 25:      # Average
-                speed_factor = 1.0
-            elif sprint_speed > 23:      # Slow
-                speed_factor = 0.97
-            else:                        # Very slow
-                speed_factor = 0.93
-                
-            # REGRESSION FACTOR (15% weight) - underperformance = opportunity
-            if xba_diff < -0.040 or xslg_diff < -0.060:    # Major underperformance
-                regression_factor = 1.20
-            elif xba_diff < -0.025 or xslg_diff < -0.035:  # Moderate underperformance
-                regression_factor = 1.10
-            elif xba_diff < -0.015 or xslg_diff < -0.020:  # Minor underperformance
-                regression_factor = 1.05
-            elif xba_diff > 0.025 or xslg_diff > 0.040:    # Overperforming (negative)
-                regression_factor = 0.90
-            else:                                          # Neutral
-                regression_factor = 1.0
-                
-            # COMBINE BATTER FACTORS (weighted average)
-            batter_quality_multiplier = (
-                barrel_factor * 0.35 +          # 35% weight - most important
-                discipline_factor * 0.25 +      # 25% weight 
-                speed_factor * 0.20 +           # 20% weight
-                regression_factor * 0.20        # 20% weight
-            )
+            barrel_percent = features['barrel_percent']
+            bb_percent = features['bb_percent']
+            k_percent = features['k_percent']
+            sprint_speed = features['sprint_speed']
         
         # 2. PITCHER VULNERABILITY ASSESSMENT (0.8 - 1.2 multiplier range)
         if pitcher_vulnerabilities:
@@ -1637,6 +2748,8 @@ class EnhancedWeakspotAnalyzer:
             pitcher_era = pitcher_vulnerabilities.get('pitcher_stats', {}).get('era', 4.50)
             pitcher_whip = pitcher_vulnerabilities.get('pitcher_stats', {}).get('whip', 1.30)
             hr_rate = pitcher_vulnerabilities.get('pitcher_stats', {}).get('hrPerGame', 1.0)
+            features.update(has_pitcher_data=1.0, pitcher_era=pitcher_era,
+                            pitcher_whip=pitcher_whip, pitcher_hr_rate=hr_rate)
             
             # ERA vulnerability (30% weight)
             if pitcher_era > 5.5:        # Very poor
@@ -1684,19 +2797,25 @@ class EnhancedWeakspotAnalyzer:
             )
         
         # 3. PHASE 1 ENHANCEMENT: HANDEDNESS-SPECIFIC MATCHUP ANALYSIS
-        handedness_analysis = self.analyze_handedness_matchup_advantage(batter_name, pitcher_name)
+        handedness_analysis = self.analyze_handedness_matchup_advantage(batter_name, pitcher_context)
+        features['handedness_score'] = handedness_analysis['advantage_score']
         if handedness_analysis['advantage_score'] > 0:
             handedness_multiplier = 1.0 + (handedness_analysis['advantage_score'] / 100)  # Convert to multiplier
             situational_multiplier *= handedness_multiplier
             
         # 4. PHASE 1 ENHANCEMENT: SWING PATH OPTIMIZATION ANALYSIS  
-        swing_optimization = self.analyze_swing_path_optimization(batter_name, pitcher_name)
+        swing_optimization = batter_context.swing_optimization.get(pitcher_context.hand)
+        if swing_optimization is None:
+            swing_optimization = self.analyze_swing_path_optimization(batter_name, pitcher_context)
+            batter_context.swing_optimization[pitcher_context.hand] = swing_optimization
+        features['swing_score'] = swing_optimization['optimization_score']
         if swing_optimization['optimization_score'] > 0:
             swing_multiplier = 1.0 + (swing_optimization['optimization_score'] / 200)  # More conservative multiplier
             situational_multiplier *= swing_multiplier
             
         # 5. PHASE 1 ENHANCEMENT: MULTI-YEAR PITCHER REGRESSION ANALYSIS
-        regression_analysis = self.analyze_multi_year_pitcher_regression(pitcher_name)
+        regression_analysis = pitcher_context.regression
+        features['pitcher_regression_score'] = regression_analysis['regression_score']
         if regression_analysis['regression_score'] > 0:
             regression_multiplier = 1.0 + (regression_analysis['regression_score'] / 150)  # Regression bonus
             pitcher_vulnerability_multiplier *= regression_multiplier
@@ -1713,15 +2832,16 @@ class EnhancedWeakspotAnalyzer:
             situational_factors.extend(regression_analysis['regression_indicators'][:1])
         
         # Platoon advantage (traditional analysis)
-        batter_hand = self.get_batter_handedness(batter_name)
+        batter_hand = batter_context.hand
         pitcher_hand = pitcher_vulnerabilities.get('situational_factors', {}).get('pitch_hand', 'R')
         if (batter_hand == 'L' and pitcher_hand == 'R') or (batter_hand == 'R' and pitcher_hand == 'L'):
             situational_multiplier *= 1.08  # 8% boost for platoon advantage
+            features['platoon_advantage'] = 1.0
             situational_factors.append(f"{batter_hand}HB vs {pitcher_hand}HP platoon advantage")
         
         # Hot streak bonus
-        if normalized_batter in self.batter_trends:
-            trend = self.batter_trends[normalized_batter]
+        trend = batter_context.trend
+        if trend is not None:
             if trend['trend'] == 'hot':
                 situational_multiplier *= 1.06  # 6% boost for hot streak
                 situational_factors.append(f"Hot streak ({trend['recent_avg']:.3f} last 5 games)")
@@ -1749,8 +2869,10 @@ class EnhancedWeakspotAnalyzer:
         
         # 1. Enhanced Contact Quality Analysis
         # PHASE 3: Refined exit velocity analysis with controlled scoring
-        if normalized_batter in self.hitter_exit_velocity:
-            hitter_ev = self.hitter_exit_velocity[normalized_batter]
+        hitter_ev = batter_context.exit_velocity
+        if hitter_ev is not None:
+            barrel_vulnerability = pitcher_vulnerabilities.get('situational_factors', {}).get('barrel_vulnerability')
+            features['barrel_vulnerability'] = {'extreme': 2.0, 'high': 1.0}.get(barrel_vulnerability, 0.0)
             
             # ENHANCED MODERN ANALYTICS: Barrel rate with increased weighting per baseball-stats-expert recommendations
             barrel_rate = hitter_ev['real_barrel_rate']
@@ -1800,15 +2922,12 @@ class EnhancedWeakspotAnalyzer:
             exploit_analysis['confidence'] += 0.2  # Additional confidence for comprehensive exit velocity data
         
         # 1.5. Phase 1 Enhancement: Contact Exploiter Detection
-        # Reuse custom_data from earlier lookup or find again if needed
-        if not custom_data:
-            custom_data = self.find_batter_data(batter_name)
         if custom_data:
             
             # Contact quality metrics (NEW)
-            sweet_spot_percent = float(custom_data.get('sweet_spot_percent', 0))
-            whiff_rate = float(custom_data.get('whiff_percent', 0))
-            k_percent = float(custom_data.get('k_percent', 0))
+            sweet_spot_percent = features['sweet_spot_percent']
+            whiff_rate = features['whiff_percent']
+            k_percent = features['k_percent']
             
             # ENHANCED CONTACT SCORING: More realistic thresholds for contact hitter identification
             contact_bonus = 0
@@ -1866,9 +2985,9 @@ class EnhancedWeakspotAnalyzer:
                     exploit_analysis['exploit_factors'].append(f"Contact concerns ({sweet_spot_percent:.1f}% sweet spot, {whiff_rate:.1f}% whiff)")
             
             # Walk exploiter detection (Phase 1)
-            z_swing_percent = float(custom_data.get('z_swing_percent', 0))  
-            oz_swing_percent = float(custom_data.get('oz_swing_percent', 0))
-            bb_percent = float(custom_data.get('bb_percent', 0))
+            z_swing_percent = features['z_swing_percent']
+            oz_swing_percent = features['oz_swing_percent']
+            bb_percent = features['bb_percent']
             
             # Phase 2: Enhanced walk specialist scoring with major bonuses
             walk_bonus = 0
@@ -2000,12 +3119,7 @@ class EnhancedWeakspotAnalyzer:
                 exploit_analysis['confidence'] += 0.15  # ENHANCED: Increased from 0.1
                 
             # ENHANCED: Multi-source validation bonus per baseball-stats-expert recommendations
-            data_sources_count = 0
-            if custom_data: data_sources_count += 1
-            if normalized_batter in self.hitter_exit_velocity: data_sources_count += 1
-            if normalized_batter in self.batter_trends: data_sources_count += 1
-            if normalized_batter in self.recent_form_data: data_sources_count += 1
-            if normalized_batter in self.lineup_data: data_sources_count += 1
+            data_sources_count = batter_context.data_sources_count
             
             if data_sources_count >= 4:
                 exploit_analysis['confidence'] += 0.15  # Multi-source validation bonus
@@ -2014,14 +3128,14 @@ class EnhancedWeakspotAnalyzer:
                 exploit_analysis['confidence'] += 0.10  # Good data coverage
         
         # ENHANCED TREND DATA: Improved trend impact and added cold streak penalties per baseball-stats-expert recommendations
-        if normalized_batter in self.batter_trends:
-            trend = self.batter_trends[normalized_batter]
+        if trend is not None:
             if trend['trend'] == 'hot':
                 exploit_analysis['exploit_score'] += 25  # ENHANCED: Increased from 15 to 25 for hot streaks
                 exploit_analysis['exploit_factors'].append(f"Hot streak ({trend['recent_avg']:.3f} last 5 games)")
                 
                 # Extra boost if pitcher is struggling
                 if pitcher_vulnerabilities.get('trend_analysis', {}).get('trend') == 'deteriorating':
+                    features['pitcher_deteriorating'] = 1.0
                     exploit_analysis['exploit_score'] += 15  # ENHANCED: Increased from 10 to 15
                     exploit_analysis['situational_advantages'].append("Hot hitter vs struggling pitcher")
             elif trend['trend'] == 'cold':
@@ -2031,10 +3145,8 @@ class EnhancedWeakspotAnalyzer:
                 exploit_analysis['confidence'] -= 0.1  # Additional confidence penalty for cold streaks
         
         # 3. Platoon Advantage Analysis
-        if not custom_data:
-            custom_data = self.find_batter_data(batter_name)
         if custom_data:
-            batter_hand = self.get_batter_handedness(batter_name)
+            batter_hand = batter_context.hand
             pitcher_hand = pitcher_vulnerabilities.get('situational_factors', {}).get('pitch_hand', 'R')
             
             # RESTORED: Traditional platoon advantage with meaningful impact
@@ -2050,6 +3162,7 @@ class EnhancedWeakspotAnalyzer:
             park_data = self.park_factors[normalized_venue]
             hr_factor = park_data['hr_factor']
             park_adjustment = hr_factor
+            features['park_hr_factor'] = hr_factor
             
             # Apply additive park bonuses instead of destructive multipliers
             if hr_factor > 1.15:  # Very hitter-friendly
@@ -2072,6 +3185,7 @@ class EnhancedWeakspotAnalyzer:
         if normalized_venue and normalized_venue in self.weather_context:
             weather_data = self.weather_context[normalized_venue]
             weather_factor = weather_data['weather_factor']
+            features['weather_factor'] = weather_factor
             
             # Apply additive weather adjustments instead of destructive multipliers
             if weather_factor > 1.10:  # Very favorable weather
@@ -2094,8 +3208,8 @@ class EnhancedWeakspotAnalyzer:
                     exploit_analysis['situational_advantages'].append(f"Unfavorable wind ({weather_data['wind_speed']} mph)")
         
         # NEW: Recent Form and Momentum Integration (Phase 5)  
-        if normalized_batter in self.recent_form_data:
-            form_data = self.recent_form_data[normalized_batter]
+        form_data = batter_context.recent_form
+        if form_data is not None:
             
             # Hot streak bonus
             if form_data.get('hot_streak', False) or form_data.get('last_7_avg', 0) > 0.320:
@@ -2122,8 +3236,8 @@ class EnhancedWeakspotAnalyzer:
         
         # NEW: Lineup Position and Protection Analysis (Phase 6)
         lineup_bonus = 0
-        if normalized_batter in self.lineup_data:
-            lineup_info = self.lineup_data[normalized_batter]
+        lineup_info = batter_context.lineup
+        if lineup_info is not None:
             
             # RBI opportunity bonus for middle-order batters
             rbi_factor = lineup_info.get('rbi_opportunities', 1.0)
@@ -2154,11 +3268,11 @@ class EnhancedWeakspotAnalyzer:
             exploit_analysis['exploit_score'] += lineup_bonus
             
         # Store lineup context in analysis  
-        exploit_analysis['lineup_context'] = self.lineup_data.get(normalized_batter, {})
+        exploit_analysis['lineup_context'] = lineup_info if lineup_info is not None else {}
         
         # Store weather and form context in analysis
         exploit_analysis['weather_factor'] = weather_factor
-        recent_form_context = self.recent_form_data.get(normalized_batter, {}).copy()
+        recent_form_context = (form_data if form_data is not None else {}).copy()
         # CRITICAL FIX: Ensure team in recent form context matches current game team
         if recent_form_context and batter_team:
             recent_form_context['team'] = batter_team
@@ -2181,6 +3295,7 @@ class EnhancedWeakspotAnalyzer:
                 
                 # Apply penalty to away team players
                 exploit_analysis['exploit_score'] -= penalty_percentage
+                features['home_field_adjustment'] = -penalty_percentage
                 exploit_analysis['situational_advantages'].append(
                     f"Away team penalty: -{penalty_percentage}% ({home_field_impact.get('reasoning', 'Home field disadvantage')})"
                 )
@@ -2192,6 +3307,7 @@ class EnhancedWeakspotAnalyzer:
                 
                 # Apply bonus for away team at away-friendly venues
                 exploit_analysis['exploit_score'] += bonus_percentage
+                features['home_field_adjustment'] = bonus_percentage
                 exploit_analysis['situational_advantages'].append(
                     f"Away team bonus: +{bonus_percentage}% ({home_field_impact.get('reasoning', 'Away team advantage')})"
                 )
@@ -2206,9 +3322,8 @@ class EnhancedWeakspotAnalyzer:
             
             # Match batter strengths to pitcher weaknesses
             if "First pitch fastball" in str(windows):
+                features['first_pitch_window'] = 1.0
                 # Check first pitch aggression using enhanced lookup
-                if not custom_data:
-                    custom_data = self.find_batter_data(batter_name)
                 if custom_data:
                     z_swing = custom_data.get('z_swing_percent', 0)
                     if z_swing > 35:  # Aggressive in zone
@@ -2218,11 +3333,11 @@ class EnhancedWeakspotAnalyzer:
                         exploit_analysis['situational_advantages'].append(enhanced_justification)
         
         # NEW: Add League Position Context from Pitcher Rankings
-        normalized_pitcher = self.normalize_name(pitcher_name)
+        hits_rank = pitcher_context.hits_rank
+        hrs_rank = pitcher_context.hrs_rank
         
         # Add hits vulnerability ranking context
-        if normalized_pitcher in self.pitcher_hits_rankings:
-            hits_rank = self.pitcher_hits_rankings[normalized_pitcher].get('league_rank_hits', 999)
+        if hits_rank is not None:
             if hits_rank <= 10:
                 exploit_analysis['situational_advantages'].append(f"Pitcher ranks #{hits_rank} worst in hits allowed")
                 exploit_analysis['league_context'] = {'hits_rank': hits_rank, 'hits_category': 'elite_vulnerable'}
@@ -2231,8 +3346,7 @@ class EnhancedWeakspotAnalyzer:
                 exploit_analysis['league_context'] = {'hits_rank': hits_rank, 'hits_category': 'high_vulnerable'}
         
         # Add HR vulnerability ranking context
-        if normalized_pitcher in self.pitcher_hrs_rankings:
-            hrs_rank = self.pitcher_hrs_rankings[normalized_pitcher].get('league_rank_hrs', 999)
+        if hrs_rank is not None:
             if hrs_rank <= 10:
                 exploit_analysis['situational_advantages'].append(f"Pitcher ranks #{hrs_rank} worst in HRs allowed")
                 if 'league_context' not in exploit_analysis:
@@ -2247,11 +3361,7 @@ class EnhancedWeakspotAnalyzer:
                 exploit_analysis['league_context']['hrs_category'] = 'high_vulnerable'
         
         # Add compound ranking context for extra insight
-        if (normalized_pitcher in self.pitcher_hits_rankings and 
-            normalized_pitcher in self.pitcher_hrs_rankings):
-            hits_rank = self.pitcher_hits_rankings[normalized_pitcher].get('league_rank_hits', 999)
-            hrs_rank = self.pitcher_hrs_rankings[normalized_pitcher].get('league_rank_hrs', 999)
-            
+        if hits_rank is not None and hrs_rank is not None:
             if hits_rank <= 15 and hrs_rank <= 15:
                 exploit_analysis['situational_advantages'].append("Pitcher vulnerable in both hits & HRs (double threat)")
                 if 'league_context' not in exploit_analysis:
@@ -2318,13 +3428,14 @@ class EnhancedWeakspotAnalyzer:
                 exploit_analysis['batter_classification'] = 'marginal_opportunity'
         
         # Add comprehensive analytics metadata with enhanced arsenal analysis
-        exploit_analysis['expected_stats_gap'] = self.calculate_expected_stats_gap(normalized_batter)
-        exploit_analysis['barrel_matchup'] = self.calculate_barrel_matchup(normalized_batter, normalized_pitcher)
-        exploit_analysis['arsenal_vulnerability'] = self.calculate_arsenal_vulnerability(normalized_pitcher)
+        exploit_analysis['expected_stats_gap'] = batter_context.expected_stats_gap
+        exploit_analysis['barrel_matchup'] = self.calculate_barrel_matchup(normalized_batter, pitcher_context)
+        exploit_analysis['arsenal_vulnerability'] = pitcher_context.arsenal_vulnerability
         
         # NEW: Enhanced arsenal exploitation matchup analysis
-        arsenal_matchup = self.analyze_arsenal_exploitation_matchup(batter_name, pitcher_name)
+        arsenal_matchup = self.analyze_arsenal_exploitation_matchup(batter_name, pitcher_context)
         exploit_analysis['arsenal_exploitation'] = arsenal_matchup
+        features['arsenal_score'] = arsenal_matchup['exploitation_score']
         
         # Boost exploit score based on arsenal matchup strength
         if arsenal_matchup['exploitation_score'] > 20:
@@ -2339,7 +3450,7 @@ class EnhancedWeakspotAnalyzer:
             for advantage in arsenal_matchup['pitch_type_advantages'][:2]:  # Top 2 advantages
                 exploit_analysis['situational_advantages'].append(f"Arsenal: {advantage}")
         
-        exploit_analysis['data_quality'] = self.assess_overall_data_quality(normalized_batter, normalized_pitcher)
+        exploit_analysis['data_quality'] = self.assess_overall_data_quality(normalized_batter, pitcher_context)
         
         # PHASE 1 ENHANCEMENT: Add comprehensive enhanced analysis results
         exploit_analysis['handedness_analysis'] = handedness_analysis
@@ -2347,7 +3458,7 @@ class EnhancedWeakspotAnalyzer:
         exploit_analysis['multi_year_regression'] = regression_analysis
         
         # PHASE 1 ENHANCEMENT: Enhanced data quality scoring
-        enhanced_data_quality = self.calculate_enhanced_data_quality_score(batter_name, pitcher_name)
+        enhanced_data_quality = self.calculate_enhanced_data_quality_score(batter_name, pitcher_context)
         exploit_analysis['enhanced_data_quality'] = enhanced_data_quality
         
         # Apply data quality confidence multiplier
@@ -2366,6 +3477,7 @@ class EnhancedWeakspotAnalyzer:
         
         # Critical fix: Penalize confidence and score for TBD pitchers
         if pitcher_name.upper() in ['TBD', 'TO BE DECIDED', 'UNKNOWN']:
+            features['pitcher_tbd'] = 1.0
             exploit_analysis['exploit_score'] = max(30, exploit_analysis['exploit_score'] * 0.6)  # 40% penalty
             exploit_analysis['confidence'] = max(0.2, exploit_analysis['confidence'] * 0.4)  # Major confidence penalty
             exploit_analysis['exploit_factors'].append("Unknown pitcher reduces confidence")
@@ -2375,8 +3487,119 @@ class EnhancedWeakspotAnalyzer:
         enhanced_data_bonus = enhanced_data_quality['overall_score'] / 1000  # 0-0.1 bonus based on data completeness
         exploit_analysis['confidence'] = min(0.95, exploit_analysis['confidence'] + (base_data_points * 0.03) + enhanced_data_bonus)
         
+        # Keep the feature row so the whole slate can be re-scored in one vectorized pass
+        matchup_record = {
+            'player': batter_name,
+            'team': batter_team,
+            'pitcher': pitcher_name,
+            'score': exploit_analysis['exploit_score'],
+            'features': features,
+            'selection': None  # Filled in when the matchup goes through the selection cascade
+        }
+        exploit_analysis['matchup_record'] = matchup_record
+        self.slate_matchups.append(matchup_record)
+        
         return exploit_analysis
     
+    def apply_selection_thresholds(self, exploit_analysis, pitcher_analysis):
+        """
+        Selection cascade for one matchup under the scoring model
+        Starts from the base threshold and lowers it for every supporting signal (factors,
+        advantages, regression/contact edges, a vulnerable pitcher, known data quality,
+        a classification). Returns (combined score, threshold, selected).
+        """
+        selection = {
+            'confidence': exploit_analysis['confidence'],
+            'has_exploit_factors': float(bool(exploit_analysis.get('exploit_factors'))),
+            'has_situational_advantages': float(bool(exploit_analysis.get('situational_advantages'))),
+            'has_regression_opportunity': float(bool(exploit_analysis.get('regression_opportunity'))),
+            'has_contact_quality_edge': float(bool(exploit_analysis.get('contact_quality_edge'))),
+            'pitcher_vulnerability_score': pitcher_analysis.get('vulnerabilityScore', 50),
+            'has_data_quality': float(exploit_analysis.get('data_quality') in ['excellent', 'good', 'fair', 'limited']),
+            'classified': float(exploit_analysis.get('batter_classification') not in ['unknown'])
+        }
+        if 'matchup_record' in exploit_analysis:
+            exploit_analysis['matchup_record']['selection'] = selection
+        
+        combined_score = exploit_analysis['exploit_score'] * exploit_analysis['confidence']
+        final_threshold = selection_threshold(selection, self.scoring_model)
+        selected = (combined_score >= final_threshold and
+                    exploit_analysis['confidence'] >= self.scoring_model['selection']['min_confidence'])
+        return combined_score, final_threshold, selected
+    
+    def calculate_batter_quality_multiplier(self, custom_data):
+        """Batter quality multiplier (0.7 - 1.3) from barrel, discipline, speed and regression factors"""
+        if not custom_data:
+            return 1.0
+        
+        # Real performance metrics - create meaningful differentiation
+        barrel_percent = float(custom_data.get('barrel_percent', 0))
+        bb_percent = float(custom_data.get('bb_percent', 0))
+        k_percent = float(custom_data.get('k_percent', 0))
+        sprint_speed = float(custom_data.get('sprint_speed', 0))
+        
+        # Expected stats vs actual (regression potential)
+        xba_diff = float(custom_data.get('xba_diff', 0))  # BA - xBA (negative = underperforming)
+        xslg_diff = float(custom_data.get('xslg_diff', 0))  # SLG - xSLG (negative = underperforming)
+        
+        # BARREL RATE FACTOR (20% weight) - most predictive of power success
+        if barrel_percent >= 15:      # Elite (top 2%)
+            barrel_factor = 1.25
+        elif barrel_percent >= 12:    # Excellent (top 5%)
+            barrel_factor = 1.15
+        elif barrel_percent >= 9:     # Good (top 15%)
+            barrel_factor = 1.05
+        elif barrel_percent >= 6:     # Average (top 50%)
+            barrel_factor = 1.0
+        elif barrel_percent >= 3:     # Below average
+            barrel_factor = 0.95
+        else:                         # Poor
+            barrel_factor = 0.85
+            
+        # PLATE DISCIPLINE FACTOR (15% weight)
+        if bb_percent > 12 and k_percent < 18:    # Elite patience
+            discipline_factor = 1.15
+        elif bb_percent > 9 and k_percent < 22:   # Good patience  
+            discipline_factor = 1.08
+        elif bb_percent > 6 and k_percent < 25:   # Average
+            discipline_factor = 1.0
+        elif k_percent > 30:                      # Swing-happy
+            discipline_factor = 0.90
+        else:
+            discipline_factor = 0.95
+            
+        # SPEED FACTOR (10% weight) - affects BABIP and extra bases
+        if sprint_speed > 29:        # Elite speed
+            speed_factor = 1.1
+        elif sprint_speed > 27:      # Fast
+            speed_factor = 1.05
+        elif sprint_speed > 25:      # Average
+            speed_factor = 1.0
+        elif sprint_speed > 23:      # Slow
+            speed_factor = 0.97
+        else:                        # Very slow
+            speed_factor = 0.93
+            
+        # REGRESSION FACTOR (15% weight) - underperformance = opportunity
+        if xba_diff < -0.040 or xslg_diff < -0.060:    # Major underperformance
+            regression_factor = 1.20
+        elif xba_diff < -0.025 or xslg_diff < -0.035:  # Moderate underperformance
+            regression_factor = 1.10
+        elif xba_diff < -0.015 or xslg_diff < -0.020:  # Minor underperformance
+            regression_factor = 1.05
+        elif xba_diff > 0.025 or xslg_diff > 0.040:    # Overperforming (negative)
+            regression_factor = 0.90
+        else:                                          # Neutral
+            regression_factor = 1.0
+            
+        # COMBINE BATTER FACTORS (weighted average)
+        return (
+            barrel_factor * 0.35 +          # 35% weight - most important
+            discipline_factor * 0.25 +      # 25% weight 
+            speed_factor * 0.20 +           # 20% weight
+            regression_factor * 0.20        # 20% weight
+        )
+    
     def calculate_expected_stats_gap(self, batter_name):
         """Calculate expected statistics gap for regression opportunities"""
         batter_data = self.find_batter_data(batter_name)
@@ -2393,17 +3616,14 @@ class EnhancedWeakspotAnalyzer:
         
         return gaps if gaps else None
     
-    def calculate_barrel_matchup(self, batter_name, pitcher_name):
+    def calculate_barrel_matchup(self, batter_name, pitcher_context):
         """Calculate barrel rate matchup advantage"""
         hitter_barrel = 0
-        pitcher_barrel_allowed = 0
+        pitcher_barrel_allowed = pitcher_context.barrel_rate_allowed
         
         if batter_name in self.hitter_exit_velocity:
             hitter_barrel = self.hitter_exit_velocity[batter_name]['real_barrel_rate']
         
-        if pitcher_name in self.pitcher_exit_velocity:
-            pitcher_barrel_allowed = self.pitcher_exit_velocity[pitcher_name]['real_barrel_rate_allowed']
-        
         if hitter_barrel > 0 and pitcher_barrel_allowed > 0:
             advantage = (hitter_barrel * pitcher_barrel_allowed) / 100  # Compound advantage
             return {
@@ -2432,9 +3652,10 @@ class EnhancedWeakspotAnalyzer:
         
         return vulnerabilities if vulnerabilities else None
     
-    def assess_overall_data_quality(self, batter_name, pitcher_name):
+    def assess_overall_data_quality(self, batter_name, pitcher_context):
         """Assess overall data quality for the matchup"""
-        sources_available = 0
+        sources_available = (pitcher_context.in_custom_pitchers + pitcher_context.in_exit_velocity +
+                             pitcher_context.has_arsenal)
         
         if batter_name in self.custom_batters:
             sources_available += 1
@@ -2442,12 +3663,6 @@ class EnhancedWeakspotAnalyzer:
             sources_available += 1
         if batter_name in self.handedness_data:
             sources_available += 1
-        if pitcher_name in self.custom_pitchers:
-            sources_available += 1
-        if pitcher_name in self.pitcher_exit_velocity:
-            sources_available += 1
-        if pitcher_name in self.pitcher_arsenal:
-            sources_available += 1
         
         if sources_available >= 5:
             return 'excellent'
@@ -2458,254 +3673,420 @@ class EnhancedWeakspotAnalyzer:
         else:
             return 'limited'
     
-    def generate_enhanced_weakspot_exploiters(self, date):
-        """Generate comprehensive weakspot exploiters using all CSV data"""
-        print(f"🎯 Generating comprehensive weakspot exploiters for {date}...")
+    def analyze_game(self, game, date):
+        """Score both lineups of one game against the opposing starters (selected exploiters, unranked)"""
+        exploiters = []
+        home_team = game['teams']['home']['abbr']
+        away_team = game['teams']['away']['abbr']
+        home_pitcher = game['pitchers']['home']['name']
+        away_pitcher = game['pitchers']['away']['name']
+        venue = game['venue']['name']
+        game_id = game_summary(game)['gameId']
         
-        # Load starting lineups
-        lineups_data = self.load_starting_lineups(date)
+        print(f"🏟️ Comprehensive analysis: {away_team}@{home_team} at {venue}")
         
-        if not lineups_data or 'games' not in lineups_data:
-            print(f"❌ No starting lineups found for {date}")
-            print("🔄 Attempting fallback analysis with available data...")
-            # Fallback: Use recent data to generate some exploiters
-            return self.generate_fallback_exploiters(date)
+        # Enhanced pitcher vulnerability analysis
+        away_hitters = self.get_team_hitters(away_team, date)
+        home_pitcher_analysis = self.analyze_enhanced_pitcher_vulnerabilities(home_pitcher)
         
-        exploiters = []
-        games_analyzed = 0
+        print(f"   🎯 {home_pitcher}: Vulnerability Score {home_pitcher_analysis.get('vulnerabilityScore', 50)}/100")
         
-        # Comprehensive analysis using all 1,885+ data points  
-        for game in lineups_data['games']:  # Analyze ALL games for complete coverage
-            home_team = game['teams']['home']['abbr']
-            away_team = game['teams']['away']['abbr']
-            home_pitcher = game['pitchers']['home']['name']
-            away_pitcher = game['pitchers']['away']['name']
-            venue = game['venue']['name']
-            
-            print(f"🏟️ Comprehensive analysis: {away_team}@{home_team} at {venue}")
-            
-            # Enhanced pitcher vulnerability analysis
-            away_hitters = self.get_team_hitters(away_team, date)
-            home_pitcher_analysis = self.analyze_enhanced_pitcher_vulnerabilities(home_pitcher)
-            
-            print(f"   🎯 {home_pitcher}: Vulnerability Score {home_pitcher_analysis.get('vulnerabilityScore', 50)}/100")
-            
-            # Generate multiple exploiters per matchup using sophisticated algorithms
-            for hitter in away_hitters:
-                try:
-                    exploit_analysis = self.analyze_enhanced_batter_exploit_potential(
-                        hitter['name'], 
-                        home_pitcher, 
-                        home_pitcher_analysis,
-                        venue,
-                        away_team,
-                        home_team  # Pass home team to determine if batter is away
+        # Generate multiple exploiters per matchup using sophisticated algorithms
+        for hitter, exploit_analysis in self.extract_lineup(away_hitters, home_pitcher, home_pitcher_analysis,
+                                                            venue, away_team, home_team):
+            try:
+                # Multi-tier scoring with dynamic thresholds (scoring model selection cascade)
+                combined_score, final_threshold, selected = self.apply_selection_thresholds(
+                    exploit_analysis, home_pitcher_analysis)
+                
+                # DEBUG: Log threshold decisions
+                print(f"      🔍 {hitter['name']}: Score={exploit_analysis['exploit_score']:.1f}, Confidence={exploit_analysis['confidence']:.3f}, Combined={combined_score:.1f}, Threshold={final_threshold}")
+                
+                if selected:
+                    exploiter = self.build_exploiter(
+                        game_id, hitter['name'], away_team, home_pitcher, home_team, venue,
+                        home_pitcher_analysis, exploit_analysis, combined_score
                     )
                     
-                    # Multi-tier scoring with dynamic thresholds
-                    combined_score = exploit_analysis['exploit_score'] * exploit_analysis['confidence']
-                    
-                    # EXTREMELY INCLUSIVE APPROACH: Generate opportunities across ALL games
-                    base_threshold = 1.0  # Very low base threshold
-                    confidence_threshold = 0.08  # Very forgiving confidence threshold
-                    
-                    # AGGRESSIVE threshold reductions to ensure comprehensive coverage
-                    if exploit_analysis.get('exploit_factors'):  # Has ANY factors
-                        base_threshold -= 0.5  # Small reductions, not large jumps
-                    if exploit_analysis.get('situational_advantages'):
-                        base_threshold -= 0.5
-                    if exploit_analysis.get('regression_opportunity'):
-                        base_threshold -= 1.0  # Regression opportunities are valuable
-                    if exploit_analysis.get('contact_quality_edge'):
-                        base_threshold -= 0.5
-                    if home_pitcher_analysis.get('vulnerabilityScore', 50) >= 45:  # Much lower bar
-                        base_threshold -= 0.5
-                    if exploit_analysis.get('data_quality') in ['excellent', 'good', 'fair', 'limited']:  # Include all data
-                        base_threshold -= 0.5
-                    if exploit_analysis.get('batter_classification') not in ['unknown']:
-                        base_threshold -= 0.5  # Reward any classification
-                    
-                    # Minimum threshold of 0.1 to ensure we get opportunities from all games
-                    final_threshold = max(0.1, base_threshold)
-                    
-                    # DEBUG: Log threshold decisions
-                    print(f"      🔍 {hitter['name']}: Score={exploit_analysis['exploit_score']:.1f}, Confidence={exploit_analysis['confidence']:.3f}, Combined={combined_score:.1f}, Threshold={final_threshold}")
+                    exploiters.append(exploiter)
+                    print(f"      ✅ {hitter['name']}: Score={exploit_analysis['exploit_score']:.1f}, Combined={combined_score:.1f}")
                     
-                    if combined_score >= final_threshold and exploit_analysis['confidence'] >= confidence_threshold:
-                        # Generate comprehensive justification combining all data sources
-                        comprehensive_justification = self.generate_comprehensive_justification(
-                            hitter['name'], home_pitcher, home_pitcher_analysis, exploit_analysis
-                        )
-                        
-                        # Build modernAnalytics structure first
-                        modern_analytics = {
-                            'expectedStatsGap': exploit_analysis.get('expected_stats_gap'),
-                            'barrelMatchup': exploit_analysis.get('barrel_matchup'),
-                            'arsenalVulnerability': exploit_analysis.get('arsenal_vulnerability'),
-                            'arsenalExploitation': exploit_analysis.get('arsenal_exploitation')  # NEW: Enhanced analysis
-                        }
-                        
-                        # Generate detailed exploit factors from all available data
-                        detailed_exploit_factors = self.generate_detailed_exploit_factors(
-                            hitter['name'], home_pitcher, home_pitcher_analysis, modern_analytics
-                        )
-                        
-                        exploiter = {
-                            'player': hitter['name'],
-                            'team': away_team,
-                            'pitcher': home_pitcher,
-                            'opposingTeam': home_team,
-                            'venue': venue,
-                            'exploitIndex': round(exploit_analysis['exploit_score'], 1),
-                            'confidence': round(exploit_analysis['confidence'], 3),
-                            'combinedScore': round(combined_score, 1),
-                            'batterClassification': exploit_analysis['batter_classification'],
-                            'keyWeakness': self.extract_key_weakness(home_pitcher_analysis, exploit_analysis),
-                            'comprehensiveJustification': comprehensive_justification,  # NEW: Enhanced justification
-                            'exploitFactors': detailed_exploit_factors,  # NEW: Enhanced multi-factor analysis
-                            'situationalAdvantages': exploit_analysis['situational_advantages'][:3],
-                            'regressionOpportunity': exploit_analysis.get('regression_opportunity'),
-                            'contactQualityEdge': exploit_analysis.get('contact_quality_edge'),
-                            'arsenalExploitation': exploit_analysis.get('arsenal_exploitation', {}),  # NEW: Arsenal exploitation analysis
-                            'handednessAnalysis': exploit_analysis.get('handedness_analysis'),
-                            'parkAdjustment': exploit_analysis.get('park_adjustment', 1.0),
-                            'weatherFactor': exploit_analysis.get('weather_factor', 1.0),
-                            'recentFormContext': exploit_analysis.get('recent_form_context', {}),
-                            'lineupContext': exploit_analysis.get('lineup_context', {}),
-                            'modernAnalytics': modern_analytics,
-                            'dataQuality': exploit_analysis.get('data_quality', 'good'),
-                            'analysisTimestamp': datetime.now().isoformat()
-                        }
-                        
-                        exploiters.append(exploiter)
-                        print(f"      ✅ {hitter['name']}: Score={exploit_analysis['exploit_score']:.1f}, Combined={combined_score:.1f}")
-                        
-                        # Show detailed advantages for top opportunities
-                        if combined_score >= 50:
-                            advantages = exploit_analysis.get('situational_advantages', [])
-                            if advantages:
-                                print(f"         🎯 Key Advantages: {', '.join(advantages[:2])}")
-                            if exploit_analysis.get('regression_opportunity'):
-                                print(f"         📈 Regression Boost: {exploit_analysis['regression_opportunity']['type']}")
-                
-                except Exception as e:
-                    print(f"      ❌ Error analyzing {hitter['name']}: {e}")
-                    continue
+                    # Show detailed advantages for top opportunities
+                    if combined_score >= 50:
+                        advantages = exploit_analysis.get('situational_advantages', [])
+                        if advantages:
+                            print(f"         🎯 Key Advantages: {', '.join(advantages[:2])}")
+                        if exploit_analysis.get('regression_opportunity'):
+                            print(f"         📈 Regression Boost: {exploit_analysis['regression_opportunity']['type']}")
             
-            # Analyze home hitters vs away pitcher
-            home_hitters = self.get_team_hitters(home_team, date)
-            away_pitcher_analysis = self.analyze_enhanced_pitcher_vulnerabilities(away_pitcher)
-            
-            print(f"   🎯 {away_pitcher}: Vulnerability Score {away_pitcher_analysis.get('vulnerabilityScore', 50)}/100")
-            
-            for hitter in home_hitters:
-                try:
-                    exploit_analysis = self.analyze_enhanced_batter_exploit_potential(
-                        hitter['name'], 
-                        away_pitcher, 
-                        away_pitcher_analysis,
-                        venue,
-                        home_team,
-                        home_team  # Pass home team - these are home team hitters
+            except Exception as e:
+                print(f"      ❌ Error analyzing {hitter['name']}: {e}")
+                continue
+        
+        # Analyze home hitters vs away pitcher
+        home_hitters = self.get_team_hitters(home_team, date)
+        away_pitcher_analysis = self.analyze_enhanced_pitcher_vulnerabilities(away_pitcher)
+        
+        print(f"   🎯 {away_pitcher}: Vulnerability Score {away_pitcher_analysis.get('vulnerabilityScore', 50)}/100")
+        
+        for hitter, exploit_analysis in self.extract_lineup(home_hitters, away_pitcher, away_pitcher_analysis,
+                                                            venue, home_team, home_team):
+            try:
+                # Multi-tier scoring with dynamic thresholds (scoring model selection cascade)
+                combined_score, final_threshold, selected = self.apply_selection_thresholds(
+                    exploit_analysis, away_pitcher_analysis)
+                
+                # DEBUG: Log threshold decisions
+                print(f"      🔍 {hitter['name']}: Score={exploit_analysis['exploit_score']:.1f}, Confidence={exploit_analysis['confidence']:.3f}, Combined={combined_score:.1f}, Threshold={final_threshold}")
+                
+                if selected:
+                    exploiter = self.build_exploiter(
+                        game_id, hitter['name'], home_team, away_pitcher, away_team, venue,
+                        away_pitcher_analysis, exploit_analysis, combined_score
                     )
                     
-                    combined_score = exploit_analysis['exploit_score'] * exploit_analysis['confidence']
-                    
-                    # SAME EXTREMELY INCLUSIVE APPROACH for away team
-                    base_threshold = 1.0  # Very low base threshold  
-                    confidence_threshold = 0.08  # Very forgiving confidence threshold
-                    
-                    # AGGRESSIVE threshold reductions to ensure comprehensive coverage
-                    if exploit_analysis.get('exploit_factors'):  # Has ANY factors
-                        base_threshold -= 0.5  # Small reductions, not large jumps
-                    if exploit_analysis.get('situational_advantages'):
-                        base_threshold -= 0.5
-                    if exploit_analysis.get('regression_opportunity'):
-                        base_threshold -= 1.0  # Regression opportunities are valuable
-                    if exploit_analysis.get('contact_quality_edge'):
-                        base_threshold -= 0.5
-                    if away_pitcher_analysis.get('vulnerabilityScore', 50) >= 45:  # Much lower bar
-                        base_threshold -= 0.5
-                    if exploit_analysis.get('data_quality') in ['excellent', 'good', 'fair', 'limited']:  # Include all data
-                        base_threshold -= 0.5
-                    if exploit_analysis.get('batter_classification') not in ['unknown']:
-                        base_threshold -= 0.5  # Reward any classification
-                    
-                    # Minimum threshold of 0.1 to ensure we get opportunities from all games
-                    final_threshold = max(0.1, base_threshold)
-                    
-                    # DEBUG: Log threshold decisions
-                    print(f"      🔍 {hitter['name']}: Score={exploit_analysis['exploit_score']:.1f}, Confidence={exploit_analysis['confidence']:.3f}, Combined={combined_score:.1f}, Threshold={final_threshold}")
+                    exploiters.append(exploiter)
+                    print(f"      ✅ {hitter['name']}: Score={exploit_analysis['exploit_score']:.1f}, Combined={combined_score:.1f}")
                     
-                    if combined_score >= final_threshold and exploit_analysis['confidence'] >= confidence_threshold:
-                        # Generate comprehensive justification combining all data sources
-                        comprehensive_justification = self.generate_comprehensive_justification(
-                            hitter['name'], away_pitcher, away_pitcher_analysis, exploit_analysis
-                        )
-                        
-                        # Build modernAnalytics structure first
-                        modern_analytics = {
-                            'expectedStatsGap': exploit_analysis.get('expected_stats_gap'),
-                            'barrelMatchup': exploit_analysis.get('barrel_matchup'),
-                            'arsenalVulnerability': exploit_analysis.get('arsenal_vulnerability'),
-                            'arsenalExploitation': exploit_analysis.get('arsenal_exploitation')  # NEW: Enhanced analysis
-                        }
-                        
-                        # Generate detailed exploit factors from all available data
-                        detailed_exploit_factors = self.generate_detailed_exploit_factors(
-                            hitter['name'], away_pitcher, away_pitcher_analysis, modern_analytics
-                        )
-                        
-                        exploiter = {
-                            'player': hitter['name'],
-                            'team': home_team,
-                            'pitcher': away_pitcher,
-                            'opposingTeam': away_team,
-                            'venue': venue,
-                            'exploitIndex': round(exploit_analysis['exploit_score'], 1),
-                            'confidence': round(exploit_analysis['confidence'], 3),
-                            'combinedScore': round(combined_score, 1),
-                            'batterClassification': exploit_analysis['batter_classification'],
-                            'keyWeakness': self.extract_key_weakness(away_pitcher_analysis, exploit_analysis),
-                            'comprehensiveJustification': comprehensive_justification,  # NEW: Enhanced justification
-                            'exploitFactors': detailed_exploit_factors,  # NEW: Enhanced multi-factor analysis
-                            'situationalAdvantages': exploit_analysis['situational_advantages'][:3],
-                            'regressionOpportunity': exploit_analysis.get('regression_opportunity'),
-                            'contactQualityEdge': exploit_analysis.get('contact_quality_edge'),
-                            'arsenalExploitation': exploit_analysis.get('arsenal_exploitation', {}),  # NEW: Arsenal exploitation analysis
-                            'handednessAnalysis': exploit_analysis.get('handedness_analysis'),
-                            'parkAdjustment': exploit_analysis.get('park_adjustment', 1.0),
-                            'weatherFactor': exploit_analysis.get('weather_factor', 1.0),
-                            'recentFormContext': exploit_analysis.get('recent_form_context', {}),
-                            'lineupContext': exploit_analysis.get('lineup_context', {}),
-                            'modernAnalytics': modern_analytics,
-                            'dataQuality': exploit_analysis.get('data_quality', 'good'),
-                            'analysisTimestamp': datetime.now().isoformat()
-                        }
-                        
-                        exploiters.append(exploiter)
-                        print(f"      ✅ {hitter['name']}: Score={exploit_analysis['exploit_score']:.1f}, Combined={combined_score:.1f}")
-                        
-                        if combined_score >= 50:
-                            advantages = exploit_analysis.get('situational_advantages', [])
-                            if advantages:
-                                print(f"         🎯 Key Advantages: {', '.join(advantages[:2])}")
-                            if exploit_analysis.get('regression_opportunity'):
-                                print(f"         📈 Regression Boost: {exploit_analysis['regression_opportunity']['type']}")
-                
+                    if combined_score >= 50:
+                        advantages = exploit_analysis.get('situational_advantages', [])
+                        if advantages:
+                            print(f"         🎯 Key Advantages: {', '.join(advantages[:2])}")
+                        if exploit_analysis.get('regression_opportunity'):
+                            print(f"         📈 Regression Boost: {exploit_analysis['regression_opportunity']['type']}")
+            
+            except Exception as e:
+                print(f"      ❌ Error analyzing {hitter['name']}: {e}")
+                continue
+        return exploiters
+    
+    def extract_lineup(self, hitters, pitcher_name, pitcher_analysis, venue, batting_team, home_team):
+        """
+        Stage one for a lineup against one starter: each hitter's exploit analysis and feature row
+        Hitters whose analysis fails are logged and left out; the rest are then scored as one
+        batch under the scoring model. Returns [(hitter, exploit_analysis)].
+        """
+        analyses = []
+        for hitter in hitters:
+            try:
+                analyses.append((hitter, self.analyze_enhanced_batter_exploit_potential(
+                    hitter['name'], pitcher_name, pitcher_analysis, venue, batting_team, home_team)))
+            except Exception as e:
+                print(f"      ❌ Error analyzing {hitter['name']}: {e}")
+        self.apply_scoring_model([exploit_analysis for _, exploit_analysis in analyses])
+        return analyses
+    
+    def apply_scoring_model(self, exploit_analyses):
+        """
+        Stage two under a custom scoring model: score the matchups' feature rows in one batch
+        The model's scores replace the scalar ones (in the analysis and its matchup record), so
+        the written exploitIndex, combinedScore and selection all come from that one model.
+        DEFAULT_MODEL is what the scalar path computes, so it leaves the scores alone.
+        """
+        if self.scoring_model is DEFAULT_MODEL or not exploit_analyses:
+            return
+        scores = score_exploit_batch(feature_matrix(exploit_analysis['matchup_record']['features']
+                                                    for exploit_analysis in exploit_analyses), self.scoring_model)
+        for exploit_analysis, score in zip(exploit_analyses, scores):
+            exploit_analysis['exploit_score'] = exploit_analysis['matchup_record']['score'] = float(score)
+    
+    def score_lineup_against(self, hitters, pitcher_name, venue, batting_team, home_team):
+        """Exploit rows for a lineup against one starter, ranked (selection applied, nothing recorded)"""
+        pitcher_analysis = self.analyze_enhanced_pitcher_vulnerabilities(pitcher_name)
+        first_matchup = len(self.slate_matchups)
+        rows = []
+        try:
+            for hitter, exploit_analysis in self.extract_lineup(hitters, pitcher_name, pitcher_analysis,
+                                                                venue, batting_team, home_team):
+                try:
+                    combined_score, final_threshold, selected = self.apply_selection_thresholds(
+                        exploit_analysis, pitcher_analysis)
                 except Exception as e:
                     print(f"      ❌ Error analyzing {hitter['name']}: {e}")
                     continue
-            
-            games_analyzed += 1
+                rows.append({
+                    'player': hitter['name'],
+                    'team': batting_team,
+                    'pitcher': pitcher_name,
+                    'exploitIndex': round(exploit_analysis['exploit_score'], 1),
+                    'confidence': round(exploit_analysis['confidence'], 3),
+                    'combinedScore': round(combined_score, 1),
+                    'selected': selected,
+                    'batterClassification': exploit_analysis['batter_classification'],
+                    'situationalAdvantages': exploit_analysis['situational_advantages'][:3]
+                })
+        finally:
+            del self.slate_matchups[first_matchup:]  # What-if rows stay out of the slate's feature matrix
+        
+        rows.sort(key=exploiter_rank, reverse=True)
+        for rank, row in enumerate(rows, 1):
+            row['rank'] = rank
+        return pitcher_analysis, rows
+    
+    def slate_rows(self, hitters, batting_team, pitcher_name, date):
+        """
+        Ranked rows for a lineup against its slate starter, from the slate run's matchup records
+        Uses this run's records, else the date's saved feature matrix; None when any hitter
+        has no record there (e.g. the lineup changed since), so the caller re-scores instead.
+        """
+        matchups = [matchup for matchup in self.slate_matchups
+                    if matchup['team'] == batting_team and matchup['pitcher'] == pitcher_name
+                    and matchup['selection'] is not None]
+        if not matchups:
+            matrix_file = self.data_path / "weakspot_exploiters" / f"weakspot_feature_matrix_{date}.json"
+            try:
+                with open(matrix_file, 'r') as f:
+                    payload = json.load(f)
+            except (OSError, ValueError):
+                return None
+            selection_names = payload['selection_features']
+            matchups = [{
+                'player': matchup['player'],
+                'score': matchup['score'],
+                'selection': dict(zip(selection_names, matchup['selection']))
+            } for matchup in payload['matchups']
+                if matchup['team'] == batting_team and matchup['pitcher'] == pitcher_name]
+        
+        by_player = {matchup['player']: matchup for matchup in matchups}
+        if not hitters or any(hitter['name'] not in by_player for hitter in hitters):
+            return None
+        
+        rows = []
+        for hitter in hitters:
+            matchup = by_player[hitter['name']]
+            selection = matchup['selection']
+            confidence = selection['confidence']
+            combined_score = matchup['score'] * confidence
+            rows.append({
+                'player': hitter['name'],
+                'team': batting_team,
+                'pitcher': pitcher_name,
+                'exploitIndex': round(matchup['score'], 1),
+                'confidence': round(confidence, 3),
+                'combinedScore': round(combined_score, 1),
+                'selected': (combined_score >= selection_threshold(selection, self.scoring_model) and
+                             confidence >= self.scoring_model['selection']['min_confidence']),
+                # Same order as exploiter_rank, with the advantage count reduced to a flag
+                'sortKey': (round(combined_score, 1), selection.get('has_situational_advantages', 0),
+                            selection.get('has_regression_opportunity', 0), selection.get('has_contact_quality_edge', 0))
+            })
+        
+        rows.sort(key=lambda row: row.pop('sortKey'), reverse=True)
+        for rank, row in enumerate(rows, 1):
+            row['rank'] = rank
+        return rows
+    
+    def rank_replacement_starter(self, pitcher_name, previous_pitcher):
+        """
+        League rankings for a starter who isn't on the slate
+        Ranks the pitcher's last 60 days against today's starters (with the one being
+        replaced taken out). Returns the (rankings dict, key) entries it added, for cleanup.
+        """
+        normalized_name = self.normalize_name(pitcher_name)
+        if normalized_name in self.pitcher_hits_rankings and normalized_name in self.pitcher_hrs_rankings:
+            return []
+        
+        name_index = NameIndex([([normalized_name], normalized_name)])
+        pitcher_totals, _ = self.pitcher_allowed_totals(lambda name: name in name_index)
+        if not pitcher_totals:
+            return []
+        
+        previous_name = self.normalize_name(previous_pitcher)
+        pool = {key: data for key, data in self.starter_allowed_totals.items()
+                if self.normalize_name(data['name']) != previous_name}
+        pool.update(pitcher_totals)
+        replacement_names = {self.normalize_name(data['name']) for data in pitcher_totals.values()}
+        
+        added = []
+        for stat, rankings in (('hits', self.pitcher_hits_rankings), ('hrs', self.pitcher_hrs_rankings)):
+            if normalized_name in rankings:
+                continue
+            for ranked_name, entry in self.rank_pitcher_totals(pool, stat).items():
+                if ranked_name in replacement_names:
+                    rankings[normalized_name] = entry
+            if normalized_name in rankings:
+                added.append((rankings, normalized_name))
+        return added
+    
+    def pitcher_swap_whatif(self, game, side, new_pitcher, date=None):
+        """
+        Re-rank a lineup against a replacement starter
+        `game` is a lineups-file gameId or "AWAY@HOME"; `side` ('home'/'away') is the team whose
+        starter changes, so the other team's hitters are re-scored. Only the new pitcher's
+        context is built; batter contexts are shared with the slate run (or built once here).
+        A starter who isn't on the slate is ranked and given historical rows on demand; the
+        previous ranks come from the slate run's matchups when they're available.
+        """
+        started = time.time()
+        date = date or self.target_date
+        side = side.lower()
+        if side not in ('home', 'away'):
+            raise ValueError(f"side must be 'home' or 'away', not {side!r}")
+        
+        lineups_data = self.load_starting_lineups(date) or {}
+        for entry in lineups_data.get('games', []):
+            summary = game_summary(entry)
+            if str(game) in (summary['gameId'], f"{summary['away']}@{summary['home']}"):
+                break
+        else:
+            raise ValueError(f"Game {game} not found in the {date} lineups")
+        
+        batting_team = summary['away'] if side == 'home' else summary['home']
+        previous_pitcher = summary['pitchers'][side]
+        hitters = self.get_team_hitters(batting_team, date)
+        
+        previous_rows = self.slate_rows(hitters, batting_team, previous_pitcher, date)
+        previous_source = 'slate'
+        if previous_rows is None:
+            _, previous_rows = self.score_lineup_against(hitters, previous_pitcher, summary['venue'],
+                                                         batting_team, summary['home'])
+            previous_source = 'rescored'
+        
+        # A replacement from outside the slate has no rankings or (filtered) history yet
+        added_rankings = self.rank_replacement_starter(new_pitcher, previous_pitcher)
+        added_history = []
+        participants = self.participants
+        if participants is not None and not participants.matches(new_pitcher):
+            replacement = ParticipantSet(self.player_registry)
+            replacement.add(new_pitcher, team=summary[side])
+            added_history = self.load_player_history(replacement)
+        if added_rankings or added_history:
+            self.pitcher_contexts.pop(new_pitcher, None)  # Rebuild with the new data
+        try:
+            pitcher_analysis, rows = self.score_lineup_against(hitters, new_pitcher, summary['venue'],
+                                                               batting_team, summary['home'])
+        finally:
+            # What-if only: the slate keeps its own rankings and participant-filtered history
+            for table, key in added_rankings + added_history:
+                del table[key]
+            if added_rankings or added_history:
+                self.pitcher_contexts.pop(new_pitcher, None)
+        
+        previous = {row['player']: row for row in previous_rows}
+        for row in rows:
+            before = previous.get(row['player'])
+            row['previousRank'] = before['rank'] if before else None
+            row['previousCombinedScore'] = before['combinedScore'] if before else None
+        
+        return {
+            'game': summary,
+            'side': side,
+            'previousPitcher': previous_pitcher,
+            'previousSource': previous_source,
+            'pitcher': new_pitcher,
+            'vulnerabilityScore': pitcher_analysis.get('vulnerabilityScore', 50),
+            'rows': rows,
+            'elapsedMs': round((time.time() - started) * 1000, 1)
+        }
+    
+    def print_pitcher_swap(self, result):
+        """Console table for a pitcher_swap_whatif result"""
+        game = result['game']
+        print(f"🔁 What-if {game['away']}@{game['home']}: {result['previousPitcher']} → {result['pitcher']} "
+              f"(vulnerability {result['vulnerabilityScore']}/100, {result['elapsedMs']:.0f} ms, "
+              f"previous ranks {result['previousSource']})")
+        for row in result['rows']:
+            moved = '' if row['previousRank'] is None else f" (was #{row['previousRank']}, {row['previousCombinedScore']:.1f})"
+            marker = '✅' if row['selected'] else '  '
+            print(f"   {marker} #{row['rank']:<2} {row['player']} ({row['team']}): combined {row['combinedScore']:.1f}{moved}")
+    
+    def analyze_games_parallel(self, games, date, order=None):
+        """
+        Fan the slate's games out to a forked process pool
+        Every data source is loaded before the fork so workers share it copy-on-write. Each
+        worker returns its game's exploiters, matchup records, deferred text inputs and log
+        output; they are merged back in slate order, so results match a serial run.
+        """
+        global _FORK_STATE
+        import multiprocessing
+        
+        if len(self.loaded_sources) < len(self.loader_dependencies()):
+            self.load_all_data()
+        workers = min(self.workers, len(games))
+        print(f"🧵 Analyzing {len(games)} games with {workers} worker processes")
+        
+        _FORK_STATE = (self, games, date)
+        try:
+            with multiprocessing.get_context('fork').Pool(workers) as pool:
+                game_order = order if order is not None else range(len(games))
+                for exploiters, matchups, deferred_text, log in pool.imap(_analyze_game_worker, game_order):
+                    sys.stdout.write(log)
+                    self.slate_matchups.extend(matchups)
+                    self.deferred_text.update(deferred_text)
+                    yield exploiters
+        finally:
+            _FORK_STATE = None
+    
+    def generate_enhanced_weakspot_exploiters(self, date):
+        """Generate comprehensive weakspot exploiters using all CSV data"""
+        print(f"🎯 Generating comprehensive weakspot exploiters for {date}...")
+        
+        # Load starting lineups
+        lineups_data = self.load_starting_lineups(date)
+        
+        if not lineups_data or 'games' not in lineups_data:
+            print(f"❌ No starting lineups found for {date}")
+            print("🔄 Attempting fallback analysis with available data...")
+            # Fallback: Use recent data to generate some exploiters
+            return self.generate_fallback_exploiters(date)
+        
+        games = lineups_data['games']  # Analyze ALL games for complete coverage
+        self.slate_games = [game_summary(game) for game in games]
+        
+        # Streaming: first-pitch order, each game's shard written as soon as it finishes
+        order = list(range(len(games)))
+        if self.stream:
+            order.sort(key=lambda index: first_pitch_key(games[index]))
+            stream = self.start_stream(date)
+        
+        # Incremental: games whose lineup fingerprint is unchanged are merged from the previous run
+        game_fingerprints = [game_fingerprint(game) for game in games]
+        cached_games = self.load_incremental_cache(date) if self.incremental else {}
+        reused = {index: cached_games[fp] for index, fp in enumerate(game_fingerprints) if fp in cached_games}
+        to_score = [index for index in order if index not in reused]
+        
+        # Comprehensive analysis using all 1,885+ data points  
+        if self.workers > 1 and len(to_score) > 1 and fork_available():
+            game_results = self.analyze_games_parallel(games, date, to_score)
+        else:
+            game_results = (self.analyze_game(games[index], date) for index in to_score)
+        
+        results_by_game, matchups_by_game, game_cache = {}, {}, {}
+        for index in (index for index in order if index in reused):
+            results_by_game[index], matchups_by_game[index] = self.restore_cached_game(reused[index])
+            game_cache[game_fingerprints[index]] = reused[index]
+            print(f"♻️ {self.slate_games[index]['away']}@{self.slate_games[index]['home']}: lineups unchanged, "
+                  f"reused {len(results_by_game[index])} exploiters")
+            if self.stream:
+                self.stream_game(stream, self.slate_games[index], results_by_game[index])
+        
+        first_matchup = len(self.slate_matchups)
+        for index, game_exploiters in zip(to_score, game_results):
+            results_by_game[index] = game_exploiters
+            matchups_by_game[index] = self.slate_matchups[first_matchup:]
+            first_matchup = len(self.slate_matchups)
+            if self.incremental:
+                # Pickled now, before ranking/text materialization touch the rows
+                game_cache[game_fingerprints[index]] = self.cached_game(game_exploiters, matchups_by_game[index])
+            if self.stream:
+                self.stream_game(stream, self.slate_games[index], game_exploiters)
+        games_analyzed = len(results_by_game)
+        
+        if self.incremental:
+            self.save_incremental_cache(date, game_cache)
+            print(f"♻️ Incremental run: {len(to_score)} games scored, {len(reused)} reused")
+        
+        # Merged in slate order, so streaming doesn't change the ranked output
+        exploiters = [exploiter for index in sorted(results_by_game) for exploiter in results_by_game[index]]
+        self.slate_matchups = [matchup for index in sorted(matchups_by_game) for matchup in matchups_by_game[index]]
         
         # Advanced multi-tier ranking system
-        exploiters.sort(key=lambda x: (
-            x['combinedScore'],
-            len(x.get('situationalAdvantages', [])),
-            1 if x.get('regressionOpportunity') else 0,
-            1 if x.get('contactQualityEdge') else 0
-        ), reverse=True)
+        exploiters.sort(key=exploiter_rank, reverse=True)
+        
+        # Text fields only for the ranked top N (the rest on demand via --explain)
+        if self.text_top_n is not None:
+            self.materialize_exploiter_text(exploiters)
+            self.save_deferred_text(date)
         
         print(f"🎯 Comprehensive analysis complete: {len(exploiters)} sophisticated exploiters from {games_analyzed} games")
         print(f"📊 Analysis utilized {len(self.hitter_exit_velocity) + len(self.pitcher_exit_velocity) + len(self.custom_batters) + len(self.custom_pitchers)} total data points")
@@ -2779,6 +4160,7 @@ class EnhancedWeakspotAnalyzer:
                     'Generic Stadium',
                     hitter.get('team', 'TBD')
                 )
+                self.apply_scoring_model([exploit_analysis])
                 
                 combined_score = exploit_analysis['exploit_score'] * exploit_analysis['confidence']
                 
@@ -2838,49 +4220,17 @@ class EnhancedWeakspotAnalyzer:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                count = 0
-                
-                for row in reader:
-                    player_name = self.normalize_name(row['last_name, first_name'])
-                    
-                    def safe_int(value, default=0):
-                        try:
-                            return int(value) if value and value.strip() else default
-                        except (ValueError, AttributeError):
-                            return default
-                    
-                    def safe_float(value, default=0.0):
-                        try:
-                            return float(value) if value and value.strip() else default
-                        except (ValueError, AttributeError):
-                            return default
-                    
-                    self.hitter_exit_velocity[player_name] = {
-                        'attempts': safe_int(row.get('attempts', 0)),
-                        'real_barrel_rate': safe_float(row.get('brl_percent', 0)),
-                        'barrel_count': safe_int(row.get('barrels', 0)),
-                        'barrel_pa': safe_float(row.get('brl_pa', 0)),
-                        'avg_hit_speed': safe_float(row.get('avg_hit_speed', 0)),
-                        'max_hit_speed': safe_float(row.get('max_hit_speed', 0)),
-                        'ev50': safe_float(row.get('ev50', 0)),
-                        'ev95_plus': safe_int(row.get('ev95plus', 0)),
-                        'ev95_percent': safe_float(row.get('ev95percent', 0)),
-                        'sweet_spot_percent': safe_float(row.get('anglesweetspotpercent', 0)),
-                        'avg_hit_angle': safe_float(row.get('avg_hit_angle', 0)),
-                        'max_distance': safe_int(row.get('max_distance', 0)),
-                        'avg_distance': safe_int(row.get('avg_distance', 0)),
-                        'avg_hr_distance': safe_int(row.get('avg_hr_distance', 0)),
-                        'flyball_linedrive_rate': safe_float(row.get('fbld', 0)),
-                        'groundball_rate': safe_float(row.get('gb', 0)),
-                        'player_id': row.get('player_id', ''),
-                        'data_quality': self.assess_data_quality(safe_int(row.get('attempts', 0)), 'hitter')
-                    }
-                    count += 1
-                
-                print(f"   📊 Loaded real exit velocity data for {count} hitters")
-                
+            count = 0
+            
+            for player_name, record in HITTER_EXIT_VELOCITY_SCHEMA.records(
+                    load_columnar(file_path), split=('name',), extra=('data_quality',)):
+                player_name = self.normalize_name(player_name)
+                record['data_quality'] = self.assess_data_quality(record['attempts'], 'hitter')
+                self.hitter_exit_velocity[player_name] = record
+                count += 1
+            
+            print(f"   📊 Loaded real exit velocity data for {count} hitters")
+            
         except Exception as e:
             print(f"❌ Error loading hitter exit velocity data: {e}")
     
@@ -2893,50 +4243,17 @@ class EnhancedWeakspotAnalyzer:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                count = 0
-                
-                for row in reader:
-                    player_name = self.normalize_name(row['last_name, first_name'])
-                    
-                    def safe_int(value, default=0):
-                        try:
-                            return int(value) if value and value.strip() else default
-                        except (ValueError, AttributeError):
-                            return default
-                    
-                    def safe_float(value, default=0.0):
-                        try:
-                            return float(value) if value and value.strip() else default
-                        except (ValueError, AttributeError):
-                            return default
-                    
-                    self.pitcher_exit_velocity[player_name] = {
-                        'attempts': safe_int(row.get('attempts', 0)),
-                        'real_barrel_rate_allowed': safe_float(row.get('brl_percent', 0)),
-                        'barrels_allowed': safe_int(row.get('barrels', 0)),
-                        'barrel_pa_allowed': safe_float(row.get('brl_pa', 0)),
-                        'avg_hit_speed_allowed': safe_float(row.get('avg_hit_speed', 0)),
-                        'max_hit_speed_allowed': safe_float(row.get('max_hit_speed', 0)),
-                        'hard_hit_percent_allowed': safe_float(row.get('hard_hit_percent', 0)),
-                        'ev50_allowed': safe_float(row.get('ev50', 0)),
-                        'ev95_plus_allowed': safe_int(row.get('ev95plus', 0)),
-                        'ev95_percent_allowed': safe_float(row.get('ev95percent', 0)),
-                        'sweet_spot_percent_allowed': safe_float(row.get('anglesweetspotpercent', 0)),
-                        'avg_hit_angle_allowed': safe_float(row.get('avg_hit_angle', 0)),
-                        'max_distance_allowed': safe_int(row.get('max_distance', 0)),
-                        'avg_distance_allowed': safe_int(row.get('avg_distance', 0)),
-                        'avg_hr_distance_allowed': safe_int(row.get('avg_hr_distance', 0)),
-                        'flyball_linedrive_rate_allowed': safe_float(row.get('fbld', 0)),
-                        'groundball_rate_allowed': safe_float(row.get('gb', 0)),
-                        'player_id': row.get('player_id', ''),
-                        'data_quality': self.assess_data_quality(safe_int(row.get('attempts', 0)), 'pitcher')
-                    }
-                    count += 1
-                
-                print(f"   ⚾ Loaded real exit velocity data for {count} pitchers")
-                
+            count = 0
+            
+            for player_name, record in PITCHER_EXIT_VELOCITY_SCHEMA.records(
+                    load_columnar(file_path), split=('name',), extra=('data_quality',)):
+                player_name = self.normalize_name(player_name)
+                record['data_quality'] = self.assess_data_quality(record['attempts'], 'pitcher')
+                self.pitcher_exit_velocity[player_name] = record
+                count += 1
+            
+            print(f"   ⚾ Loaded real exit velocity data for {count} pitchers")
+            
         except Exception as e:
             print(f"❌ Error loading pitcher exit velocity data: {e}")
     
@@ -2949,89 +4266,24 @@ class EnhancedWeakspotAnalyzer:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                count = 0
-                
-                for row in reader:
-                    # Enhanced name handling for comprehensive matching
-                    csv_name = row['last_name, first_name']  # "Henderson, Gunnar"
-                    normalized_name = self.normalize_name(csv_name)  # "gunnar henderson"
-                    
-                    def safe_int(value, default=0):
-                        try:
-                            return int(value) if value and value.strip() else default
-                        except (ValueError, AttributeError):
-                            return default
-                    
-                    def safe_float(value, default=0.0):
-                        try:
-                            return float(value) if value and value.strip() else default
-                        except (ValueError, AttributeError):
-                            return default
-                    
-                    # Store data using normalized name for lookup
-                    batter_data = {
-                        # Traditional stats
-                        'ab': safe_int(row.get('ab', 0)),
-                        'pa': safe_int(row.get('pa', 0)),
-                        'hit': safe_int(row.get('hit', 0)),
-                        'home_run': safe_int(row.get('home_run', 0)),
-                        'strikeout': safe_int(row.get('strikeout', 0)),
-                        'walk': safe_int(row.get('walk', 0)),
-                        
-                        # Rate stats
-                        'batting_avg': safe_float(row.get('batting_avg', 0)),
-                        'on_base_percent': safe_float(row.get('on_base_percent', 0)),
-                        'slugging_percent': safe_float(row.get('slg_percent', 0)),
-                        'ops': safe_float(row.get('on_base_plus_slg', 0)),
-                        'isolated_power': safe_float(row.get('isolated_power', 0)),
-                        'babip': safe_float(row.get('babip', 0)),
-                        'k_percent': safe_float(row.get('k_percent', 0)),
-                        'bb_percent': safe_float(row.get('bb_percent', 0)),
-                        
-                        # Expected statistics
-                        'xba': safe_float(row.get('xba', 0)),
-                        'xslg': safe_float(row.get('xslg', 0)),
-                        'xwoba': safe_float(row.get('xwoba', 0)),
-                        'woba': safe_float(row.get('woba', 0)),
-                        'xobp': safe_float(row.get('xobp', 0)),
-                        'xiso': safe_float(row.get('xiso', 0)),
-                        
-                        # Expected stats gaps
-                        'xba_diff': safe_float(row.get('xbadiff', 0)),
-                        'xslg_diff': safe_float(row.get('xslgdiff', 0)),
-                        'woba_diff': safe_float(row.get('wobadiff', 0)),
-                        
-                        # Contact quality
-                        'barrel': safe_int(row.get('barrel', 0)),
-                        'barrel_batted_rate': safe_float(row.get('barrel_batted_rate', 0)),
-                        'hard_hit_percent': safe_float(row.get('hard_hit_percent', 0)),
-                        'sweet_spot_percent': safe_float(row.get('sweet_spot_percent', 0)),
-                        'exit_velocity_avg': safe_float(row.get('exit_velocity_avg', 0)),
-                        'launch_angle_avg': safe_float(row.get('launch_angle_avg', 0)),
-                        
-                        # Plate discipline
-                        'z_swing_percent': safe_float(row.get('z_swing_percent', 0)),
-                        'oz_swing_percent': safe_float(row.get('oz_swing_percent', 0)),
-                        'whiff_percent': safe_float(row.get('whiff_percent', 0)),
-                        'swing_percent': safe_float(row.get('swing_percent', 0)),
-                        
-                        # Metadata
-                        'player_id': row.get('player_id', ''),
-                        'player_age': safe_int(row.get('player_age', 0)),
-                        'sprint_speed': safe_float(row.get('sprint_speed', 0)),
-                        'data_quality': self.assess_data_quality(safe_int(row.get('pa', 0)), 'batter'),
-                        'csv_name': csv_name,  # Store original CSV name for reference
-                        'normalized_name': normalized_name  # Store normalized name
-                    }
-                    
-                    # Store using normalized name as key for lookup
-                    self.custom_batters[normalized_name] = batter_data
-                    count += 1
+            count = 0
+            
+            for csv_name, batter_data in CUSTOM_BATTER_SCHEMA.records(
+                    load_columnar(file_path), split=('csv_name',),
+                    extra=('data_quality', 'csv_name', 'normalized_name')):
+                # Enhanced name handling for comprehensive matching (csv_name: "Henderson, Gunnar")
+                normalized_name = self.normalize_name(csv_name)  # "gunnar henderson"
                 
-                print(f"   📈 Loaded comprehensive data for {count} batters")
+                batter_data['data_quality'] = self.assess_data_quality(batter_data['pa'], 'batter')
+                batter_data['csv_name'] = csv_name  # Store original CSV name for reference
+                batter_data['normalized_name'] = normalized_name  # Store normalized name
                 
+                # Store using normalized name as key for lookup
+                self.custom_batters[normalized_name] = batter_data
+                count += 1
+            
+            print(f"   📈 Loaded comprehensive data for {count} batters")
+            
         except Exception as e:
             print(f"❌ Error loading custom batter data: {e}")
     
@@ -3044,81 +4296,17 @@ class EnhancedWeakspotAnalyzer:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                count = 0
-                
-                for row in reader:
-                    player_name = self.normalize_name(row['last_name, first_name'])
-                    
-                    def safe_int(value, default=0):
-                        try:
-                            return int(value) if value and value.strip() else default
-                        except (ValueError, AttributeError):
-                            return default
-                    
-                    def safe_float(value, default=0.0):
-                        try:
-                            return float(value) if value and value.strip() else default
-                        except (ValueError, AttributeError):
-                            return default
-                    
-                    self.custom_pitchers[player_name] = {
-                        # Basic stats
-                        'games': safe_int(row.get('p_game', 0)),
-                        'innings_pitched': safe_float(row.get('p_formatted_ip', 0)),
-                        'era': safe_float(row.get('p_era', 0)),
-                        
-                        # Batters faced stats
-                        'pa': safe_int(row.get('pa', 0)),
-                        'ab': safe_int(row.get('ab', 0)),
-                        'hits_allowed': safe_int(row.get('hit', 0)),
-                        'home_runs_allowed': safe_int(row.get('home_run', 0)),
-                        'strikeouts': safe_int(row.get('strikeout', 0)),
-                        'walks': safe_int(row.get('walk', 0)),
-                        
-                        # Opponent rate stats
-                        'opp_batting_avg': safe_float(row.get('batting_avg', 0)),
-                        'opp_on_base_percent': safe_float(row.get('on_base_percent', 0)),
-                        'opp_slugging_percent': safe_float(row.get('slg_percent', 0)),
-                        'opp_ops': safe_float(row.get('on_base_plus_slg', 0)),
-                        'opp_isolated_power': safe_float(row.get('isolated_power', 0)),
-                        'opp_babip': safe_float(row.get('babip', 0)),
-                        'k_percent': safe_float(row.get('k_percent', 0)),
-                        'bb_percent': safe_float(row.get('bb_percent', 0)),
-                        
-                        # Expected statistics allowed
-                        'xba_allowed': safe_float(row.get('xba', 0)),
-                        'xslg_allowed': safe_float(row.get('xslg', 0)),
-                        'xwoba_allowed': safe_float(row.get('xwoba', 0)),
-                        'woba_allowed': safe_float(row.get('woba', 0)),
-                        
-                        # Expected stats gaps
-                        'xba_diff': safe_float(row.get('xbadiff', 0)),
-                        'xslg_diff': safe_float(row.get('xslgdiff', 0)),
-                        'woba_diff': safe_float(row.get('wobadiff', 0)),
-                        
-                        # Contact quality allowed
-                        'barrels_allowed': safe_int(row.get('barrel', 0)),
-                        'barrel_batted_rate_allowed': safe_float(row.get('barrel_batted_rate', 0)),
-                        'hard_hit_percent_allowed': safe_float(row.get('hard_hit_percent', 0)),
-                        'sweet_spot_percent_allowed': safe_float(row.get('sweet_spot_percent', 0)),
-                        'exit_velocity_avg_allowed': safe_float(row.get('exit_velocity_avg', 0)),
-                        'launch_angle_avg_allowed': safe_float(row.get('launch_angle_avg', 0)),
-                        
-                        # Arsenal data
-                        'pitch_hand': row.get('pitch_hand', 'R'),
-                        'arm_angle': safe_float(row.get('arm_angle', 0)),
-                        
-                        # Metadata
-                        'player_id': row.get('player_id', ''),
-                        'player_age': safe_int(row.get('player_age', 0)),
-                        'data_quality': self.assess_data_quality(safe_int(row.get('pa', 0)), 'pitcher')
-                    }
-                    count += 1
-                
-                print(f"   🏹 Loaded comprehensive data for {count} pitchers")
-                
+            count = 0
+            
+            for player_name, record in CUSTOM_PITCHER_SCHEMA.records(
+                    load_columnar(file_path), split=('name',), extra=('data_quality',)):
+                player_name = self.normalize_name(player_name)
+                record['data_quality'] = self.assess_data_quality(record['pa'], 'pitcher')
+                self.custom_pitchers[player_name] = record
+                count += 1
+            
+            print(f"   🏹 Loaded comprehensive data for {count} pitchers")
+            
         except Exception as e:
             print(f"❌ Error loading custom pitcher data: {e}")
     
@@ -3131,38 +4319,23 @@ class EnhancedWeakspotAnalyzer:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                count = 0
+            count = 0
+            
+            for pitcher_name, team, pitch_type, pitch_data in PITCHER_ARSENAL_SCHEMA.records(
+                    load_columnar(file_path), split=('name', 'team', 'pitch_type')):
+                pitcher_name = self.normalize_name(pitcher_name)
                 
-                for row in reader:
-                    pitcher_name = self.normalize_name(row['last_name, first_name'])
-                    
-                    if pitcher_name not in self.pitcher_arsenal:
-                        self.pitcher_arsenal[pitcher_name] = {
-                            'team': row.get('team_name_alt', ''),
-                            'pitch_types': {}
-                        }
-                    
-                    pitch_type = row['pitch_type']
-                    pitch_data = {
-                        'pitch_name': row['pitch_name'],
-                        'run_value_per_100': float(row.get('run_value_per_100', 0)),
-                        'usage': float(row.get('pitch_usage', 0)),
-                        'ba_against': float(row.get('ba', 0)),
-                        'slg_against': float(row.get('slg', 0)),
-                        'woba_against': float(row.get('woba', 0)),
-                        'whiff_percent': float(row.get('whiff_percent', 0)),
-                        'hard_hit_percent': float(row.get('hard_hit_percent', 0)),
-                        'k_percent': float(row.get('k_percent', 0)),
-                        'pitches': int(row.get('pitches', 0))
+                if pitcher_name not in self.pitcher_arsenal:
+                    self.pitcher_arsenal[pitcher_name] = {
+                        'team': team,
+                        'pitch_types': {}
                     }
-                    
-                    self.pitcher_arsenal[pitcher_name]['pitch_types'][pitch_type] = pitch_data
-                    count += 1
-                
-                print(f"   🎯 Loaded arsenal data for {len(self.pitcher_arsenal)} pitchers")
                 
+                self.pitcher_arsenal[pitcher_name]['pitch_types'][pitch_type] = pitch_data
+                count += 1
+            
+            print(f"   🎯 Loaded arsenal data for {len(self.pitcher_arsenal)} pitchers")
+            
         except Exception as e:
             print(f"❌ Error loading pitcher arsenal data: {e}")
     
@@ -3183,28 +4356,17 @@ class EnhancedWeakspotAnalyzer:
                 continue
             
             try:
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    count = 0
+                count = 0
+                matchup_key = f"{bat_hand}v{pitch_hand}"
+                
+                for batter_name, record in HANDEDNESS_SCHEMA.records(load_columnar(file_path), split=('name',)):
+                    batter_name = self.normalize_name(batter_name)
                     
-                    for row in reader:
-                        batter_name = self.normalize_name(row['name'])
-                        
-                        if batter_name not in self.handedness_data:
-                            self.handedness_data[batter_name] = {}
-                        
-                        matchup_key = f"{bat_hand}v{pitch_hand}"
-                        self.handedness_data[batter_name][matchup_key] = {
-                            'bbe': int(row.get('bbe', 0)),
-                            'gb_rate': float(row.get('gb_rate', 0)),
-                            'air_rate': float(row.get('air_rate', 0)),
-                            'fb_rate': float(row.get('fb_rate', 0)),
-                            'ld_rate': float(row.get('ld_rate', 0)),
-                            'pull_rate': float(row.get('pull_rate', 0)),
-                            'oppo_rate': float(row.get('oppo_rate', 0)),
-                            'pull_air_rate': float(row.get('pull_air_rate', 0))
-                        }
-                        count += 1
+                    if batter_name not in self.handedness_data:
+                        self.handedness_data[batter_name] = {}
+                    
+                    self.handedness_data[batter_name][matchup_key] = record
+                    count += 1
                 
                 print(f"   📊 Loaded {filename}: {count} records")
             
@@ -3299,44 +4461,33 @@ class EnhancedWeakspotAnalyzer:
                 return roster_hitters  # Return ALL roster hitters, not just 9
         
         # FALLBACK: Use recent game data if roster not available
-        for i in range(7):  # Look back up to 7 days
-            check_date = datetime.strptime(date, '%Y-%m-%d') - timedelta(days=i)
-            year = check_date.year
-            month = check_date.strftime('%B').lower()
-            day = check_date.day
-            
-            file_path = self.data_path / f"{year}/{month}/{month}_{day:02d}_{year}.json"
-            
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r') as f:
-                        game_data = json.load(f)
-                    
-                    if 'players' in game_data:
-                        for player in game_data['players']:
-                            if (player.get('playerType') == 'hitter' and 
-                                (teams_match(player.get('team', ''), team_abbr) or teams_match(player.get('Team', ''), team_abbr)) and
-                                player.get('name') and
-                                (player.get('AB', 0) > 0 or player.get('H', 0) > 0)):
-                                
-                                team_hitters.append({
-                                    'name': player['name'],
-                                    'team': team_abbr,
-                                    'stats': {
-                                        'AB': player.get('AB', 0),
-                                        'H': player.get('H', 0),
-                                        'HR': player.get('HR', 0),
-                                        'RBI': player.get('RBI', 0),
-                                        'AVG': player.get('AVG', 0)
-                                    }
-                                })
-                    
-                    if team_hitters:
-                        print(f"   📊 Found {len(team_hitters)} recent hitters for {team_abbr}")
-                        return team_hitters  # Return all found hitters, not limited to 9
+        for check_date, date_str, game_data in self.daily_games.iter_days(date, 7):  # Look back up to 7 days
+            try:
+                if 'players' in game_data:
+                    for player in game_data['players']:
+                        if (player.get('playerType') == 'hitter' and 
+                            (teams_match(player.get('team', ''), team_abbr) or teams_match(player.get('Team', ''), team_abbr)) and
+                            player.get('name') and
+                            (player.get('AB', 0) > 0 or player.get('H', 0) > 0)):
+                            
+                            team_hitters.append({
+                                'name': player['name'],
+                                'team': team_abbr,
+                                'stats': {
+                                    'AB': player.get('AB', 0),
+                                    'H': player.get('H', 0),
+                                    'HR': player.get('HR', 0),
+                                    'RBI': player.get('RBI', 0),
+                                    'AVG': player.get('AVG', 0)
+                                }
+                            })
                 
-                except Exception as e:
-                    continue
+                if team_hitters:
+                    print(f"   📊 Found {len(team_hitters)} recent hitters for {team_abbr}")
+                    return team_hitters  # Return all found hitters, not limited to 9
+            
+            except Exception as e:
+                continue
         
         print(f"   ⚠️ No hitters found for team {team_abbr}")
         return []
@@ -3385,21 +4536,7 @@ class EnhancedWeakspotAnalyzer:
     
     def normalize_name(self, name):
         """Normalize player names for consistent matching"""
-        if not name:
-            return ""
-        
-        # Handle "Last, First" format
-        if ',' in name:
-            parts = name.split(',')
-            if len(parts) == 2:
-                last, first = parts[0].strip(), parts[1].strip()
-                name = f"{first} {last}"
-        
-        # Clean up the name
-        name = re.sub(r'[^\w\s\.]', '', name)
-        name = ' '.join(name.split())
-        
-        return name.strip()
+        return normalize_name(name)
     
     def normalize_venue_name(self, venue_name):
         """Normalize venue names to match stadium HR analysis data"""
@@ -3446,21 +4583,9 @@ class EnhancedWeakspotAnalyzer:
         venue_analytics = {}
         
         try:
-            # PHASE 1: Load stadium baseline data (park factors, overall stats)
-            stadium_file = self.data_path / "stadium/stadium_hr_analysis.json"
-            if stadium_file.exists():
-                with open(stadium_file, 'r') as f:
-                    stadium_data = json.load(f)
-                
-                stadiums = stadium_data.get('stadiums', {})
-                venue_data = stadiums.get(normalized_venue)
-                
-                if not venue_data:
-                    # Try alternative venue names
-                    for stadium_name in stadiums.keys():
-                        if normalized_venue.lower() in stadium_name.lower() or stadium_name.lower() in normalized_venue.lower():
-                            venue_data = stadiums[stadium_name]
-                            break
+            # PHASE 1: Stadium baseline data (park factors, overall stats)
+            if self.stadium_hr_data:
+                venue_data = self.find_stadium_data(normalized_venue)
                 
                 if venue_data:
                     # Stadium HR Statistics (baseline data)
@@ -3482,7 +4607,7 @@ class EnhancedWeakspotAnalyzer:
                         'away_penalty_factor': 0.85 if home_team_hrs > away_team_hrs * 1.2 else 0.95
                     }
             
-            # PHASE 2: Load recent series data from daily game files (like CurrentSeriesCards)
+            # PHASE 2: Recent series data from the venue series index (like CurrentSeriesCards)
             recent_venue_trends = self.load_recent_venue_series_data(normalized_venue, batter_team)
             if recent_venue_trends:
                 venue_analytics.update(recent_venue_trends)
@@ -3522,68 +4647,104 @@ class EnhancedWeakspotAnalyzer:
         else:
             return "Neutral"
     
+    def load_venue_series_index(self, days=14):
+        """
+        Index recent Final games by venue (like CurrentSeriesCards does) once per run
+        Hitter-level venue analytics become dictionary lookups instead of daily file rescans
+        """
+        print(f"🏟️ Building venue series index ({days} days)...")
+        self.venue_series_index = {}
+        
+        current_date = datetime.now()
+        for check_date, date_str, daily_data in self.daily_games.iter_days(current_date, days):
+            try:
+                for game in daily_data.get('games', []):
+                    if game.get('status') != 'Final':
+                        continue
+                    
+                    game_venue = self.normalize_venue_name(game.get('venue', ''))
+                    venue_entry = self.venue_series_index.setdefault(game_venue, {
+                        'games': [],
+                        'venue_home_team': None
+                    })
+                    venue_entry['games'].append({
+                        'date': date_str,
+                        'home_team': game.get('homeTeam'),
+                        'away_team': game.get('awayTeam'),
+                        'home_score': game.get('homeScore', 0),
+                        'away_score': game.get('awayScore', 0),
+                        'venue': game.get('venue')
+                    })
+                    
+                    # Track venue's home team
+                    if not venue_entry['venue_home_team']:
+                        venue_entry['venue_home_team'] = game.get('homeTeam')
+            
+            except Exception as e:
+                # Skip problematic files silently
+                continue
+        
+        # Venue-level trends don't depend on the batter, so compute them once here
+        for venue_entry in self.venue_series_index.values():
+            venue_entry['games'].sort(key=lambda x: x['date'], reverse=True)  # Most recent first
+            venue_entry['recent_trend'] = self.analyze_recent_series_trend(venue_entry['games'])
+        
+        total_games = sum(len(v['games']) for v in self.venue_series_index.values())
+        print(f"   ✅ Indexed {total_games} recent games across {len(self.venue_series_index)} venues")
+    
+    def load_stadium_hr_data(self):
+        """Load stadium HR baseline data once per run"""
+        self.stadium_hr_data = {}
+        self.stadium_venue_matches = {}  # normalized venue -> resolved stadium entry
+        
+        try:
+            stadium_file = self.data_path / "stadium/stadium_hr_analysis.json"
+            if stadium_file.exists():
+                with open(stadium_file, 'r') as f:
+                    stadium_data = json.load(f)
+                self.stadium_hr_data = stadium_data.get('stadiums', {})
+                print(f"   ✅ Loaded stadium HR data for {len(self.stadium_hr_data)} venues")
+        except Exception as e:
+            print(f"   ⚠️ Error loading stadium HR data: {e}")
+    
+    def find_stadium_data(self, normalized_venue):
+        """Resolve stadium baseline data for a venue, caching alternative-name matches"""
+        if normalized_venue in self.stadium_venue_matches:
+            return self.stadium_venue_matches[normalized_venue]
+        
+        stadiums = self.stadium_hr_data
+        venue_data = stadiums.get(normalized_venue)
+        
+        if not venue_data:
+            # Try alternative venue names
+            for stadium_name in stadiums.keys():
+                if normalized_venue.lower() in stadium_name.lower() or stadium_name.lower() in normalized_venue.lower():
+                    venue_data = stadiums[stadium_name]
+                    break
+        
+        self.stadium_venue_matches[normalized_venue] = venue_data
+        return venue_data
+    
     def load_recent_venue_series_data(self, venue, batter_team):
         """
-        Load recent series data from daily game files (like CurrentSeriesCards does)
+        Recent series data for a venue from the venue series index
         This provides actual recent venue performance instead of "insufficient data"
         """
         venue_trends = {}
         
         try:
-            # Get date range for last 14 days
-            from datetime import datetime, timedelta
-            
-            current_date = datetime.now()
-            recent_games = []
-            venue_home_team = None
-            
-            # Load games from last 14 days
-            for days_back in range(14):
-                check_date = current_date - timedelta(days=days_back)
-                date_str = check_date.strftime('%Y-%m-%d')
-                
-                # Load daily game file
-                year = check_date.year
-                month_name = check_date.strftime('%B').lower()
-                day = check_date.day
-                
-                game_file = self.data_path / f"{year}/{month_name}/{month_name}_{day:02d}_{year}.json"
-                
-                if game_file.exists():
-                    try:
-                        with open(game_file, 'r') as f:
-                            daily_data = json.load(f)
-                        
-                        # Find games at this venue
-                        for game in daily_data.get('games', []):
-                            game_venue = self.normalize_venue_name(game.get('venue', ''))
-                            if game_venue == venue and game.get('status') == 'Final':
-                                recent_games.append({
-                                    'date': date_str,
-                                    'home_team': game.get('homeTeam'),
-                                    'away_team': game.get('awayTeam'),
-                                    'home_score': game.get('homeScore', 0),
-                                    'away_score': game.get('awayScore', 0),
-                                    'venue': game.get('venue')
-                                })
-                                
-                                # Track venue's home team
-                                if not venue_home_team:
-                                    venue_home_team = game.get('homeTeam')
-                    
-                    except Exception as e:
-                        # Skip problematic files silently
-                        continue
+            venue_entry = self.venue_series_index.get(venue)
+            recent_games = venue_entry['games'] if venue_entry else []
+            venue_home_team = venue_entry['venue_home_team'] if venue_entry else None
             
             # Analyze recent venue performance
             if recent_games:
-                recent_games.sort(key=lambda x: x['date'], reverse=True)  # Most recent first
                 
                 venue_trends['recent_venue_performance'] = {
                     'games_found': len(recent_games),
                     'last_3_games': recent_games[:3],
                     'venue_home_team': venue_home_team,
-                    'recent_trend': self.analyze_recent_series_trend(recent_games)
+                    'recent_trend': venue_entry['recent_trend']
                 }
                 
                 # Team-specific performance at venue
@@ -3800,45 +4961,7 @@ class EnhancedWeakspotAnalyzer:
     
     def comprehensive_name_matching(self, search_name, target_name):
         """Enhanced name matching to handle G. Henderson vs Henderson, Gunnar"""
-        if not search_name or not target_name:
-            return False
-            
-        # Direct match after normalization
-        search_norm = self.normalize_name(search_name).lower()
-        target_norm = self.normalize_name(target_name).lower()
-        
-        if search_norm == target_norm:
-            return True
-            
-        # Handle abbreviated names "G. Henderson" vs "gunnar henderson" 
-        search_parts = search_norm.split()
-        target_parts = target_norm.split()
-        
-        if len(search_parts) >= 2 and len(target_parts) >= 2:
-            # Check if first initial matches and last name matches
-            search_first = search_parts[0].replace('.', '')
-            target_first = target_parts[0].replace('.', '')
-            
-            # First initial + last name match
-            if (len(search_first) == 1 and search_first == target_first[0] and 
-                search_parts[-1] == target_parts[-1]):
-                return True
-                
-            # Target initial + search full first name match  
-            if (len(target_first) == 1 and target_first == search_first[0] and
-                search_parts[-1] == target_parts[-1]):
-                return True
-        
-        # Handle "Last, First" in original formats before normalization
-        if ', ' in search_name or ', ' in target_name:
-            # Convert both to "First Last" format for comparison
-            search_converted = self.normalize_name(search_name).lower()
-            target_converted = self.normalize_name(target_name).lower()
-            
-            if search_converted == target_converted:
-                return True
-        
-        return False
+        return names_match(search_name, target_name)
     
     def get_csv_format_name(self, player_name):
         """Convert player name to CSV format (Last, First) using roster data"""
@@ -3874,6 +4997,13 @@ class EnhancedWeakspotAnalyzer:
         
         return player_name
     
+    def build_batter_name_index(self):
+        """Index custom batters by every name variant so lookups avoid linear fuzzy scans"""
+        self.batter_name_index = NameIndex(
+            ([stored_name, batter_data.get('csv_name', '')], batter_data)
+            for stored_name, batter_data in self.custom_batters.items()
+        )
+    
     def find_batter_data(self, player_name):
         """Find batter data using comprehensive name matching"""
         # Try direct lookup first
@@ -3881,17 +5011,8 @@ class EnhancedWeakspotAnalyzer:
         if normalized_search in self.custom_batters:
             return self.custom_batters[normalized_search]
         
-        # Try comprehensive matching against all stored names
-        for stored_name, batter_data in self.custom_batters.items():
-            if self.comprehensive_name_matching(player_name, stored_name):
-                return batter_data
-                
-            # Also try matching against the original CSV name
-            if 'csv_name' in batter_data:
-                if self.comprehensive_name_matching(player_name, batter_data['csv_name']):
-                    return batter_data
-        
-        return None
+        # Indexed match against all stored and original CSV names
+        return self.batter_name_index.lookup(player_name)
     
     def generate_enhanced_arsenal_justification(self, batter_name, pitcher_name, exploit_analysis):
         """Generate detailed arsenal-based justification with specific statistical evidence"""
@@ -4077,23 +5198,20 @@ class EnhancedWeakspotAnalyzer:
         
         # Save date-specific file
         date_file = output_dir / f"enhanced_weakspot_exploiters_{date}.json"
-        with open(date_file, 'w') as f:
-            json.dump(result, f, indent=2)
         
-        # Save latest file
+        # Latest file
         latest_file = output_dir / "enhanced_weakspot_exploiters_latest.json"
-        with open(latest_file, 'w') as f:
-            json.dump(result, f, indent=2)
         
         # Also save to standard location for compatibility
         standard_latest = output_dir / "weakspot_exploiters_latest.json"
-        with open(standard_latest, 'w') as f:
-            json.dump(result, f, indent=2)
         
         # CRITICAL: Save to the exact filename the React component expects
         standard_date_file = output_dir / f"weakspot_exploiters_{date}.json"
-        with open(standard_date_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        
+        # Encoded once and written atomically (with .gz). The legacy JS generators rewrite the
+        # standard names in place, so those are copies rather than links to the date file
+        payload = json.dumps(result, indent=2).encode('utf-8')
+        write_output_file(date_file, payload, aliases=(latest_file,), copies=(standard_latest, standard_date_file))
         
         print(f"✅ Enhanced analysis results saved:")
         print(f"   📄 {date_file}")
@@ -4112,6 +5230,88 @@ class EnhancedWeakspotAnalyzer:
         print(f"   🎯 {metrics['situationalAdvantagesCount']} with situational advantages")
 
 
+    def exploiter_game_ids(self, exploiters):
+        """gameId each exploiter was scored in (stamped by analyze_game; None for rows from elsewhere)"""
+        return [exploiter.get('gameId') for exploiter in exploiters]
+    
+    def lite_dir(self, date):
+        lite_dir = self.data_path / "weakspot_exploiters" / "lite" / date
+        lite_dir.mkdir(parents=True, exist_ok=True)
+        return lite_dir
+    
+    def write_lite_shard(self, lite_dir, game, exploiters, generated):
+        """Write one game's detail shard; returns its index entry"""
+        shard_name = f"game_{game['gameId']}.json"
+        shard = {'date': lite_dir.name, 'generated': generated, 'game': game,
+                 'exploiters': [lite_exploiter(exploiter) for exploiter in exploiters]}
+        write_output_file(lite_dir / shard_name, json.dumps(shard, separators=(',', ':')).encode('utf-8'))
+        return dict(game, shard=shard_name, count=len(exploiters),
+                    topScore=max((e['combinedScore'] for e in exploiters), default=0))
+    
+    def write_lite_index(self, lite_dir, generated, index_games, exploiters, game_ids, complete=True):
+        """Write the summary index (complete=False while games are still streaming in)"""
+        index = {
+            'date': lite_dir.name,
+            'generated': generated,
+            'schema': 'lite-1',
+            'complete': complete,
+            'totalExploiters': len(exploiters),
+            'games': index_games,
+            'fields': LITE_INDEX_FIELDS,
+            'exploiters': [[game_id if field == 'game' else exploiter.get(field) for field in LITE_INDEX_FIELDS]
+                           for exploiter, game_id in zip(exploiters, game_ids)]
+        }
+        write_output_file(lite_dir / "index.json", json.dumps(index, separators=(',', ':')).encode('utf-8'))
+    
+    def save_lite_results(self, exploiters, date):
+        """
+        Compact layout: a ranked summary index plus one detail shard per game
+        lite/{date}/index.json lists every exploiter's headline numbers (LITE_INDEX_FIELDS
+        columns) and the slate's games; lite/{date}/game_{gameId}.json holds that game's full
+        exploiter rows without the duplicated and game-level fields.
+        """
+        lite_dir = self.lite_dir(date)
+        generated = datetime.now().isoformat()
+        
+        game_ids = self.exploiter_game_ids(exploiters)
+        games = {game['gameId']: (game, []) for game in self.slate_games}
+        for exploiter, game_id in zip(exploiters, game_ids):
+            game_id = game_id or 'unassigned'
+            if game_id not in games:
+                games[game_id] = ({'gameId': game_id}, [])
+            games[game_id][1].append(exploiter)
+        
+        index_games = [self.write_lite_shard(lite_dir, game, game_exploiters, generated)
+                       for game, game_exploiters in games.values()]
+        self.write_lite_index(lite_dir, generated, index_games, exploiters, game_ids)
+        
+        # Shards of games no longer on the slate (e.g. a re-run after a postponement)
+        written = {entry['shard'] for entry in index_games}
+        written |= {f"{name}.gz" for name in written} | {"index.json", "index.json.gz"}
+        for stale in lite_dir.glob("game_*.json*"):
+            if stale.name not in written:
+                stale.unlink()
+        
+        shard_bytes = sum((lite_dir / name).stat().st_size for name in written if not name.endswith('.gz'))
+        print(f"🪶 Lite results saved: {len(games)} game shards + index ({shard_bytes / 1024:.0f} KB) → {lite_dir}")
+    
+    def start_stream(self, date):
+        """Begin a streamed slate: shards land in the lite layout as games finish"""
+        return {'dir': self.lite_dir(date), 'generated': datetime.now().isoformat(), 'games': [], 'exploiters': [],
+                'started': time.time()}
+    
+    def stream_game(self, stream, game, exploiters):
+        """Publish a finished game's shard and a provisional index covering the games done so far"""
+        ranked = sorted(exploiters, key=exploiter_rank, reverse=True)
+        stream['games'].append(self.write_lite_shard(stream['dir'], game, ranked, stream['generated']))
+        stream['exploiters'].extend((exploiter, game['gameId']) for exploiter in ranked)
+        stream['exploiters'].sort(key=lambda entry: exploiter_rank(entry[0]), reverse=True)
+        self.write_lite_index(stream['dir'], stream['generated'], stream['games'],
+                              [entry[0] for entry in stream['exploiters']],
+                              [entry[1] for entry in stream['exploiters']], complete=False)
+        print(f"📡 Streamed {game['away']}@{game['home']} ({game.get('gameTime') or 'time TBD'}): "
+              f"{len(exploiters)} exploiters, {time.time() - stream['started']:.1f}s in")
+    
     # PHASE 1 ENHANCEMENT: New CSV data loading methods
     def load_batted_ball_handedness_data(self):
         """Load batted ball data by handedness matchups (L/L, L/R, R/L, R/R)"""
@@ -4135,40 +5335,22 @@ class EnhancedWeakspotAnalyzer:
                 
                 if file_path.exists():
                     try:
-                        with open(file_path, 'r') as f:
-                            reader = csv.DictReader(f)
+                        matchup_key = f"{bat_hand}v{pitch_hand}"
+                        
+                        for player_name, record in BATTED_BALL_HANDEDNESS_SCHEMA.records(
+                                load_columnar(file_path), split=('name',), leading=('year',)):
+                            player_name = self.normalize_name(player_name)
+                            if not player_name:
+                                continue
                             
-                            for row in reader:
-                                player_name = self.normalize_name(row.get('name', ''))
-                                if not player_name:
-                                    continue
-                                
-                                # Initialize player data structure
-                                if player_name not in self.batted_ball_handedness:
-                                    self.batted_ball_handedness[player_name] = {}
-                                
-                                matchup_key = f"{bat_hand}v{pitch_hand}"
-                                
-                                # Store comprehensive batted ball data
-                                self.batted_ball_handedness[player_name][matchup_key] = {
-                                    'year': year,
-                                    'bbe': int(row.get('bbe', 0)),
-                                    'gb_rate': float(row.get('gb_rate', 0)),
-                                    'air_rate': float(row.get('air_rate', 0)),
-                                    'fb_rate': float(row.get('fb_rate', 0)),
-                                    'ld_rate': float(row.get('ld_rate', 0)),
-                                    'pu_rate': float(row.get('pu_rate', 0)),
-                                    'pull_rate': float(row.get('pull_rate', 0)),
-                                    'straight_rate': float(row.get('straight_rate', 0)),
-                                    'oppo_rate': float(row.get('oppo_rate', 0)),
-                                    'pull_gb_rate': float(row.get('pull_gb_rate', 0)),
-                                    'straight_gb_rate': float(row.get('straight_gb_rate', 0)),
-                                    'oppo_gb_rate': float(row.get('oppo_gb_rate', 0)),
-                                    'pull_air_rate': float(row.get('pull_air_rate', 0)),
-                                    'straight_air_rate': float(row.get('straight_air_rate', 0)),
-                                    'oppo_air_rate': float(row.get('oppo_air_rate', 0))
-                                }
-                                total_players += 1
+                            # Initialize player data structure
+                            if player_name not in self.batted_ball_handedness:
+                                self.batted_ball_handedness[player_name] = {}
+                            
+                            # Store comprehensive batted ball data
+                            record['year'] = year
+                            self.batted_ball_handedness[player_name][matchup_key] = record
+                            total_players += 1
                         
                         loaded_files += 1
                         print(f"   ✅ Loaded {file_name}")
@@ -4199,33 +5381,18 @@ class EnhancedWeakspotAnalyzer:
             
             if file_path.exists():
                 try:
-                    with open(file_path, 'r') as f:
-                        reader = csv.DictReader(f)
+                    for player_name, record in SWING_PATH_SCHEMA.records(load_columnar(file_path), split=('name',)):
+                        player_name = self.normalize_name(player_name)
+                        if not player_name:
+                            continue
                         
-                        for row in reader:
-                            player_name = self.normalize_name(row.get('name', ''))
-                            if not player_name:
-                                continue
-                            
-                            # Initialize player swing data
-                            if player_name not in self.swing_path_data:
-                                self.swing_path_data[player_name] = {}
-                            
-                            # Store swing mechanics data
-                            self.swing_path_data[player_name][context] = {
-                                'side': row.get('side', ''),
-                                'avg_bat_speed': float(row.get('avg_bat_speed', 0)),
-                                'swing_tilt': float(row.get('swing_tilt', 0)),
-                                'attack_angle': float(row.get('attack_angle', 0)),
-                                'attack_direction': float(row.get('attack_direction', 0)),
-                                'ideal_attack_angle_rate': float(row.get('ideal_attack_angle_rate', 0)),
-                                'avg_intercept_y_vs_plate': float(row.get('avg_intercept_y_vs_plate', 0)),
-                                'avg_intercept_y_vs_batter': float(row.get('avg_intercept_y_vs_batter', 0)),
-                                'avg_batter_y_position': float(row.get('avg_batter_y_position', 0)),
-                                'avg_batter_x_position': float(row.get('avg_batter_x_position', 0)),
-                                'competitive_swings': int(row.get('competitive_swings', 0))
-                            }
-                            total_players += 1
+                        # Initialize player swing data
+                        if player_name not in self.swing_path_data:
+                            self.swing_path_data[player_name] = {}
+                        
+                        # Store swing mechanics data
+                        self.swing_path_data[player_name][context] = record
+                        total_players += 1
                     
                     loaded_files += 1
                     print(f"   ✅ Loaded {file_name}")
@@ -4240,20 +5407,15 @@ class EnhancedWeakspotAnalyzer:
         """Load historical data for multi-year trend analysis (2022-2025)"""
         print("📚 Loading historical multi-year data for trend analysis...")
         
-        data_types = [
-            ('hitter_exit_velocity', 'hitter_exit_velocity'),
-            ('pitcher_exit_velocity', 'pitcher_exit_velocity'),
-            ('hitterpitcharsenalstats', 'hitter_arsenal'),
-            ('pitcherpitcharsenalstats', 'pitcher_arsenal')
-        ]
-        
         loaded_files = 0
         total_records = 0
+        skipped_records = 0
+        participants = self.participants  # Predicate pushdown: keep only today's players
         
-        for year in [2022, 2023, 2024, 2025]:
+        for year in HISTORICAL_YEARS:
             self.historical_data[year] = {}
             
-            for file_prefix, data_type in data_types:
+            for file_prefix, data_type in HISTORICAL_DATA_TYPES:
                 file_name = f"{file_prefix}_{year}.csv"
                 file_path = self.stats_path / file_name
                 
@@ -4261,42 +5423,14 @@ class EnhancedWeakspotAnalyzer:
                     try:
                         self.historical_data[year][data_type] = {}
                         
-                        with open(file_path, 'r', encoding='utf-8-sig') as f:
-                            reader = csv.DictReader(f)
+                        for player_name, player_id, record in self.historical_rows(file_path):
+                            if participants is not None and not participants.matches(player_name, player_id):
+                                skipped_records += 1
+                                continue
                             
-                            for row in reader:
-                                # Handle multiple possible field name variations
-                                player_name = None
-                                for possible_field in ['last_name, first_name', 'name', 'player_name']:
-                                    # Check both original and BOM-prefixed field names
-                                    if possible_field in row and row[possible_field]:
-                                        player_name = row[possible_field]
-                                        break
-                                    # Also check with BOM prefix and quotes
-                                    bom_field = '\ufeff"' + possible_field + '"'
-                                    if bom_field in row and row[bom_field]:
-                                        player_name = row[bom_field]
-                                        break
-                                
-                                if not player_name:
-                                    continue
-                                
-                                # Clean and normalize the player name
-                                player_name = str(player_name).strip('"').strip()
-                                
-                                # Convert "Last, First" to "First Last" format for consistency
-                                if ', ' in player_name:
-                                    parts = player_name.split(', ')
-                                    if len(parts) == 2:
-                                        player_name = f"{parts[1]} {parts[0]}"
-                                
-                                player_name = self.normalize_name(player_name)
-                                if not player_name:
-                                    continue
-                                
-                                # Store the row data with all available fields
-                                self.historical_data[year][data_type][player_name] = dict(row)
-                                total_records += 1
+                            # Store the row data with all available fields
+                            self.historical_data[year][data_type][player_name] = record
+                            total_records += 1
                         
                         loaded_files += 1
                         print(f"   ✅ Loaded {file_name} ({len(self.historical_data[year][data_type])} players)")
@@ -4305,8 +5439,80 @@ class EnhancedWeakspotAnalyzer:
                         print(f"   ⚠️ Could not load {file_name}: {e}")
         
         print(f"   📊 Loaded {loaded_files} historical files with {total_records} total records")
+        if participants is not None:
+            print(f"   🎯 Skipped {skipped_records} records for players not on today's slate")
         print(f"   📈 Multi-year data available for years: {list(self.historical_data.keys())}")
     
+    def historical_rows(self, file_path, players=None):
+        """
+        (normalized name, player ID, typed record) for the named rows of one historical CSV
+        With `players` (a ParticipantSet) rows are matched on the name/ID columns first and
+        records are built only for the matching rows.
+        """
+        table = load_columnar(file_path, consumer='historical multi-year')
+        
+        # Handle multiple possible field name variations
+        name_fields = [field for field in ['last_name, first_name', 'name', 'player_name']
+                       if table.has_column(field) and table.column_kind(field) == TEXT]
+        name_columns = [table.column(field) for field in name_fields]
+        player_ids = (table.converted('player_id', TEXT, '') if table.has_column('player_id')
+                      else [None] * len(table))
+        keys = [(self.historical_player_name(names), player_id)
+                for names, player_id in zip(zip(*name_columns), player_ids)]
+        
+        selected = None
+        if players is not None:
+            selected = [row for row, (player_name, player_id) in enumerate(keys)
+                        if player_name and players.matches(player_name, player_id)]
+            keys = [keys[row] for row in selected]
+        
+        # Typed slotted records instead of raw string dict(row)s
+        for (player_name, player_id), record in zip(keys, table_records(table, exclude=name_fields, rows=selected)):
+            if player_name:
+                yield player_name, player_id, record
+    
+    def historical_player_name(self, names):
+        """Normalized "First Last" name from a historical row's name columns ('' if it has none)"""
+        player_name = next((name for name in names if name), None)
+        if not player_name:
+            return ''
+        
+        # Clean and normalize the player name
+        player_name = str(player_name).strip('"').strip()
+        
+        # Convert "Last, First" to "First Last" format for consistency
+        if ', ' in player_name:
+            parts = player_name.split(', ')
+            if len(parts) == 2:
+                player_name = f"{parts[1]} {parts[0]}"
+        
+        return self.normalize_name(player_name)
+    
+    def load_player_history(self, players):
+        """
+        Add historical rows for players outside the slate filter (a ParticipantSet)
+        Used when a what-if brings in someone identify_participants didn't know about;
+        a full load already holds everyone. Returns the (table, name) entries it added,
+        so the caller can drop them again.
+        """
+        if self.participants is None:
+            return []
+        
+        added = []
+        for year, year_data in self.historical_data.items():
+            for file_prefix, data_type in HISTORICAL_DATA_TYPES:
+                if data_type not in year_data:
+                    continue  # File missing for that year
+                file_path = self.stats_path / f"{file_prefix}_{year}.csv"
+                try:
+                    for player_name, player_id, record in self.historical_rows(file_path, players):
+                        if player_name not in year_data[data_type]:
+                            year_data[data_type][player_name] = record
+                            added.append((year_data[data_type], player_name))
+                except Exception as e:
+                    print(f"   ⚠️ Could not load {file_path.name}: {e}")
+        return added
+    
     def load_comprehensive_batter_stats(self):
         """Load comprehensive batter statistics with 150+ metrics"""
         print("🎯 Loading comprehensive batter statistics...")
@@ -4318,95 +5524,33 @@ class EnhancedWeakspotAnalyzer:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
+            table = load_columnar(file_path)
+            
+            # Handle multiple possible name column variations
+            name_columns = [table.column(field) for field in
+                            ['last_name, first_name', 'last_name,first_name', 'name', 'player_name']
+                            if table.has_column(field) and table.column_kind(field) == TEXT]
+            
+            for names, (stats,) in zip(zip(*name_columns), COMPREHENSIVE_BATTER_SCHEMA.records(table)):
+                player_name = next((name for name in names if name), None)
+                if not player_name:
+                    continue
                 
-                # Clean field names to remove BOM and quotes
-                fieldnames = [name.replace('\ufeff', '').strip('"').strip() for name in reader.fieldnames]
+                # Clean and normalize the player name
+                player_name = str(player_name).strip('"').strip()
                 
-                for row in reader:
-                    # Handle multiple possible field name variations with cleaned field names
-                    player_name = None
-                    for possible_field in ['last_name, first_name', 'last_name,first_name', 'name', 'player_name']:
-                        # Check both original and cleaned field names
-                        if possible_field in row and row[possible_field]:
-                            player_name = row[possible_field]
-                            break
-                        # Also check with BOM prefix
-                        bom_field = '\ufeff"' + possible_field + '"'
-                        if bom_field in row and row[bom_field]:
-                            player_name = row[bom_field]
-                            break
-                    
-                    if not player_name:
-                        continue
-                    
-                    # Clean and normalize the player name
-                    player_name = str(player_name).strip('"').strip()
-                    
-                    # Convert "Last, First" to "First Last" format for consistency
-                    if ', ' in player_name:
-                        parts = player_name.split(', ')
-                        if len(parts) == 2:
-                            player_name = f"{parts[1]} {parts[0]}"
-                    
-                    player_name = self.normalize_name(player_name)
-                    if not player_name:
-                        continue
-                    
-                    # Store comprehensive stats (150+ fields available)
-                    self.comprehensive_batter_stats[player_name] = {
-                        'player_id': row.get('player_id', ''),
-                        'year': row.get('year', '2025'),
-                        'player_age': self.safe_int(row.get('player_age', 0)),
-                        'ab': self.safe_int(row.get('ab', 0)),
-                        'pa': self.safe_int(row.get('pa', 0)),
-                        'hit': self.safe_int(row.get('hit', 0)),
-                        'home_run': self.safe_int(row.get('home_run', 0)),
-                        'strikeout': self.safe_int(row.get('strikeout', 0)),
-                        'walk': self.safe_int(row.get('walk', 0)),
-                        'k_percent': self.safe_float(row.get('k_percent', 0)),
-                        'bb_percent': self.safe_float(row.get('bb_percent', 0)),
-                        'batting_avg': self.safe_float(row.get('batting_avg', 0)),
-                        'slg_percent': self.safe_float(row.get('slg_percent', 0)),
-                        'on_base_percent': self.safe_float(row.get('on_base_percent', 0)),
-                        'on_base_plus_slg': self.safe_float(row.get('on_base_plus_slg', 0)),
-                        'isolated_power': self.safe_float(row.get('isolated_power', 0)),
-                        'babip': self.safe_float(row.get('babip', 0)),
-                        # Expected stats
-                        'xba': self.safe_float(row.get('xba', 0)),
-                        'xslg': self.safe_float(row.get('xslg', 0)),
-                        'woba': self.safe_float(row.get('woba', 0)),
-                        'xwoba': self.safe_float(row.get('xwoba', 0)),
-                        'xobp': self.safe_float(row.get('xobp', 0)),
-                        'xiso': self.safe_float(row.get('xiso', 0)),
-                        # Contact quality
-                        'exit_velocity_avg': self.safe_float(row.get('exit_velocity_avg', 0)),
-                        'launch_angle_avg': self.safe_float(row.get('launch_angle_avg', 0)),
-                        'barrel': self.safe_int(row.get('barrel', 0)),
-                        'barrel_batted_rate': self.safe_float(row.get('barrel_batted_rate', 0)),
-                        'hard_hit_percent': self.safe_float(row.get('hard_hit_percent', 0)),
-                        # Swing mechanics
-                        'avg_swing_speed': self.safe_float(row.get('avg_swing_speed', 0)),
-                        'attack_angle': self.safe_float(row.get('attack_angle', 0)),
-                        'attack_direction': self.safe_float(row.get('attack_direction', 0)),
-                        'ideal_angle_rate': self.safe_float(row.get('ideal_angle_rate', 0)),
-                        # Zone discipline
-                        'z_swing_percent': self.safe_float(row.get('z_swing_percent', 0)),
-                        'oz_swing_percent': self.safe_float(row.get('oz_swing_percent', 0)),
-                        'whiff_percent': self.safe_float(row.get('whiff_percent', 0)),
-                        'swing_percent': self.safe_float(row.get('swing_percent', 0)),
-                        # Directional tendencies
-                        'pull_percent': self.safe_float(row.get('pull_percent', 0)),
-                        'straightaway_percent': self.safe_float(row.get('straightaway_percent', 0)),
-                        'opposite_percent': self.safe_float(row.get('opposite_percent', 0)),
-                        'groundballs_percent': self.safe_float(row.get('groundballs_percent', 0)),
-                        'flyballs_percent': self.safe_float(row.get('flyballs_percent', 0)),
-                        'linedrives_percent': self.safe_float(row.get('linedrives_percent', 0)),
-                        'popups_percent': self.safe_float(row.get('popups_percent', 0)),
-                        # Speed
-                        'sprint_speed': self.safe_float(row.get('sprint_speed', 0))
-                    }
+                # Convert "Last, First" to "First Last" format for consistency
+                if ', ' in player_name:
+                    parts = player_name.split(', ')
+                    if len(parts) == 2:
+                        player_name = f"{parts[1]} {parts[0]}"
+                
+                player_name = self.normalize_name(player_name)
+                if not player_name:
+                    continue
+                
+                # Store comprehensive stats (150+ fields available)
+                self.comprehensive_batter_stats[player_name] = stats
             
             print(f"   📊 Loaded comprehensive stats for {len(self.comprehensive_batter_stats)} batters")
             print(f"   📈 Each player has 50+ key metrics available for analysis")
@@ -4415,13 +5559,13 @@ class EnhancedWeakspotAnalyzer:
             print(f"   ⚠️ Could not load comprehensive batter stats: {e}")
     
     # PHASE 1 ENHANCEMENT: Methods to analyze new data sources
-    def analyze_handedness_matchup_advantage(self, batter_name, pitcher_name):
+    def analyze_handedness_matchup_advantage(self, batter_name, pitcher_context):
         """Analyze handedness-specific batted ball advantages"""
         normalized_batter = self.normalize_name(batter_name)
         
         # Get handedness for both players
         batter_hand = self.get_batter_handedness(batter_name)
-        pitcher_hand = self.get_pitcher_handedness(pitcher_name)
+        pitcher_hand = pitcher_context.hand
         
         matchup_key = f"{batter_hand}v{pitcher_hand}"
         
@@ -4446,7 +5590,7 @@ class EnhancedWeakspotAnalyzer:
                 air_rate = matchup_data.get('air_rate', 0)
                 
                 # Store profile for reference
-                handedness_analysis['batted_ball_profile'] = matchup_data
+                handedness_analysis['batted_ball_profile'] = matchup_data.to_dict()
                 handedness_analysis['confidence'] = 0.8
                 
                 # Analyze advantages
@@ -4476,10 +5620,10 @@ class EnhancedWeakspotAnalyzer:
         
         return handedness_analysis
     
-    def analyze_swing_path_optimization(self, batter_name, pitcher_name):
+    def analyze_swing_path_optimization(self, batter_name, pitcher_context):
         """Analyze swing path matchup optimization"""
         normalized_batter = self.normalize_name(batter_name)
-        pitcher_hand = self.get_pitcher_handedness(pitcher_name)
+        pitcher_hand = pitcher_context.hand
         
         # Determine swing context based on pitcher handedness
         swing_context = 'vs_LHP' if pitcher_hand == 'L' else 'vs_RHP'
@@ -4653,10 +5797,9 @@ class EnhancedWeakspotAnalyzer:
         
         return regression_analysis
     
-    def calculate_enhanced_data_quality_score(self, batter_name, pitcher_name):
+    def calculate_enhanced_data_quality_score(self, batter_name, pitcher_context):
         """Calculate comprehensive data quality score based on available data sources"""
         normalized_batter = self.normalize_name(batter_name)
-        normalized_pitcher = self.normalize_name(pitcher_name)
         
         quality_factors = {
             'base_data': 0,
@@ -4669,17 +5812,17 @@ class EnhancedWeakspotAnalyzer:
         # Base data availability (current system)
         if normalized_batter in self.hitter_exit_velocity:
             quality_factors['base_data'] += 20
-        if normalized_pitcher in self.pitcher_exit_velocity:
+        if pitcher_context.in_exit_velocity:
             quality_factors['base_data'] += 20
         if normalized_batter in self.custom_batters:
             quality_factors['base_data'] += 10
-        if normalized_pitcher in self.custom_pitchers:
+        if pitcher_context.in_custom_pitchers:
             quality_factors['base_data'] += 10
         
         # Handedness-specific data
         if normalized_batter in self.batted_ball_handedness:
             batter_hand = self.get_batter_handedness(batter_name)
-            pitcher_hand = self.get_pitcher_handedness(pitcher_name)
+            pitcher_hand = pitcher_context.hand
             matchup_key = f"{batter_hand}v{pitcher_hand}"
             
             if matchup_key in self.batted_ball_handedness[normalized_batter]:
@@ -4689,7 +5832,7 @@ class EnhancedWeakspotAnalyzer:
         
         # Swing path data
         if normalized_batter in self.swing_path_data:
-            pitcher_hand = self.get_pitcher_handedness(pitcher_name)
+            pitcher_hand = pitcher_context.hand
             swing_context = 'vs_LHP' if pitcher_hand == 'L' else 'vs_RHP'
             
             if swing_context in self.swing_path_data[normalized_batter]:
@@ -4698,12 +5841,7 @@ class EnhancedWeakspotAnalyzer:
                 quality_factors['swing_path_data'] = 10
         
         # Historical multi-year data
-        historical_years = 0
-        for year in [2025, 2024, 2023, 2022]:
-            if year in self.historical_data:
-                if ('pitcher_exit_velocity' in self.historical_data[year] and 
-                    normalized_pitcher in self.historical_data[year]['pitcher_exit_velocity']):
-                    historical_years += 1
+        historical_years = pitcher_context.historical_years
         
         if historical_years >= 3:
             quality_factors['historical_data'] = 15
@@ -4744,6 +5882,34 @@ def main():
     parser = argparse.ArgumentParser(description='Enhanced Weakspot Exploiters Analysis')
     parser.add_argument('--date', type=str, help='Target date (YYYY-MM-DD)', 
                         default=datetime.now().strftime('%Y-%m-%d'))
+    parser.add_argument('--full-load', action='store_true',
+                        help="Load every player's historical rows, not just today's participants")
+    parser.add_argument('--memory-report', action='store_true',
+                        help='Report player table memory (slotted records vs dicts)')
+    parser.add_argument('--scoring-model', type=str,
+                        help='JSON weight/threshold model merged over the defaults; scores and selects every matchup (see batch_scoring.py)')
+    parser.add_argument('--text-top-n', type=int,
+                        help='Build key weakness/justification text only for the top N exploiters (exploit factors stay on every row)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Analyze games in N forked worker processes (output matches a serial run)')
+    parser.add_argument('--load-threads', type=int, default=1,
+                        help='Load every data source up front on N threads (scheduled by dependency)')
+    parser.add_argument('--stats-snapshot', action='store_true',
+                        help='Attach to (or publish) the shared memory-mapped stats snapshot')
+    parser.add_argument('--warm-start', action='store_true',
+                        help='Restore loaded data from a snapshot of a previous run on the same inputs')
+    parser.add_argument('--lite-output', action='store_true',
+                        help='Also write the compact per-game layout (weakspot_exploiters/lite/<date>/)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Score games in first-pitch order, publishing each game (lite layout) as it finishes')
+    parser.add_argument('--incremental', action='store_true',
+                        help="Rescore only games whose lineups changed since this date's previous run")
+    parser.add_argument('--what-if', nargs=3, metavar=('GAME', 'SIDE', 'PITCHER'),
+                        help='Re-rank the opposing lineup if SIDE (home/away) starts PITCHER in GAME (gameId or AWAY@HOME)')
+    parser.add_argument('--explain', nargs=2, metavar=('PLAYER', 'PITCHER'),
+                        help="Print the text fields --text-top-n deferred for PLAYER vs PITCHER on --date")
+    parser.add_argument('--text-scope', choices=['overall', 'game'], default='overall',
+                        help='Rank the --text-top-n exploiters overall or per game')
     
     args = parser.parse_args()
     target_date = args.date
@@ -4752,9 +5918,41 @@ def main():
     print("📊 Using professional-grade data with situational intelligence")
     
     try:
-        analyzer = EnhancedWeakspotAnalyzer(target_date=target_date)
+        scoring_model = None
+        if args.scoring_model:
+            scoring_model = load_scoring_model(args.scoring_model)
+            print(f"⚖️ Scoring model: {args.scoring_model}")
+        
+        analyzer = EnhancedWeakspotAnalyzer(target_date=target_date, participants_only=not args.full_load,
+                                            scoring_model=scoring_model, text_top_n=args.text_top_n,
+                                            text_scope=args.text_scope, workers=args.workers,
+                                            load_threads=args.load_threads, stream=args.stream,
+                                            incremental=args.incremental)
+        snapshot = analyzer.attach_stats_snapshot() if args.stats_snapshot else None
+        if args.warm_start:
+            if not analyzer.restore_warm_start():
+                analyzer.load_all_data()
+                analyzer.save_warm_start()
+        elif args.load_threads > 1:
+            analyzer.load_all_data()
+        
+        if args.what_if:
+            analyzer.print_pitcher_swap(analyzer.pitcher_swap_whatif(*args.what_if))
+            return
+        if args.explain:
+            analyzer.print_explanation(analyzer.explain_exploiter(*args.explain))
+            return
         exploiters = analyzer.generate_enhanced_weakspot_exploiters(target_date)
         analyzer.save_enhanced_results(exploiters, target_date)
+        if args.lite_output or args.stream:
+            analyzer.save_lite_results(exploiters, target_date)
+        analyzer.save_feature_matrix(target_date)
+        analyzer.print_data_source_report()
+        analyzer.print_batch_scoring_report()
+        if args.memory_report:
+            analyzer.print_memory_report()
+        if args.stats_snapshot:
+            analyzer.publish_stats_snapshot(snapshot)
         
         print(f"🎉 Enhanced analysis complete: {len(exploiters)} high-grade weakspot exploiters generated")
         print("🔬 Analysis includes trends, park factors, and situational advantages")
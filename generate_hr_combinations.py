@@ -25,6 +25,17 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent / 'BaseballScraper'))
 from config import PATHS, DATA_PATH
 
+from player_registry import PlayerRegistry
+
+_player_registry = None
+
+def player_key(player):
+    """Canonical player key (registry player ID, falling back to name_team) so traded players stay one player"""
+    global _player_registry
+    if _player_registry is None:
+        _player_registry = PlayerRegistry.load(DATA_PATH)
+    return _player_registry.player_key(player['name'], player['team'])
+
 def find_data_files():
     """Find and classify JSON files by data richness"""
     print("🔍 Discovering game data files...")
@@ -212,13 +223,15 @@ def calculate_comprehensive_season_totals(daily_hr_data):
     
     player_season_stats = defaultdict(int)
     player_game_count = defaultdict(int)
+    player_labels = {}
     
     for date_str, hr_players in daily_hr_data.items():
         for player in hr_players:
-            player_key = f"{player['name']}_{player['team']}"
+            key = player_key(player)
             hrs_this_game = player.get('hrs_this_game', 1)
-            player_season_stats[player_key] += hrs_this_game
-            player_game_count[player_key] += 1
+            player_season_stats[key] += hrs_this_game
+            player_game_count[key] += 1
+            player_labels.setdefault(key, (player['name'], player['team']))
     
     print(f"✅ Calculated season totals for {len(player_season_stats)} unique players")
     print(f"📊 Players appeared in HR data across {len(daily_hr_data)} different dates")
@@ -226,9 +239,9 @@ def calculate_comprehensive_season_totals(daily_hr_data):
     # Show comprehensive HR leaders
     top_hr_leaders = sorted(player_season_stats.items(), key=lambda x: x[1], reverse=True)[:20]
     print(f"\n🏆 TOP 20 HR LEADERS (Full Season Analysis):")
-    for i, (player_key, total_hrs) in enumerate(top_hr_leaders):
-        name, team = player_key.split('_', 1)
-        games = player_game_count[player_key]
+    for i, (key, total_hrs) in enumerate(top_hr_leaders):
+        name, team = player_labels[key]
+        games = player_game_count[key]
         print(f"   {i+1:2d}. {name} ({team}): {total_hrs} HRs in {games} games")
     
     return player_season_stats
@@ -266,7 +279,7 @@ def find_unlimited_combinations_streaming(daily_hr_data, player_season_stats, gr
         # Get unique players (handle multi-HR games) - optimized
         unique_players = {}
         for player in hr_players:
-            key = f"{player['name']}_{player['team']}"
+            key = player_key(player)
             if key not in unique_players:
                 unique_players[key] = player
         
@@ -279,7 +292,7 @@ def find_unlimited_combinations_streaming(daily_hr_data, player_season_stats, gr
         combo_count = 0
         for combo in combinations(unique_list, group_size):
             # Create combination key
-            combo_key = "|".join(sorted([f"{p['name']}_{p['team']}" for p in combo]))
+            combo_key = "|".join(sorted([player_key(p) for p in combo]))
             
             # Store occurrence with minimal data
             real_combinations[combo_key].append({
@@ -325,8 +338,7 @@ def find_unlimited_combinations_streaming(daily_hr_data, player_season_stats, gr
         players = []
         
         for player in first_occurrence['players']:
-            player_key = f"{player['name']}_{player['team']}"
-            season_hrs = player_season_stats.get(player_key, 0)
+            season_hrs = player_season_stats.get(player_key(player), 0)
             
             enhanced_player = {
                 **player,
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Player Name Normalization and Indexed Name Resolution
+Shared by the weakspot, arsenal and HR combination scripts so every data
+source resolves "G. Henderson", "Henderson, Gunnar" and "Gunnar Henderson"
+the same way without linear fuzzy scans
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_NON_NAME_CHARS = re.compile(r'[^\w\s\.]')
+
+
+def normalize_name(name: str) -> str:
+    """Normalize player names for consistent matching"""
+    if not name:
+        return ""
+
+    # Handle "Last, First" format
+    if ',' in name:
+        parts = name.split(',')
+        if len(parts) == 2:
+            last, first = parts[0].strip(), parts[1].strip()
+            name = f"{first} {last}"
+
+    # Clean up the name
+    name = _NON_NAME_CHARS.sub('', name)
+    name = ' '.join(name.split())
+
+    return name.strip()
+
+
+def name_key_parts(name: str) -> Tuple[str, str, str]:
+    """Return (normalized lowercase name, first name without periods, last name)"""
+    normalized = normalize_name(name).lower()
+    parts = normalized.split()
+    if len(parts) < 2:
+        return normalized, '', ''
+    return normalized, parts[0].replace('.', ''), parts[-1]
+
+
+def names_match(search_name: str, target_name: str) -> bool:
+    """Enhanced name matching to handle G. Henderson vs Henderson, Gunnar"""
+    if not search_name or not target_name:
+        return False
+
+    search_norm, search_first, search_last = name_key_parts(search_name)
+    target_norm, target_first, target_last = name_key_parts(target_name)
+
+    # Direct match after normalization
+    if search_norm == target_norm:
+        return True
+
+    # Handle abbreviated names "G. Henderson" vs "gunnar henderson"
+    if search_last and target_last and search_last == target_last:
+        # First initial + last name match
+        if len(search_first) == 1 and target_first[:1] == search_first:
+            return True
+        # Target initial + search full first name match
+        if len(target_first) == 1 and search_first[:1] == target_first:
+            return True
+
+    return False
+
+
+class NameIndex:
+    """
+    Name resolution index built once at load time
+    Keyed by normalized full name, by (first initial, last name) and by last name.
+    Resolves to the first registered entry that names_match() would accept, and
+    caches both hits and misses so repeated lookups are O(1).
+    """
+
+    def __init__(self, entries: Optional[Iterable[Tuple[Iterable[str], Any]]] = None):
+        self._values: List[Any] = []
+        self._by_full: Dict[str, int] = {}
+        self._by_initial_last: Dict[Tuple[str, str], List[int]] = {}
+        self._by_last: Dict[str, List[Tuple[int, str]]] = {}
+        self._cache: Dict[str, Optional[int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        for names, value in entries or []:
+            self.add(names, value)
+
+    def add(self, names: Iterable[str], value: Any) -> None:
+        """Register a value under one or more name variants"""
+        position = len(self._values)
+        self._values.append(value)
+        self._cache.clear()
+
+        for name in names:
+            if not name:
+                continue
+            normalized, first, last = name_key_parts(name)
+            self._by_full.setdefault(normalized, position)
+            if last:
+                self._by_initial_last.setdefault((first[:1], last), []).append(position)
+                self._by_last.setdefault(last, []).append((position, first))
+
+    def _candidates(self, name: str) -> List[int]:
+        """Positions of every registered entry matching a name"""
+        normalized, first, last = name_key_parts(name)
+        candidates = []
+
+        if normalized in self._by_full:
+            candidates.append(self._by_full[normalized])
+
+        if last:
+            if len(first) == 1:
+                # "G. Henderson" matches any first name starting with G
+                candidates.extend(self._by_initial_last.get((first, last), ()))
+            elif first:
+                # "Gunnar Henderson" matches entries stored as "G. Henderson"
+                candidates.extend(position for position, stored_first in self._by_last.get(last, ())
+                                  if len(stored_first) == 1 and stored_first == first[0])
+
+        return candidates
+
+    def _resolve(self, name: str) -> Optional[int]:
+        """Find the earliest registered entry matching a name"""
+        candidates = self._candidates(name)
+        return min(candidates) if candidates else None
+
+    def lookup(self, name: str) -> Optional[Any]:
+        """Resolve a name variant to its registered value (None if unknown)"""
+        if not name:
+            return None
+
+        if name in self._cache:
+            self.hits += 1
+            position = self._cache[name]
+        else:
+            self.misses += 1
+            position = self._resolve(name)
+            self._cache[name] = position
+
+        return self._values[position] if position is not None else None
+
+    def lookup_all(self, name: str) -> List[Any]:
+        """Every registered value matching a name variant, in registration order"""
+        if not name:
+            return []
+        return [self._values[position] for position in sorted(set(self._candidates(name)))]
+
+    def __contains__(self, name: str) -> bool:
+        return self.lookup(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Canonical Player ID Registry
+Maps every name variant and team seen in rosters.json and the Statcast CSVs to one
+integer player ID, persisted between runs so all data sources join by ID instead of
+by name strings (and mid-season trades don't split a player in two)
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from player_names import NameIndex, normalize_name
+from stats_ingest import open_stats_csv
+
+REGISTRY_FILE = "player_registry.json"
+REGISTRY_VERSION = 1
+
+# Statcast CSVs carrying player_id + "last_name, first_name"
+CSV_SOURCES = [
+    "custom_batter_2025.csv",
+    "custom_pitcher_2025.csv",
+    "hitter_exit_velocity_2025.csv",
+    "pitcher_exit_velocity_2025.csv",
+    "pitcherpitcharsenalstats_2025.csv",
+]
+
+
+def parse_player_id(value: Any) -> Optional[int]:
+    """Convert a roster/CSV player ID to int (None if missing or malformed)"""
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+class PlayerRegistry:
+    """Canonical integer player IDs for every name variant and team"""
+
+    def __init__(self):
+        self.players: Dict[int, Dict] = {}           # id -> {name, fullName, teams, variants}
+        self.sources: Dict[str, List[float]] = {}    # source file -> [size, mtime] when ingested
+        self._ids_by_variant: Dict[str, List[int]] = {}
+        self._name_index: Optional[NameIndex] = None
+        self._resolve_cache: Dict[tuple, Optional[int]] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, data_path: Path, stats_path: Optional[Path] = None, save: bool = True) -> 'PlayerRegistry':
+        """Load the persisted registry and refresh it from any changed source files"""
+        data_path = Path(data_path)
+        stats_path = Path(stats_path) if stats_path else data_path / "stats"
+        registry_file = data_path / REGISTRY_FILE
+
+        registry = cls()
+        if registry_file.exists():
+            try:
+                with open(registry_file, 'r') as f:
+                    registry._load_payload(json.load(f))
+            except Exception as e:
+                print(f"   ⚠️ Error reading player registry, rebuilding: {e}")
+                registry = cls()
+
+        registry.refresh(data_path / "rosters.json", [stats_path / name for name in CSV_SOURCES])
+
+        if save and registry.dirty:
+            try:
+                registry.save(registry_file)
+            except Exception as e:
+                print(f"   ⚠️ Could not persist player registry: {e}")
+
+        return registry
+
+    def _load_payload(self, payload: Dict) -> None:
+        if payload.get('version') != REGISTRY_VERSION:
+            return
+        self.sources = payload.get('sources', {})
+        for player_id, entry in payload.get('players', {}).items():
+            player_id = int(player_id)
+            self.players[player_id] = entry
+            for variant in entry.get('variants', []):
+                self._index_variant(variant, player_id)
+
+    def _source_signature(self, file_path: Path) -> Optional[List[float]]:
+        try:
+            stat = file_path.stat()
+            return [stat.st_size, stat.st_mtime]
+        except OSError:
+            return None
+
+    def refresh(self, roster_file: Path, csv_files: Iterable[Path]) -> None:
+        """Re-ingest only the sources whose size or mtime changed since the last build"""
+        signature = self._source_signature(roster_file)
+        if signature and self.sources.get(str(roster_file)) != signature:
+            self.ingest_roster(roster_file)
+            self.sources[str(roster_file)] = signature
+            self.dirty = True
+
+        for csv_file in csv_files:
+            signature = self._source_signature(csv_file)
+            if signature and self.sources.get(str(csv_file)) != signature:
+                self.ingest_csv(csv_file)
+                self.sources[str(csv_file)] = signature
+                self.dirty = True
+
+    def ingest_roster(self, roster_file: Path) -> None:
+        """Register players from rosters.json (playerId, name, fullName, team)"""
+        try:
+            with open(roster_file, 'r') as f:
+                roster_data = json.load(f)
+
+            for player in roster_data:
+                self.register(player.get('playerId'), player.get('name', ''),
+                              team=player.get('team', ''), full_name=player.get('fullName', ''))
+        except Exception as e:
+            print(f"   ⚠️ Error ingesting roster into player registry: {e}")
+
+    def ingest_csv(self, csv_file: Path) -> None:
+        """Register players from a Statcast CSV (player_id, "last_name, first_name")"""
+        try:
+            with open_stats_csv(csv_file, consumer='player registry') as reader:
+                for row in reader:
+                    self.register(row.get('player_id'), row.get('last_name, first_name', ''),
+                                  team=row.get('team_name_alt', '') or row.get('team', ''))
+        except Exception as e:
+            print(f"   ⚠️ Error ingesting {csv_file.name} into player registry: {e}")
+
+    def _index_variant(self, variant: str, player_id: int) -> None:
+        ids = self._ids_by_variant.setdefault(variant, [])
+        if player_id not in ids:
+            ids.append(player_id)
+
+    def register(self, player_id: Any, name: str, team: str = '', full_name: str = '') -> Optional[int]:
+        """Add a name variant (and team) for a player ID"""
+        player_id = parse_player_id(player_id)
+        if player_id is None or not name:
+            return None
+
+        entry = self.players.get(player_id)
+        if entry is None:
+            entry = {'name': normalize_name(name), 'fullName': '', 'teams': [], 'variants': []}
+            self.players[player_id] = entry
+
+        if full_name and not entry['fullName']:
+            entry['fullName'] = normalize_name(full_name)
+        if team and team not in entry['teams']:
+            entry['teams'].append(team)
+
+        for variant_name in (name, full_name):
+            variant = normalize_name(variant_name).lower()
+            if variant and variant not in entry['variants']:
+                entry['variants'].append(variant)
+                self._index_variant(variant, player_id)
+                self._name_index = None
+                self._resolve_cache.clear()
+
+        return player_id
+
+    def _pick(self, ids: List[int], team: str) -> Optional[int]:
+        """Choose among candidate IDs by team (None when the team doesn't single one out)"""
+        if len(ids) == 1:
+            return ids[0]
+        if team:
+            for player_id in ids:
+                if team in self.players[player_id]['teams']:
+                    return player_id
+        return None  # Ambiguous name: guessing would merge two different players
+
+    def resolve(self, name: str, team: str = '') -> Optional[int]:
+        """Resolve any name variant (optionally disambiguated by team) to a player ID"""
+        if not name:
+            return None
+
+        cache_key = (name, team)
+        if cache_key in self._resolve_cache:
+            return self._resolve_cache[cache_key]
+
+        variant = normalize_name(name).lower()
+        player_id = self._pick(self._ids_by_variant.get(variant, []), team)
+
+        if player_id is None:
+            # Abbreviated/expanded first names ("G. Henderson" vs "Gunnar Henderson")
+            if self._name_index is None:
+                self._name_index = NameIndex(([variant_key], variant_key) for variant_key in self._ids_by_variant)
+            candidate_ids = []
+            for variant_key in self._name_index.lookup_all(name):
+                candidate_ids.extend(pid for pid in self._ids_by_variant[variant_key] if pid not in candidate_ids)
+            player_id = self._pick(candidate_ids, team)
+
+        self._resolve_cache[cache_key] = player_id
+        return player_id
+
+    def player_key(self, name: str, team: str = '') -> str:
+        """Stable join key: the player ID when known, otherwise name_team"""
+        player_id = self.resolve(name, team)
+        return str(player_id) if player_id is not None else f"{name}_{team}"
+
+    def save(self, registry_file: Path) -> None:
+        """Persist the registry (written to a temp file, then swapped in)"""
+        payload = {
+            'version': REGISTRY_VERSION,
+            'sources': self.sources,
+            'players': {str(player_id): entry for player_id, entry in self.players.items()}
+        }
+        temp_file = Path(f"{registry_file}.tmp")
+        with open(temp_file, 'w') as f:
+            json.dump(payload, f)
+        os.replace(temp_file, registry_file)
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+
+class PlayerTable(dict):
+    """
+    Player data table joined by canonical player ID
+    Records stay addressable by their source name key (iteration order and existing
+    lookups are unchanged), and any other name variant resolves through the registry
+    to the record stored for that player ID.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.by_id: Dict[int, Any] = {}
+        self.registry: Optional[PlayerRegistry] = None
+
+    def index_ids(self, registry: PlayerRegistry, id_fields=('player_id', 'playerId')) -> int:
+        """Key every record by player ID (from its own ID field, else by resolving its name)"""
+        self.registry = registry
+        self.by_id = {}
+        for name_key, record in dict.items(self):
+            player_id = None
+            if hasattr(record, 'get'):  # Plain dicts and StatRecords
+                for field in id_fields:
+                    player_id = parse_player_id(record.get(field))
+                    if player_id is not None:
+                        break
+            if player_id is None:
+                player_id = registry.resolve(name_key)
+            if player_id is not None and player_id not in self.by_id:
+                self.by_id[player_id] = name_key
+        return len(self.by_id)
+
+    def _id_key(self, name):
+        if self.registry is None or not isinstance(name, str):
+            return None
+        player_id = self.registry.resolve(name)
+        return self.by_id.get(player_id) if player_id is not None else None
+
+    def get_by_id(self, player_id: int, default=None):
+        name_key = self.by_id.get(player_id)
+        return dict.__getitem__(self, name_key) if name_key is not None else default
+
+    def __contains__(self, name) -> bool:
+        return dict.__contains__(self, name) or self._id_key(name) is not None
+
+    def __getitem__(self, name):
+        if dict.__contains__(self, name):
+            return dict.__getitem__(self, name)
+        name_key = self._id_key(name)
+        if name_key is None:
+            raise KeyError(name)
+        return dict.__getitem__(self, name_key)
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+
+class ParticipantSet:
+    """
+    Players taking part in one slate (starting pitchers and lineup-team hitters)
+    Loaders use it to drop everybody else's rows at ingestion time. A row matches by
+    player ID, normalized name or an abbreviated/expanded name variant, so the filter
+    only ever keeps extra rows, never loses a participant's.
+    """
+
+    def __init__(self, registry: Optional[PlayerRegistry] = None):
+        self.registry = registry
+        self.names: set = set()
+        self.ids: set = set()
+        self._name_index = NameIndex()
+
+    def add(self, name: str, player_id: Any = None, team: str = '') -> None:
+        """Add a participant by name (and player ID when known)"""
+        normalized = normalize_name(name)
+        if not normalized:
+            return
+
+        player_id = parse_player_id(player_id)
+        if player_id is None and self.registry is not None:
+            player_id = self.registry.resolve(normalized, team)
+        if player_id is not None:
+            self.ids.add(player_id)
+
+        if normalized not in self.names:
+            self.names.add(normalized)
+            self._name_index.add([normalized], normalized)
+
+    def matches(self, name: str, player_id: Any = None) -> bool:
+        """True if a row (name, optional player ID) belongs to a participant"""
+        player_id = parse_player_id(player_id)
+        if player_id is not None and player_id in self.ids:
+            return True
+
+        normalized = normalize_name(name)
+        return normalized in self.names or self._name_index.lookup(normalized) is not None
+
+    def __len__(self) -> int:
+        return len(self.names)
@@ -0,0 +1,810 @@
+#!/usr/bin/env python3
+"""
+Columnar Ingest Layer for Statcast CSVs
+Converts each stats CSV once into a typed columnar cache (int64/float64 columns in a
+single memory-mappable .bin file plus a JSON header) and rebuilds it only when the
+source file's size or mtime changes. CsvSchema maps loader fields onto those columns
+with per-column converters and defaults, and reports schema drift. A stats snapshot
+publishes every loaded table into one memory-mapped file set that other processes
+attach to read-only, so the raw column data is held once per host. Loaders stream
+values straight out of the mapping; the player records they build stay per process.
+"""
+import csv
+import hashlib
+import json
+import keyword
+import math
+import mmap
+import os
+import sys
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np  # Optional: zero-copy column views for vectorized consumers
+except ImportError:
+    np = None
+
+INT, FLOAT, TEXT = 'int', 'float', 'str'
+
+CACHE_DIR_NAME = ".columnar_cache"
+CACHE_VERSION = 2
+INT_MISSING = -2 ** 63          # Sentinel for empty cells in int64 columns
+VALUE_BYTES = 8                 # Every numeric column is stored as 8-byte values
+
+SNAPSHOT_MANIFEST = "stats_snapshot.json"
+SNAPSHOT_VERSION = 2
+
+
+
+def _is_int_text(value: str) -> bool:
+    try:
+        number = int(value)
+    except ValueError:
+        return False
+    return str(number) == value and INT_MISSING < number < 2 ** 63
+
+
+def _is_float_text(value: str) -> bool:
+    try:
+        number = float(value)
+    except ValueError:
+        return False
+    return math.isfinite(number)
+
+
+def _format_float(number: float, text_format: str = '') -> str:
+    """Text for a cached float: the column's fixed-decimal format, else "31" / shortest repr"""
+    if text_format:
+        return format(number, text_format)
+    return str(int(number)) if number.is_integer() else repr(number)
+
+
+def _float_text_format(present: List[str]) -> Optional[str]:
+    """
+    Format that renders every value of a float column back to its exact source text
+    ('.3f' for fixed-decimal columns like "0.250", '' for shortest repr), or None when
+    no single format does (e.g. "1e3" or mixed padding) and the column must stay text.
+    """
+    sample = present[0]
+    if 'e' not in sample.lower():
+        decimals = len(sample) - sample.index('.') - 1 if '.' in sample else 0
+        text_format = f'.{decimals}f'
+        if all(format(float(v), text_format) == v for v in present):
+            return text_format
+    if all(_format_float(float(v)) == v for v in present):
+        return ''
+    return None
+
+
+class ColumnarTable:
+    """Typed column store for one CSV (int64/float64 arrays or string lists per column)"""
+
+    def __init__(self, source: Path, fieldnames: List[str], kinds: List[str],
+                 columns: List[Union[array, memoryview, List[str]]], n_rows: int,
+                 text_formats: Optional[List[str]] = None):
+        self.source = source
+        self.fieldnames = fieldnames
+        self.kinds = kinds
+        self.columns = columns
+        self.text_formats = text_formats or [''] * len(fieldnames)  # Float columns' source text format
+        self.n_rows = n_rows
+        self.signature = None
+        self.consumers: List[str] = []   # Loaders that have read this table (catalog report)
+        self._positions = {name: i for i, name in enumerate(fieldnames)}
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def has_column(self, name: str) -> bool:
+        return name in self._positions
+
+    def column(self, name: str):
+        """Raw typed column (int64/float64 buffer or list of strings)"""
+        return self.columns[self._positions[name]]
+
+    def column_kind(self, name: str) -> str:
+        return self.kinds[self._positions[name]]
+
+    def converted(self, name: str, kind: str, default, rows: Optional[Sequence[int]] = None) -> Iterator:
+        """
+        Column values converted to a loader's field type, streamed row by row
+        Nothing is kept: loaders build their records straight from the typed column,
+        so no per-column list outlives the load. `rows` limits it to those row indexes.
+        """
+        index = self._positions[name]
+        values = self.columns[index]
+        if rows is not None:
+            values = [values[row] for row in rows]
+        return convert_column(values, self.kinds[index], kind, default, self.text_formats[index])
+
+    def numpy_column(self, name: str):
+        """Zero-copy NumPy view of a numeric column (requires numpy)"""
+        if np is None:
+            raise ImportError("numpy is required for numpy_column()")
+        index = self._positions[name]
+        kind = self.kinds[index]
+        if kind == TEXT:
+            return np.asarray(self.columns[index], dtype=object)
+        return np.frombuffer(self.columns[index], dtype=np.int64 if kind == INT else np.float64)
+
+    def text_columns(self) -> List[Iterator[str]]:
+        """Every column rendered back to CSV text (missing cells become '')"""
+        return [self.converted(name, TEXT, '') for name in self.fieldnames]
+
+    def iter_rows(self) -> Iterator[Dict[str, str]]:
+        """Yield csv.DictReader-style rows (string values) from the typed columns"""
+        fieldnames = self.fieldnames
+        for values in zip(*self.text_columns()):
+            yield dict(zip(fieldnames, values))
+
+
+class MappedTextColumn:
+    """Read-only text column over a shared mapping (UTF-8 blob plus int64 end offsets)"""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        return bytes(self._blob[self._offsets[index]:self._offsets[index + 1]]).decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        blob, offsets = self._blob, self._offsets
+        for i in range(len(offsets) - 1):
+            yield bytes(blob[offsets[i]:offsets[i + 1]]).decode('utf-8')
+
+
+class RowReader:
+    """Iterable stand-in for csv.DictReader backed by a ColumnarTable"""
+
+    def __init__(self, table: ColumnarTable):
+        self.table = table
+        self.fieldnames = list(table.fieldnames)
+        self._rows = table.iter_rows()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Dict[str, str]:
+        return next(self._rows)
+
+
+def _cache_paths(csv_path: Path, cache_dir: Optional[Path]):
+    cache_dir = Path(cache_dir) if cache_dir else csv_path.parent / CACHE_DIR_NAME
+    return cache_dir, cache_dir / f"{csv_path.name}.meta.json", cache_dir / f"{csv_path.name}.bin"
+
+
+def _source_signature(csv_path: Path) -> List[float]:
+    stat = csv_path.stat()
+    return [stat.st_size, stat.st_mtime]
+
+
+def _parse_csv(csv_path: Path):
+    """Parse a CSV into typed columns, inferring int/float/str per column"""
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        raw_rows = [row for row in reader if row]  # DictReader skips blank lines
+
+    width = len(fieldnames)
+    raw_columns = [[row[i] if i < len(row) else '' for row in raw_rows] for i in range(width)]
+
+    # A column is typed only if its values render back to the exact source text,
+    # so zero-padded IDs ("00123") and codes stay text for DictReader-style reads
+    kinds, columns, text_formats = [], [], []
+    for values in raw_columns:
+        present = [v for v in values if v != '']
+        is_int = bool(present) and all(_is_int_text(v) for v in present)
+        text_format = None
+        if present and not is_int and all(_is_float_text(v) for v in present):
+            text_format = _float_text_format(present)
+        if is_int:
+            kinds.append(INT)
+            columns.append(array('q', (int(v) if v != '' else INT_MISSING for v in values)))
+        elif text_format is not None:
+            kinds.append(FLOAT)
+            columns.append(array('d', (float(v) if v != '' else math.nan for v in values)))
+        else:
+            kinds.append(TEXT)
+            columns.append(values)
+        text_formats.append(text_format or '')
+
+    return fieldnames, kinds, columns, text_formats, len(raw_rows)
+
+
+def _write_cache(meta_file: Path, bin_file: Path, signature, fieldnames, kinds, columns, text_formats,
+                 n_rows) -> None:
+    meta_file.parent.mkdir(parents=True, exist_ok=True)
+
+    column_meta = []
+    slot = 0
+    tmp_bin = Path(f"{bin_file}.tmp")
+    with open(tmp_bin, 'wb') as f:
+        for name, kind, values, text_format in zip(fieldnames, kinds, columns, text_formats):
+            if kind == TEXT:
+                column_meta.append({'name': name, 'kind': kind, 'values': values})
+            else:
+                values.tofile(f)
+                column_meta.append({'name': name, 'kind': kind, 'slot': slot, 'format': text_format})
+                slot += 1
+
+    meta = {
+        'version': CACHE_VERSION,
+        'source_signature': signature,
+        'n_rows': n_rows,
+        'columns': column_meta
+    }
+    tmp_meta = Path(f"{meta_file}.tmp")
+    with open(tmp_meta, 'w') as f:
+        json.dump(meta, f)
+
+    os.replace(tmp_bin, bin_file)
+    os.replace(tmp_meta, meta_file)
+
+
+def _read_cache(csv_path: Path, meta_file: Path, bin_file: Path, signature) -> Optional[ColumnarTable]:
+    """Map a cached table if it exists and matches the source signature"""
+    if not meta_file.exists() or not bin_file.exists():
+        return None
+
+    with open(meta_file, 'r') as f:
+        meta = json.load(f)
+    if meta.get('version') != CACHE_VERSION or meta.get('source_signature') != signature:
+        return None
+
+    n_rows = meta['n_rows']
+    buffer = None
+    if n_rows and any(c['kind'] != TEXT for c in meta['columns']):
+        with open(bin_file, 'rb') as f:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    fieldnames, kinds, columns, text_formats = [], [], [], []
+    column_bytes = n_rows * VALUE_BYTES
+    for column in meta['columns']:
+        fieldnames.append(column['name'])
+        kinds.append(column['kind'])
+        text_formats.append(column.get('format', ''))
+        if column['kind'] == TEXT:
+            columns.append(column['values'])
+        elif buffer is None:
+            columns.append(array('q' if column['kind'] == INT else 'd'))
+        else:
+            start = column['slot'] * column_bytes
+            columns.append(buffer[start:start + column_bytes].cast('q' if column['kind'] == INT else 'd'))
+
+    return ColumnarTable(csv_path, fieldnames, kinds, columns, n_rows, text_formats)
+
+
+def _snapshot_stamp(tables: Dict[str, Dict[str, Any]]) -> str:
+    """Version stamp: hash of every table's source path and signature"""
+    key = json.dumps(sorted((path, table['source_signature']) for path, table in tables.items()))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def stats_snapshot_dir(stats_dir: Union[str, Path]) -> Path:
+    """Where the snapshot for a stats directory is published"""
+    return Path(stats_dir) / CACHE_DIR_NAME
+
+
+def publish_snapshot(tables: Iterable[ColumnarTable], snapshot_dir: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Write tables into one memory-mappable data file plus a manifest (swapped in atomically)
+    Numeric columns are stored as-is; text columns as a UTF-8 blob with end offsets, so
+    attaching processes share the column bytes through the page cache instead of parsing
+    private copies (records built from them are still each process's own).
+    """
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    manifest_file = snapshot_dir / SNAPSHOT_MANIFEST
+
+    tables_meta: Dict[str, Dict[str, Any]] = {}
+    tmp_data = snapshot_dir / f"stats_snapshot.{os.getpid()}.bin.tmp"
+    with open(tmp_data, 'wb') as f:
+        for table in tables:
+            column_meta = []
+            for name, kind, values, text_format in zip(table.fieldnames, table.kinds, table.columns,
+                                                       table.text_formats):
+                if kind == TEXT:
+                    encoded = [str(value).encode('utf-8') for value in values]
+                    offsets = array('q', [0])
+                    for value in encoded:
+                        offsets.append(offsets[-1] + len(value))
+                    column_meta.append({'name': name, 'kind': kind, 'offsets_at': f.tell()})
+                    offsets.tofile(f)
+                    column_meta[-1]['blob_at'] = f.tell()
+                    f.write(b''.join(encoded))
+                    f.write(b'\0' * (-f.tell() % VALUE_BYTES))  # Keep numeric columns 8-byte aligned
+                else:
+                    column_meta.append({'name': name, 'kind': kind, 'at': f.tell(), 'format': text_format})
+                    f.write(values if isinstance(values, memoryview) else values.tobytes())
+            tables_meta[str(table.source)] = {
+                'source_signature': table.signature or _source_signature(table.source),
+                'n_rows': table.n_rows,
+                'columns': column_meta
+            }
+
+    stamp = _snapshot_stamp(tables_meta)
+    data_file = snapshot_dir / f"stats_snapshot_{stamp}.bin"
+    os.replace(tmp_data, data_file)
+
+    previous = None
+    if manifest_file.exists():
+        try:
+            with open(manifest_file, 'r') as f:
+                previous = json.load(f).get('data_file')
+        except Exception:
+            previous = None
+
+    manifest = {
+        'version': SNAPSHOT_VERSION,
+        'stamp': stamp,
+        'created': time.time(),
+        'data_file': data_file.name,
+        'tables': tables_meta
+    }
+    tmp_manifest = snapshot_dir / f"{SNAPSHOT_MANIFEST}.{os.getpid()}.tmp"
+    with open(tmp_manifest, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_manifest, manifest_file)
+
+    # Processes still attached to the old data file keep their mapping after the unlink
+    if previous and previous != data_file.name:
+        try:
+            (snapshot_dir / previous).unlink()
+        except OSError:
+            pass
+    return manifest
+
+
+class StatsSnapshot:
+    """Read-only attachment to a published stats snapshot"""
+
+    def __init__(self, snapshot_dir: Path, manifest: Dict[str, Any], buffer: Optional[memoryview]):
+        self.snapshot_dir = snapshot_dir
+        self.stamp = manifest['stamp']
+        self.created = manifest.get('created', 0)
+        self.table_meta = manifest['tables']
+        self._buffer = buffer
+
+    @classmethod
+    def attach(cls, snapshot_dir: Union[str, Path]) -> Optional['StatsSnapshot']:
+        """Map the published snapshot read-only (None if there is none or it is unreadable)"""
+        snapshot_dir = Path(snapshot_dir)
+        if not (snapshot_dir / SNAPSHOT_MANIFEST).exists():
+            return None
+        try:
+            with open(snapshot_dir / SNAPSHOT_MANIFEST, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != SNAPSHOT_VERSION:
+                return None
+            buffer = None
+            with open(snapshot_dir / manifest['data_file'], 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return cls(snapshot_dir, manifest, buffer)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"   ⚠️ Could not attach stats snapshot in {snapshot_dir}: {e}")
+            return None
+
+    def stale_sources(self) -> List[str]:
+        """Source files changed (or removed) since the snapshot was published"""
+        stale = []
+        for path, meta in self.table_meta.items():
+            try:
+                if _source_signature(Path(path)) != meta['source_signature']:
+                    stale.append(path)
+            except OSError:
+                stale.append(path)
+        return stale
+
+    def is_stale(self) -> bool:
+        return bool(self.stale_sources())
+
+    def table(self, path: str) -> ColumnarTable:
+        """ColumnarTable whose columns are views over the shared mapping"""
+        meta = self.table_meta[path]
+        n_rows = meta['n_rows']
+        fieldnames, kinds, columns, text_formats = [], [], [], []
+        for column in meta['columns']:
+            fieldnames.append(column['name'])
+            kinds.append(column['kind'])
+            text_formats.append(column.get('format', ''))
+            if column['kind'] == TEXT:
+                offsets_end = column['offsets_at'] + (n_rows + 1) * VALUE_BYTES
+                offsets = self._buffer[column['offsets_at']:offsets_end].cast('q')
+                blob = self._buffer[column['blob_at']:column['blob_at'] + offsets[-1]]
+                columns.append(MappedTextColumn(offsets, blob))
+            elif not n_rows:
+                columns.append(array('q' if column['kind'] == INT else 'd'))
+            else:
+                start = column['at']
+                columns.append(self._buffer[start:start + n_rows * VALUE_BYTES]
+                               .cast('q' if column['kind'] == INT else 'd'))
+
+        table = ColumnarTable(Path(path), fieldnames, kinds, columns, n_rows, text_formats)
+        table.signature = meta['source_signature']
+        return table
+
+
+class DataCatalog:
+    """
+    Single owner of every stats table in a run
+    Each physical file is parsed (or mapped from cache) once, and every consumer gets
+    views over that one table instead of re-reading the CSV. Safe to share between
+    loader threads: concurrent requests for one file wait for a single parse.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir
+        self._tables: Dict[str, ColumnarTable] = {}
+        self._file_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def table(self, csv_path: Union[str, Path], consumer: Optional[str] = None) -> ColumnarTable:
+        """Load a CSV through the columnar cache, rebuilding it when the source changed"""
+        csv_path = Path(csv_path)
+        signature = _source_signature(csv_path)
+        with self._lock:
+            self.requests += 1
+            file_lock = self._file_locks.setdefault(str(csv_path), threading.Lock())
+
+        with file_lock:
+            table = self._tables.get(str(csv_path))
+            if table is None or table.signature != signature:
+                table = self._load(csv_path, signature)
+                self._tables[str(csv_path)] = table
+
+            if consumer and consumer not in table.consumers:
+                table.consumers.append(consumer)
+        return table
+
+    def _load(self, csv_path: Path, signature) -> ColumnarTable:
+        cache_dir, meta_file, bin_file = _cache_paths(csv_path, self.cache_dir)
+
+        try:
+            table = _read_cache(csv_path, meta_file, bin_file, signature)
+        except Exception as e:
+            print(f"   ⚠️ Ignoring unreadable columnar cache for {csv_path.name}: {e}")
+            table = None
+
+        if table is None:
+            fieldnames, kinds, columns, text_formats, n_rows = _parse_csv(csv_path)
+            try:
+                _write_cache(meta_file, bin_file, signature, fieldnames, kinds, columns, text_formats, n_rows)
+            except OSError as e:
+                print(f"   ⚠️ Could not write columnar cache for {csv_path.name}: {e}")
+            table = ColumnarTable(csv_path, fieldnames, kinds, columns, n_rows, text_formats)
+
+        table.signature = signature
+        return table
+
+    def attach_snapshot(self, snapshot_dir: Union[str, Path]) -> Optional[StatsSnapshot]:
+        """Serve tables from a published snapshot; tables whose source changed load as usual"""
+        snapshot = StatsSnapshot.attach(snapshot_dir)
+        if snapshot is None:
+            return None
+        stale = set(snapshot.stale_sources())
+        with self._lock:
+            for path in snapshot.table_meta:
+                if path not in stale and path not in self._tables:
+                    self._tables[path] = snapshot.table(path)
+        return snapshot
+
+    def publish_snapshot(self, snapshot_dir: Union[str, Path]) -> Dict[str, Any]:
+        """Publish every table loaded so far for other processes to attach to"""
+        with self._lock:
+            tables = list(self._tables.values())
+        return publish_snapshot(tables, snapshot_dir)
+
+    def report(self) -> Dict[str, List[str]]:
+        """Consumers per loaded file (files read by more than one loader were still parsed once)"""
+        return {table.source.name: list(table.consumers) for table in self._tables.values()}
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+
+# Process-wide catalog shared by every script that imports this module
+STATS_CATALOG = DataCatalog()
+
+
+def load_columnar(csv_path: Union[str, Path], consumer: Optional[str] = None) -> ColumnarTable:
+    """Table for a CSV from the shared catalog"""
+    return STATS_CATALOG.table(csv_path, consumer)
+
+
+@contextmanager
+def open_stats_csv(csv_path: Union[str, Path], consumer: str = 'raw rows'):
+    """Drop-in for `open(...)` + `csv.DictReader(f)` served from the shared catalog"""
+    yield RowReader(load_columnar(csv_path, consumer))
+
+
+def _text_to_int(text: str, default):
+    text = text.strip()
+    if not text:
+        return default
+    try:
+        return int(float(text))  # Handle strings like "1.0"
+    except (ValueError, OverflowError):
+        return default
+
+
+def _text_to_float(text: str, default):
+    text = text.strip()
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+def convert_column(values, source_kind: str, kind: str, default, text_format: str = '') -> Iterator:
+    """Lazily convert one cached column to the loader's field type, filling defaults for empty cells"""
+    if kind == INT:
+        if source_kind == INT:
+            return (default if v == INT_MISSING else v for v in values)
+        if source_kind == FLOAT:
+            return (default if v != v else int(v) for v in values)
+        return (_text_to_int(v, default) for v in values)
+
+    if kind == FLOAT:
+        if source_kind == INT:
+            return (default if v == INT_MISSING else float(v) for v in values)
+        if source_kind == FLOAT:
+            return (default if v != v else v for v in values)
+        return (_text_to_float(v, default) for v in values)
+
+    # TEXT: present-but-empty cells stay '' (like row.get on a DictReader row)
+    if source_kind == INT:
+        return ('' if v == INT_MISSING else str(v) for v in values)
+    if source_kind == FLOAT:
+        return ('' if v != v else _format_float(v, text_format) for v in values)
+    return iter(values)
+
+
+class StatRecord:
+    """
+    Compact player stat record: one __slots__ attribute per field instead of a dict per row
+    Supports the mapping reads the scoring code uses (record['x'], record.get('x', 0),
+    'x' in record, keys/items) so player tables can hold records in place of dicts.
+    Concrete types come from record_type(); fields that were never set read as missing.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _slot_of: Dict[str, str] = {}
+
+    def __init__(self, *values, **named):
+        for slot, value in zip(self.__slots__, values):
+            setattr(self, slot, value)
+        for key, value in named.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        slot = self._slot_of.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        slot = self._slot_of.get(key)
+        if slot is None:
+            raise KeyError(f"{key!r} is not a field of this record")
+        setattr(self, slot, value)
+
+    def get(self, key, default=None):
+        slot = self._slot_of.get(key)
+        return default if slot is None else getattr(self, slot, default)
+
+    def __contains__(self, key) -> bool:
+        slot = self._slot_of.get(key)
+        return slot is not None and hasattr(self, slot)
+
+    def keys(self) -> List[str]:
+        return [key for key, slot in zip(self._fields, self.__slots__) if hasattr(self, slot)]
+
+    def values(self) -> List[Any]:
+        return [self[key] for key in self.keys()]
+
+    def items(self) -> List[tuple]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (StatRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __reduce__(self):
+        return _rebuild_record, (self._fields, self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"StatRecord({self.to_dict()!r})"
+
+
+_RECORD_TYPES: Dict[Tuple[str, ...], type] = {}
+
+
+def record_type(fields: Sequence[str]) -> type:
+    """Slotted StatRecord class for a field list (created once per distinct layout)"""
+    fields = tuple(fields)
+    cls = _RECORD_TYPES.get(fields)
+    if cls is None:
+        # CSV headers like "last_name, first_name" aren't identifiers, so those get positional slots
+        slots = tuple(field if field.isidentifier() and not keyword.iskeyword(field) and not field.startswith('_')
+                      else f"_f{i}" for i, field in enumerate(fields))
+        cls = type('StatRecord', (StatRecord,), {
+            '__slots__': slots,
+            '_fields': fields,
+            '_slot_of': dict(zip(fields, slots)),
+        })
+        _RECORD_TYPES[fields] = cls
+    return cls
+
+
+def _rebuild_record(fields: Tuple[str, ...], data: Dict[str, Any]) -> StatRecord:
+    """Unpickle helper: record types are rebuilt from their field list"""
+    return record_type(fields)(**data)
+
+
+def table_records(table: ColumnarTable, exclude: Iterable[str] = (),
+                  rows: Optional[Sequence[int]] = None) -> Iterator[StatRecord]:
+    """Records for every row of a table (or just `rows`), keyed by CSV header with inferred column types"""
+    exclude = set(exclude)
+    fieldnames = [name for name in table.fieldnames if name not in exclude]
+    make = record_type(fieldnames)
+    columns = []
+    for name in fieldnames:
+        kind = table.column_kind(name)
+        if kind != TEXT or rows is not None:
+            columns.append(table.converted(name, kind, None, rows))
+        else:
+            columns.append(table.column(name))
+    for values in zip(*columns):
+        yield make(*values)
+
+
+def deep_sizeof(obj, seen: Optional[set] = None) -> int:
+    """Approximate resident bytes of a container tree (shared objects counted once)"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif isinstance(obj, StatRecord):
+        size += sum(deep_sizeof(value, seen) for value in obj.values())
+    return size
+
+
+def holds_records(obj) -> bool:
+    """True if a container tree stores StatRecords (checked along its first entries)"""
+    while isinstance(obj, dict) and obj:
+        obj = next(iter(obj.values()))
+    return isinstance(obj, StatRecord)
+
+
+def as_dicts(obj):
+    """Copy of a container tree with every StatRecord as a plain dict (memory report baseline)"""
+    if isinstance(obj, StatRecord):
+        return {key: as_dicts(value) for key, value in obj.items()}
+    if isinstance(obj, dict):
+        return {key: as_dicts(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [as_dicts(item) for item in obj]
+    return obj
+
+
+class CsvSchema:
+    """
+    Typed field mapping for one CSV layout: (output key, source column, kind[, default])
+    Header names are resolved to columns once per table and every field is converted
+    column-at-a-time, so loaders get typed records without per-row parsing.
+    """
+
+    DEFAULTS = {INT: 0, FLOAT: 0.0, TEXT: ''}
+
+    def __init__(self, name: str, fields: List[tuple], required: Iterable[str] = ()):
+        self.name = name
+        self.fields = [(field[0], field[1], field[2], field[3] if len(field) > 3 else self.DEFAULTS[field[2]])
+                       for field in fields]
+        self.required = list(required)
+        self._reported = set()
+
+    def check(self, table: ColumnarTable) -> Dict[str, List[str]]:
+        """Report expected columns that are missing or no longer numeric (once per file version)"""
+        missing = [column for _, column, _, _ in self.fields if not table.has_column(column)]
+        retyped = sorted({column for _, column, kind, _ in self.fields
+                          if kind != TEXT and table.has_column(column) and table.column_kind(column) == TEXT})
+        drift = {'missing': missing, 'non_numeric': retyped}
+
+        report_key = (str(table.source), tuple(table.signature or ()))
+        if (missing or retyped) and report_key not in self._reported:
+            self._reported.add(report_key)
+            details = []
+            if missing:
+                details.append(f"missing columns {', '.join(missing)}")
+            if retyped:
+                details.append(f"non-numeric values in {', '.join(retyped)}")
+            print(f"   ⚠️ Schema drift in {table.source.name} ({self.name}): {'; '.join(details)}")
+
+        for column in self.required:
+            if not table.has_column(column):
+                raise KeyError(column)
+
+        return drift
+
+    def columns(self, table: ColumnarTable) -> Dict[str, Iterator]:
+        """Typed table: output key -> converted column (streamed, consumed once)"""
+        self.check(table)
+        if self.name not in table.consumers:
+            table.consumers.append(self.name)
+        typed = {}
+        for key, column, kind, default in self.fields:
+            if table.has_column(column):
+                typed[key] = table.converted(column, kind, default)
+            else:
+                typed[key] = repeat(default, len(table))
+        return typed
+
+    def rows(self, table: ColumnarTable) -> Iterator[Dict[str, Any]]:
+        """Typed record dicts (field order follows the schema)"""
+        typed = self.columns(table)
+        keys = list(typed)
+        for values in zip(*typed.values()):
+            yield dict(zip(keys, values))
+
+    def records(self, table: ColumnarTable, split: Sequence[str] = (), extra: Sequence[str] = (),
+                leading: Sequence[str] = ()) -> Iterator[tuple]:
+        """
+        Typed slotted records: yields (*split values, record) per row
+        `split` fields (names, join keys) are handed back separately instead of stored;
+        `extra` / `leading` add empty slots after / before the schema fields for the
+        loader to fill in (e.g. data_quality, year).
+        """
+        typed = self.columns(table)
+        stored = [key for key in typed if key not in split]
+        fields = list(leading) + stored + [key for key in extra if key not in stored]
+        make = record_type(fields)
+        columns = [typed[key] for key in split] + [typed[key] for key in stored]
+        n_split = len(split)
+        if not leading:
+            for values in zip(*columns):
+                yield (*values[:n_split], make(*values[n_split:]))
+            return
+
+        stored_slots = [make._slot_of[key] for key in stored]
+        for values in zip(*columns):
+            record = make()
+            for slot, value in zip(stored_slots, values[n_split:]):
+                setattr(record, slot, value)
+            yield (*values[:n_split], record)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the two-stage exploit scoring (scalar analysis vs batch_scoring)
+Run with: python -m pytest test_batch_scoring.py
+"""
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from batch_scoring import DEFAULT_MODEL, feature_matrix, load_scoring_model, score_exploit_batch
+from generate_enhanced_weakspot_exploiters import EnhancedWeakspotAnalyzer, LazySource
+
+VENUES = [f"Test Park {i}" for i in range(6)]
+
+
+def synthetic_analyzer(rng, batters):
+    """Analyzer whose data sources are all loaded, holding only synthetic rows for `batters`"""
+    analyzer = EnhancedWeakspotAnalyzer(target_date='2025-07-15')
+    for name, attribute in vars(EnhancedWeakspotAnalyzer).items():
+        if isinstance(attribute, LazySource):
+            setattr(analyzer, name, attribute.factory())
+            analyzer.ready_sources.add(name)
+
+    for venue in VENUES:
+        venue = analyzer.normalize_venue_name(venue)
+        analyzer.park_factors[venue] = {'hr_factor': rng.uniform(0.8, 1.2), 'category': 'test'}
+        analyzer.weather_context[venue] = {'weather_factor': rng.uniform(0.85, 1.15), 'temperature': 70,
+                                           'wind_speed': 5, 'wind_direction': 'out'}
+
+    for name in batters:
+        analyzer.custom_batters[name] = {
+            'barrel_percent': rng.uniform(0, 18), 'bb_percent': rng.uniform(3, 18), 'k_percent': rng.uniform(10, 35),
+            'sprint_speed': rng.uniform(22, 31), 'xba_diff': rng.uniform(-0.06, 0.04),
+            'xslg_diff': rng.uniform(-0.1, 0.06), 'sweet_spot_percent': rng.uniform(24, 41),
+            'whiff_percent': rng.uniform(14, 33), 'z_swing_percent': rng.uniform(30, 80),
+            'oz_swing_percent': rng.uniform(17, 32)
+        }
+        analyzer.rosters[name] = {'batter_hand': rng.choice('LR')}
+        if rng.random() < 0.8:
+            analyzer.hitter_exit_velocity[name] = {'real_barrel_rate': rng.uniform(2, 14),
+                                                   'max_hit_speed': rng.uniform(103, 118)}
+        if rng.random() < 0.6:
+            analyzer.batter_trends[name] = {'trend': rng.choice(['hot', 'cold', 'stable']),
+                                            'recent_avg': rng.uniform(0.15, 0.4)}
+        if rng.random() < 0.6:
+            analyzer.recent_form_data[name] = {'hot_streak': rng.random() < 0.3, 'last_7_avg': rng.uniform(0.15, 0.4),
+                                               'last_7_hr': rng.randint(0, 5),
+                                               'trend_direction': rng.choice(['improving', 'declining', 'stable']),
+                                               'cold_streak': rng.random() < 0.2}
+        if rng.random() < 0.6:
+            analyzer.lineup_data[name] = {'position': rng.randint(1, 9), 'rbi_opportunities': rng.uniform(0.9, 1.25),
+                                          'run_scoring_opportunities': rng.uniform(0.9, 1.25),
+                                          'protection_quality': rng.uniform(0.1, 0.9),
+                                          'lineup_context': rng.choice([[], ['heart_of_order']])}
+    return analyzer
+
+
+def synthetic_pitcher(rng):
+    return {
+        'vulnerabilityScore': rng.uniform(20, 80),
+        'pitcher_stats': {'era': rng.uniform(2.5, 6.0), 'whip': rng.uniform(1.0, 1.6),
+                          'hrPerGame': rng.uniform(0.6, 1.7)},
+        'situational_factors': {'pitch_hand': rng.choice('LR'),
+                                'barrel_vulnerability': rng.choice(['extreme', 'high', None])},
+        'trend_analysis': {'trend': rng.choice(['deteriorating', 'stable'])}
+    }
+
+
+def scalar_matchups(seed=7, lineups=12):
+    """Scalar-path exploit analyses for synthetic hitters against synthetic starters"""
+    rng = random.Random(seed)
+    batters = [f"Test Batter{i}" for i in range(9)]
+    analyzer = synthetic_analyzer(rng, batters)
+    analyses = []
+    for lineup in range(lineups):
+        pitcher = f"Test Pitcher{lineup}"
+        pitcher_analysis = synthetic_pitcher(rng)
+        venue = rng.choice(VENUES)
+        for batter in batters:
+            analyses.append(analyzer.analyze_enhanced_batter_exploit_potential(
+                batter, pitcher, pitcher_analysis, venue, 'AAA', rng.choice(['AAA', 'BBB'])))
+    return analyzer, analyses
+
+
+def test_batch_scores_match_scalar_path():
+    _, analyses = scalar_matchups()
+    scalar = np.array([analysis['exploit_score'] for analysis in analyses])
+    batch = score_exploit_batch(feature_matrix(analysis['matchup_record']['features'] for analysis in analyses))
+
+    assert len(set(np.round(scalar, 1))) > len(analyses) // 2  # The synthetic rows reach many tiers
+    np.testing.assert_allclose(batch, scalar, rtol=0, atol=1e-6)
+
+
+def test_custom_model_scores_are_written_scores():
+    analyzer, analyses = scalar_matchups(seed=11, lineups=3)
+    model = load_scoring_model()
+    model['baseline_score'] = 40.0
+    model['bonuses']['platoon'] = 30
+    analyzer.scoring_model = model
+
+    analyzer.apply_scoring_model(analyses)
+    expected = score_exploit_batch(feature_matrix(analysis['matchup_record']['features'] for analysis in analyses),
+                                   model)
+    for analysis, score in zip(analyses, expected):
+        assert analysis['exploit_score'] == analysis['matchup_record']['score'] == pytest.approx(score)
+        combined_score, _, _ = analyzer.apply_selection_thresholds(analysis, {'vulnerabilityScore': 50})
+        assert combined_score == pytest.approx(score * analysis['confidence'])
+
+
+def test_default_model_keeps_scalar_scores():
+    analyzer, analyses = scalar_matchups(seed=3, lineups=1)
+    scores = [analysis['exploit_score'] for analysis in analyses]
+
+    assert analyzer.scoring_model is DEFAULT_MODEL
+    analyzer.apply_scoring_model(analyses)
+    assert [analysis['exploit_score'] for analysis in analyses] == scores
+
+
+if __name__ == '__main__':
+    test_batch_scores_match_scalar_path()
+    test_custom_model_scores_are_written_scores()
+    test_default_model_keeps_scalar_scores()
+    print('✅ Batch scoring parity tests passed')
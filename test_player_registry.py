@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Tests for PlayerTable ID indexing
+Run with: python -m pytest test_player_registry.py
+"""
+from player_registry import PlayerRegistry, PlayerTable
+from stats_ingest import record_type
+
+
+def make_registry():
+    registry = PlayerRegistry()
+    registry.register(123, 'Gunnar Henderson', team='BAL')
+    return registry
+
+
+def test_index_ids_reads_statrecord_ids():
+    record = record_type(['player_id', 'home_run'])(123, 31)
+    table = PlayerTable({'Unlisted Name': record})  # Name the registry doesn't know
+
+    assert table.index_ids(make_registry()) == 1
+    assert table.get_by_id(123) is record
+    assert table['Gunnar Henderson'] is record
+
+
+def test_index_ids_matches_dict_records():
+    records = {'Unlisted Name': {'player_id': '123', 'home_run': 31}}
+    dict_table = PlayerTable(records)
+    record_table = PlayerTable({name: record_type(list(row))(*row.values()) for name, row in records.items()})
+
+    assert dict_table.index_ids(make_registry()) == record_table.index_ids(make_registry()) == 1
+
+
+if __name__ == '__main__':
+    test_index_ids_reads_statrecord_ids()
+    test_index_ids_matches_dict_records()
+    print('✅ PlayerTable ID indexing tests passed')